@@ -27,6 +27,7 @@ from modules.sensors import SensorManager
 from modules.lidar import LidarManager
 from modules.camera import CameraManager
 from modules.navigation import NavigationManager
+from modules.utils import TimerService
 from modules.db import DBManager
 from ui.main_window import MainWindow
 from ui.project_dialog import ProjectDialog
@@ -303,7 +304,8 @@ class MainApp:
             navigation_config = {
                 'navigation': {
                     'default_speed': config['navigation'].get('default_speed', 150),
-                    'obstacle_threshold': config['navigation'].get('obstacle_threshold', 500)
+                    'obstacle_threshold': config['navigation'].get('obstacle_threshold', 500),
+                    'max_command_rate': config['navigation'].get('max_command_rate', 20)
                 }
             }
             self.navigation_manager = NavigationManager(navigation_config)
@@ -492,6 +494,13 @@ class MainApp:
         if hasattr(self, 'sensor_manager'):
             self.sensor_manager.cleanup()
 
+        # Netejar recursos del gestor de navegació
+        if hasattr(self, 'navigation_manager'):
+            self.navigation_manager.cleanup()
+
+        # Aturar els timers compartits
+        TimerService.instance().shutdown()
+
         logger.info("Neteja completada. Sortint de l'aplicació.")
 
 
@@ -10,6 +10,8 @@ import logging
 import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
 
+from modules.utils import LRUCache
+
 # Importació condicional de TensorFlow
 try:
     import tensorflow as tf
@@ -21,6 +23,9 @@ except ImportError:
 # Configuració del logger
 logger = logging.getLogger("AI")
 
+# Nombre de models que es mantenen carregats en memòria
+MODEL_CACHE_SIZE = 4
+
 class AIManager(QObject):
     """
     Gestor de les funcionalitats d'IA.
@@ -52,33 +57,84 @@ class AIManager(QObject):
         self.model_path = ai_config.get('model_path', '')
         
         # Estats
+        self.model = None
         self.model_loaded = False
         self.is_processing = False
+
+        # Models carregats per ruta (el més recent al final)
+        self._model_cache = LRUCache(MODEL_CACHE_SIZE)
         
         # Carregar model si és possible
         self._load_model()
         
         logger.info("AIManager inicialitzat")
     
-    def _load_model(self):
-        """Carrega el model d'IA si TensorFlow està disponible."""
+    def _load_model(self, model_path=None):
+        """
+        Carrega el model d'IA si TensorFlow està disponible.
+
+        Args:
+            model_path (str, optional): Ruta del model. Per defecte, model_path actual.
+
+        Returns:
+            bool: True si el model ha quedat actiu, False en cas contrari
+        """
+        if model_path is None:
+            model_path = self.model_path
+
         if not self.has_tensorflow or not self.enabled:
             logger.warning("No es pot carregar el model: TensorFlow no disponible o IA desactivada")
             return False
             
         try:
             # Implementació real per carregar el model
-            # self.model = tf.saved_model.load(self.model_path)
+            # model = tf.saved_model.load(model_path)
             
-            # Per simplicitat, simulem que s'ha carregat
-            self.model_loaded = True
-            logger.info(f"Model carregat des de {self.model_path}")
+            # Per simplicitat, simulem que s'ha carregat (sense objecte de model)
+            model = None
+            self._activate_model(model, model_path)
+            logger.info(f"Model carregat des de {model_path}")
             return True
             
         except Exception as e:
             logger.error(f"Error carregant model d'IA: {e}")
             return False
     
+    def set_model(self, model_path):
+        """
+        Canvia el model actiu. Els últims MODEL_CACHE_SIZE models carregats es
+        mantenen en memòria, de manera que tornar a un d'ells no el recarrega.
+
+        Args:
+            model_path (str): Ruta del model
+
+        Returns:
+            bool: True si el model ha quedat actiu, False en cas contrari
+        """
+        model = self._model_cache.get(model_path)
+        if model is not None:
+            self.model = model
+            self.model_path = model_path
+            self.model_loaded = True
+            logger.info(f"Model reutilitzat de la memòria cau: {model_path}")
+            return True
+
+        return self._load_model(model_path)
+
+    def _activate_model(self, model, model_path):
+        """
+        Deixa actiu un model ja carregat i el desa a la memòria cau.
+
+        Args:
+            model: Model carregat (None si la càrrega és simulada)
+            model_path (str): Ruta d'on s'ha carregat
+        """
+        self.model = model
+        self.model_path = model_path
+        self.model_loaded = True
+        if model is not None:
+            self._model_cache.put(model_path, model)
+
     def process_image(self, image):
         """
         Processa una imatge amb el model d'IA.
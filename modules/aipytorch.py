@@ -9,6 +9,8 @@ import logging
 import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
 
+from modules.utils import LRUCache
+
 # Importació condicional de PyTorch
 try:
     import torch
@@ -22,6 +24,9 @@ except ImportError:
 # Configuració del logger
 logger = logging.getLogger("AI")
 
+# Nombre de models que es mantenen carregats en memòria
+MODEL_CACHE_SIZE = 4
+
 class DummyModel(nn.Module):
     """
     Model de demostració (a substituir per un model real entrenat).
@@ -53,32 +58,80 @@ class AIManager(QObject):
         self.enabled = ai_config.get('enabled', True)
         self.model_path = ai_config.get('model_path', '')
 
+        self.model = None
         self.model_loaded = False
         self.is_processing = False
+        self._model_cache = LRUCache(MODEL_CACHE_SIZE)
 
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self._load_model()
         
         logger.info("AIManager inicialitzat (PyTorch)")
     
-    def _load_model(self):
-        """Carrega el model PyTorch (de moment, un dummy)."""
+    def _load_model(self, model_path=None):
+        """
+        Carrega el model PyTorch (de moment, un dummy).
+
+        Args:
+            model_path (str, optional): Ruta del model. Per defecte, model_path actual.
+
+        Returns:
+            bool: True si el model ha quedat actiu, False en cas contrari
+        """
+        if model_path is None:
+            model_path = self.model_path
+
         if not self.has_torch or not self.enabled:
             logger.warning("No es pot carregar el model: PyTorch no disponible o IA desactivada")
             return False
         
         try:
             # Aquí pots carregar el teu model real, per exemple:
-            # self.model = torch.load(self.model_path)
-            self.model = DummyModel().to(self.device)
-            self.model.eval()
-            self.model_loaded = True
+            # model = torch.load(model_path)
+            model = DummyModel().to(self.device)
+            model.eval()
+            self._activate_model(model, model_path)
             logger.info("Model PyTorch carregat")
             return True
         except Exception as e:
             logger.error(f"Error carregant model PyTorch: {e}")
             return False
 
+    def set_model(self, model_path):
+        """
+        Canvia el model actiu. Els últims MODEL_CACHE_SIZE models carregats es
+        mantenen en memòria, de manera que tornar a un d'ells no el recarrega.
+
+        Args:
+            model_path (str): Ruta del model
+
+        Returns:
+            bool: True si el model ha quedat actiu, False en cas contrari
+        """
+        model = self._model_cache.get(model_path)
+        if model is not None:
+            self.model = model
+            self.model_path = model_path
+            self.model_loaded = True
+            logger.info(f"Model reutilitzat de la memòria cau: {model_path}")
+            return True
+
+        return self._load_model(model_path)
+
+    def _activate_model(self, model, model_path):
+        """
+        Deixa actiu un model ja carregat i el desa a la memòria cau.
+
+        Args:
+            model: Model carregat (None si la càrrega és simulada)
+            model_path (str): Ruta d'on s'ha carregat
+        """
+        self.model = model
+        self.model_path = model_path
+        self.model_loaded = True
+        if model is not None:
+            self._model_cache.put(model_path, model)
+
     def process_image(self, image):
         """
         Processa una imatge amb el model PyTorch.
@@ -58,6 +58,7 @@ class CameraManager(QObject):
         self.streaming = False
         self.last_frame_time = 0
         self.current_frame = None
+        self._frame_rgb = None  # Buffer sobre el qual es construeix current_frame
         self.frame_count = 0
         self.fps_real = 0
         
@@ -141,19 +142,20 @@ class CameraManager(QObject):
             # Convertir de BGR a RGB (OpenCV utilitza BGR per defecte)
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
             
-            # Convertir a QImage
+            # Convertir a QImage sobre el mateix buffer (sense còpia)
             h, w, ch = frame_rgb.shape
-            bytes_per_line = ch * w
-            qt_image = QImage(frame_rgb.data, w, h, bytes_per_line, QImage.Format_RGB888)
+            qt_image = QImage(frame_rgb.data, w, h, frame_rgb.strides[0], QImage.Format_RGB888)
             
-            # Desar trama actual
+            # Desar trama actual; la QImage no és propietària del buffer,
+            # per això cal mantenir viu l'array mentre la trama és l'actual
+            self._frame_rgb = frame_rgb
             self.current_frame = qt_image
             
             # Emetre senyal amb la imatge processada
             self.camera_frame_ready.emit(qt_image)
             
             # Debug
-            logger.debug(f"Trama {self.frame_count} processada ({w}x{h})")
+            logger.debug("Trama %d processada (%dx%d)", self.frame_count, w, h)
             
         except Exception as e:
             logger.error(f"Error processant trama de càmera: {e}")
@@ -429,7 +431,7 @@ class CameraManager(QObject):
         # Calcular FPS
         self.fps_real = old_count
         
-        logger.debug(f"FPS reals: {self.fps_real}")
+        logger.debug("FPS reals: %s", self.fps_real)
     
     def cleanup(self):
         """Neteja recursos abans de tancar."""
@@ -439,6 +441,7 @@ class CameraManager(QObject):
         
         # Alliberar recursos
         self.current_frame = None
+        self._frame_rgb = None
         self.previous_frame = None
         
         logger.info("CameraManager netejat")
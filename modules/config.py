@@ -143,7 +143,8 @@ class ConfigManager(QObject):
             'navigation': {
                 'default_speed': 150,
                 'auto_stop_timeout': 30,  # segons
-                'obstacle_threshold': 500  # mm
+                'obstacle_threshold': 500,  # mm
+                'max_command_rate': 20  # comandes/segon
             },
             
             # Configuració d'interfície
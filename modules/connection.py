@@ -157,7 +157,7 @@ class ConnectionManager(QObject):
             # Convertir comanda a JSON i afegir-la a la cua
             command_json = json.dumps(command)
             self.send_queue.put(command_json)
-            logger.debug(f"Comanda posada a la cua: {command_json}")
+            logger.debug("Comanda posada a la cua: %s", command_json)
             return True
         except Exception as e:
             logger.error(f"Error preparant comanda: {e}")
@@ -274,11 +274,11 @@ class ConnectionManager(QObject):
                     elif data.get('type') == 'error':
                         logger.warning(f"Error rebut del bridge: {data.get('message')}")
                     
-                    logger.debug(f"Dades processades: {data}")
+                    logger.debug("Dades processades: %s", data)
                     
                 except json.JSONDecodeError:
                     # No és JSON, tractar com a text pla
-                    logger.debug(f"Text rebut (no és JSON): {line}")
+                    logger.debug("Text rebut (no és JSON): %s", line)
                 
                 # Marcar com a processada
                 self.receive_queue.task_done()
@@ -302,7 +302,7 @@ class ConnectionManager(QObject):
                 # Enviar dades
                 if self.connected and self.socket:
                     self.socket.sendall((data + "\n").encode('utf-8'))
-                    logger.debug(f"Dades enviades: {data}")
+                    logger.debug("Dades enviades: %s", data)
                 
                 # Marcar com a enviada
                 self.send_queue.task_done()
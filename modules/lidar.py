@@ -6,15 +6,137 @@ Gestiona les dades del LiDAR, processa les lectures,
 crea mapes de l'entorn i detecta obstacles.
 """
 
+import base64
+import binascii
 import numpy as np
 import time
 import logging
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
-from scipy.interpolate import griddata
+import threading
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot, QTimer
+from scipy.spatial import cKDTree
+
+from modules.utils import LRUCache
 
 # Configuració de logging
 logger = logging.getLogger("LiDAR")
 
+# Importació opcional de Numba per accelerar la cerca de direccions
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    logger.info("Numba no instal·lat. S'utilitzarà la versió NumPy de la cerca de direccions.")
+
+# Format binari d'una mesura: angle en graus (float32) i distància en mm (uint16)
+LIDAR_DTYPE = np.dtype([('ang', '<f4'), ('d', '<u2')])
+
+
+def sector_min(angles, distances, max_range, num_sectors):
+    """
+    Calcula la distància mínima de cada sector angular en una sola passada.
+    
+    Els sectors cobreixen [-π, π) amb amplada 2π/num_sectors; els punts fora
+    d'aquest interval s'ignoren.
+    
+    Args:
+        angles (np.ndarray): Angles en radians
+        distances (np.ndarray): Distàncies en mm
+        max_range (float): Valor per als sectors sense punts
+        num_sectors (int): Nombre de sectors
+        
+    Returns:
+        np.ndarray: Distància mínima per sector
+    """
+    out = np.full(num_sectors, max_range, dtype=np.float32)
+    
+    # Índex del sector de cada punt
+    buckets = np.floor(
+        (angles + np.pi) * (num_sectors / (2 * np.pi))).astype(np.intp)
+    valid = (buckets >= 0) & (buckets < num_sectors)
+    
+    np.minimum.at(out, buckets[valid], distances[valid])
+    return out
+
+
+if HAS_NUMBA:
+    # Sense fastmath: np.inf marca els cons buits i fastmath (ninf) suposa
+    # que no hi ha infinits
+    @njit(parallel=True, cache=True)
+    def _cone_min_numba(angles, distances, directions, half_cone):
+        out = np.empty(directions.size, dtype=np.float64)
+        for k in prange(directions.size):
+            lo = directions[k] - half_cone
+            hi = directions[k] + half_cone
+            min_distance = np.inf
+            for j in range(angles.size):
+                if lo <= angles[j] <= hi and distances[j] < min_distance:
+                    min_distance = distances[j]
+            out[k] = min_distance
+        return out
+
+
+def cone_min_distances(angles, distances, directions, half_cone):
+    """
+    Calcula la distància mínima dins d'un con al voltant de cada direcció.
+    
+    Utilitza Numba (una direcció per fil) si està disponible i NumPy si no.
+    
+    Args:
+        angles (np.ndarray): Angles en radians
+        distances (np.ndarray): Distàncies en mm
+        directions (np.ndarray): Direccions candidates en radians
+        half_cone (float): Mitja obertura del con en radians
+        
+    Returns:
+        np.ndarray: Distància mínima per direcció (inf si el con és buit)
+    """
+    directions = np.asarray(directions, dtype=np.float64)
+    
+    if HAS_NUMBA:
+        return _cone_min_numba(angles, distances, directions, half_cone)
+    
+    return _cone_min_numpy(angles, distances, directions, half_cone)
+
+
+def _cone_min_numpy(angles, distances, directions, half_cone):
+    """Versió NumPy de cone_min_distances (mateixos arguments i resultat)."""
+    lo = (directions - half_cone)[:, None]
+    hi = (directions + half_cone)[:, None]
+    inside = (angles >= lo) & (angles <= hi)
+    return np.where(inside, distances, np.inf).min(axis=1)
+
+
+class LidarScan:
+    """
+    Còpia immutable d'un escaneig, per als receptors de lidar_data_updated.
+    
+    Només guarda referències: LidarData.update crea arrays nous a cada
+    escaneig en lloc de reescriure'ls, així que un LidarScan no canvia encara
+    que el buffer d'on surt es torni a omplir. Els arrays són de només lectura.
+    """
+    
+    __slots__ = ('scan_id', 'timestamp', 'max_range', 'angles', 'distances')
+    
+    def __init__(self, scan_id, timestamp, max_range, angles, distances):
+        angles.setflags(write=False)
+        distances.setflags(write=False)
+        self.scan_id = scan_id
+        self.timestamp = timestamp
+        self.max_range = max_range
+        self.angles = angles
+        self.distances = distances
+    
+    def snapshot(self):
+        """
+        Retorna les dades de l'escaneig amb la mateixa forma que LidarData.snapshot.
+        
+        Returns:
+            tuple: (angles, distàncies)
+        """
+        return self.angles, self.distances
+
+
 class LidarData:
     """Classe per emmagatzemar i processar dades del LiDAR."""
     
@@ -29,124 +151,220 @@ class LidarData:
         self.max_points = max_points
         self.max_range = max_range
         
-        # Dades raw
-        self.angles = []  # Llista d'angles en radians
-        self.distances = []  # Llista de distàncies en mm
+        # Dades raw (float32: precisió sobrada per a la resolució del sensor)
+        self.angles = np.empty(0, dtype=np.float32)  # Angles en radians
+        self.distances = np.empty(0, dtype=np.float32)  # Distàncies en mm
         
         # Dades processades
-        self.cartesian_points = []  # Llista de tuples (x, y)
+        self.cartesian_points = np.empty((0, 2), dtype=np.float32)  # Punts (x, y)
         self.obstacle_map = None  # Mapa d'obstacles
+        self._kdtree = None  # Índex espacial dels punts cartesians (mandrós)
+        
+        # Graella d'ocupació del mapa d'obstacles (vista d'ocell, 0 = lliure, 255 = ocupat)
+        self._grid_size = 100  # cel·les en cada dimensió
+        self._bounds = (-max_range, max_range, -max_range, max_range)
+        self._cell_scale = (self._grid_size - 1) / (2 * max_range)  # cel·les per mm
+        self._occupancy = np.zeros((self._grid_size, self._grid_size), dtype=np.uint8)
+        self._grid_xy = None  # Malla (X, Y), només si algú la demana
+        
+        # Protegeix l'intercanvi de dades entre update i els lectors d'altres fils
+        self._lock = threading.Lock()
         
         # Metadades
         self.timestamp = None
         self.scan_id = 0
     
-    def update(self, scan_data):
+    def update(self, scan_data=None, scan_bytes=None, scan_id=None, rebuild_map=True):
         """
         Actualitza les dades amb una nova lectura.
         
         Args:
-            scan_data (list): Llista de tuples (angle, distància)
+            scan_data (list): Llista de tuples (angle, distància). Format
+                antic, mantingut per compatibilitat.
+            scan_bytes (bytes): Mesures empaquetades segons LIDAR_DTYPE
+            scan_id (int, optional): Identificador del nou escaneig. Per
+                defecte, l'anterior més u.
+            rebuild_map (bool, optional): Regenerar el mapa d'obstacles.
+                Defaults to True.
             
         Returns:
             bool: True si s'ha actualitzat correctament, False en cas contrari
         """
+        # Comprova si hi ha dades
+        if scan_bytes is not None:
+            num_points = len(scan_bytes) // LIDAR_DTYPE.itemsize
+        else:
+            num_points = len(scan_data) if scan_data else 0
+        
+        if num_points < 10:
+            logger.warning("Poques dades LiDAR rebudes, ignorant scan")
+            return False
+        
+        # Processar dades (angles en graus a radians)
         try:
-            # Comprova si hi ha dades
-            if not scan_data or len(scan_data) < 10:
-                logger.warning("Poques dades LiDAR rebudes, ignorant scan")
-                return False
-            
-            # Actualitzar timestamp i ID
+            if scan_bytes is not None:
+                scan = np.frombuffer(scan_bytes, dtype=LIDAR_DTYPE)
+                angles = np.radians(scan['ang'])
+                distances = scan['d'].astype(np.float32)
+            else:
+                scan = np.asarray(scan_data, dtype=np.float32)
+                if scan.ndim != 2 or scan.shape[1] != 2:
+                    raise ValueError(f"forma inesperada {scan.shape}")
+                angles = np.radians(scan[:, 0])
+                distances = scan[:, 1]
+        except (ValueError, TypeError) as e:
+            logger.error(f"Dades LiDAR mal formades: {e}")
+            return False
+        
+        # Filtrar mesures invàlides o massa llunyanes
+        valid = (distances > 0) & (distances <= self.max_range)
+        angles = angles[valid]
+        distances = distances[valid]
+        
+        # Limitar el nombre de punts si és necessari
+        if angles.size > self.max_points:
+            # Seleccionar punts aleatoris
+            indices = np.random.choice(
+                angles.size, self.max_points, replace=False)
+            angles = angles[indices]
+            distances = distances[indices]
+        
+        # Convertir a coordenades cartesianes (x endavant, y esquerra)
+        cartesian_points = np.column_stack(
+            (distances * np.cos(angles), distances * np.sin(angles)))
+        
+        # Publicar les noves dades de cop perquè cap lector vegi un scan a mitges
+        with self._lock:
+            self.angles = angles
+            self.distances = distances
+            self.cartesian_points = cartesian_points
+            self._kdtree = None  # Es construeix quan es necessita
             self.timestamp = time.time()
-            self.scan_id += 1
-            
-            # Reiniciar llistes
-            self.angles = []
-            self.distances = []
-            self.cartesian_points = []
-            
-            # Processar dades
-            for angle, distance in scan_data:
-                # Convertir angle a radians
-                angle_rad = np.radians(angle)
-                
-                # Filtrar mesures invàlides o massa llunyanes
-                if distance <= 0 or distance > self.max_range:
-                    continue
-                
-                # Afegir a les llistes
-                self.angles.append(angle_rad)
-                self.distances.append(distance)
-                
-                # Convertir a coordenades cartesianes (x endavant, y esquerra)
-                x = distance * np.cos(angle_rad)
-                y = distance * np.sin(angle_rad)
-                self.cartesian_points.append((x, y))
-            
-            # Limitar el nombre de punts si és necessari
-            if len(self.angles) > self.max_points:
-                # Seleccionar punts aleatoris
-                indices = np.random.choice(
-                    len(self.angles), self.max_points, replace=False)
-                
-                self.angles = [self.angles[i] for i in indices]
-                self.distances = [self.distances[i] for i in indices]
-                self.cartesian_points = [self.cartesian_points[i] for i in indices]
-            
-            # Recalcular mapa d'obstacles
+            self.scan_id = self.scan_id + 1 if scan_id is None else scan_id
+        
+        # Recalcular mapa d'obstacles
+        if rebuild_map:
             self._update_obstacle_map()
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error actualitzant dades LiDAR: {e}")
-            return False
+        
+        return True
     
     def _update_obstacle_map(self):
-        """Actualitza el mapa d'obstacles basat en les dades actuals."""
-        try:
-            if not self.cartesian_points:
-                return
-            
-            # Convertir punts a arrays numpy
-            points = np.array(self.cartesian_points)
-            
-            # Crear una malla regular per a la interpolació
-            grid_size = 100  # punts en cada dimensió
-            min_x, max_x = -self.max_range, self.max_range
-            min_y, max_y = -self.max_range, self.max_range
-            
-            x_grid = np.linspace(min_x, max_x, grid_size)
-            y_grid = np.linspace(min_y, max_y, grid_size)
-            X, Y = np.meshgrid(x_grid, y_grid)
-            
-            # Calcular distàncies des de l'origen a cada punt
-            distances = np.sqrt(points[:, 0]**2 + points[:, 1]**2)
-            
-            # Interpolar les distàncies en la malla regular
-            try:
-                # Intentar interpolació cúbica primer
-                Z = griddata(points, distances, (X, Y), method='cubic')
-            except:
-                try:
-                    # Si falla, intentar interpolació lineal
-                    Z = griddata(points, distances, (X, Y), method='linear')
-                except:
-                    # Si tot falla, utilitzar el mètode més simple
-                    Z = griddata(points, distances, (X, Y), method='nearest')
+        """
+        Actualitza el mapa d'obstacles basat en les dades actuals.
+        
+        Marca com a ocupades les cel·les de la graella que contenen algun punt
+        i reutilitza la graella preassignada a __init__.
+        """
+        if len(self.cartesian_points) == 0:
+            return
+        
+        # Cel·la de cada punt (fila = y, columna = x)
+        x_min, _, y_min, _ = self._bounds
+        points = self.cartesian_points
+        ix = np.rint((points[:, 0] - x_min) * self._cell_scale).astype(np.intp)
+        iy = np.rint((points[:, 1] - y_min) * self._cell_scale).astype(np.intp)
+        np.clip(ix, 0, self._grid_size - 1, out=ix)
+        np.clip(iy, 0, self._grid_size - 1, out=iy)
+        
+        # Rasteritzar els punts a la graella
+        self._occupancy.fill(0)
+        self._occupancy[iy, ix] = 255
+        
+        # Crear mapa d'obstacles
+        self.obstacle_map = {
+            'grid': self._occupancy,
+            'bounds': self._bounds
+        }
+    
+    def get_grid_coordinates(self):
+        """
+        Obté les coordenades dels centres de les cel·les del mapa d'obstacles.
+        
+        La malla es crea el primer cop que es demana.
+        
+        Returns:
+            tuple: (X, Y) arrays en mm amb la forma de la graella
+        """
+        if self._grid_xy is None:
+            x_min, x_max, y_min, y_max = self._bounds
+            x_grid = np.linspace(x_min, x_max, self._grid_size, dtype=np.float32)
+            y_grid = np.linspace(y_min, y_max, self._grid_size, dtype=np.float32)
+            self._grid_xy = np.meshgrid(x_grid, y_grid)
+        
+        return self._grid_xy
+    
+    def _build_spatial_index(self, points):
+        """
+        Construeix el KD-tree sobre els punts cartesians d'un escaneig.
+        
+        Args:
+            points (np.ndarray): Punts (x, y) en mm
             
-            # Crear mapa d'obstacles
-            self.obstacle_map = {
-                'X': X,
-                'Y': Y,
-                'Z': Z,
-                'resolution': (grid_size, grid_size),
-                'bounds': (min_x, max_x, min_y, max_y)
-            }
+        Returns:
+            cKDTree: Índex espacial o None si no hi ha punts
+        """
+        if len(points) == 0:
+            return None
+        
+        return cKDTree(points)
+    
+    def snapshot(self):
+        """
+        Obté una vista coherent de l'últim escaneig per a lectors d'altres fils.
+        
+        Returns:
+            tuple: (angles, distàncies)
+        """
+        with self._lock:
+            return self.angles, self.distances
+    
+    def freeze(self):
+        """
+        Obté una còpia immutable de l'últim escaneig.
+        
+        Returns:
+            LidarScan: Escaneig que no canvia amb les actualitzacions següents
+        """
+        with self._lock:
+            return LidarScan(self.scan_id, self.timestamp, self.max_range,
+                             self.angles, self.distances)
+    
+    def snapshot_with_id(self):
+        """
+        Com snapshot, però amb l'identificador de l'escaneig llegit alhora.
+        
+        Returns:
+            tuple: (scan_id, angles, distàncies)
+        """
+        with self._lock:
+            return self.scan_id, self.angles, self.distances
+    
+    def get_obstacles_near(self, x, y, radius):
+        """
+        Obté els punts de l'escaneig dins d'un radi al voltant d'una posició.
+        
+        Args:
+            x (float): Coordenada x en mm (endavant)
+            y (float): Coordenada y en mm (esquerra)
+            radius (float): Radi de cerca en mm
             
-        except Exception as e:
-            logger.error(f"Error actualitzant mapa d'obstacles: {e}")
+        Returns:
+            list: Índexs dels punts dins del radi
+        """
+        with self._lock:
+            points = self.cartesian_points
+            kdtree = self._kdtree
+        
+        # L'índex només es construeix la primera vegada que es consulta un scan
+        if kdtree is None:
+            kdtree = self._build_spatial_index(points)
+            if kdtree is None:
+                return []
+            with self._lock:
+                if self.cartesian_points is points:
+                    self._kdtree = kdtree
+        
+        return kdtree.query_ball_point((x, y), radius)
     
     def get_nearest_obstacle(self, angle_range=None):
         """
@@ -159,28 +377,48 @@ class LidarData:
         Returns:
             tuple: (angle en radians, distància en mm) o (None, None) si no hi ha obstacles
         """
-        if not self.angles or not self.distances:
-            return None, None
-        
-        # Si no s'especifica rang, utilitzar tot el rang
+        # Si no s'especifica rang, utilitzar tot el rang (angles i distàncies
+        # del mateix escaneig encara que n'arribi un de nou mentrestant)
         if angle_range is None:
-            idx = np.argmin(self.distances)
-            return self.angles[idx], self.distances[idx]
+            angles, distances = self.snapshot()
+            if angles.size == 0:
+                return None, None
+            idx = int(np.argmin(distances))
+            return float(angles[idx]), float(distances[idx])
         
         # Filtrar per rang d'angles
-        min_angle, max_angle = angle_range
-        indices = [i for i, angle in enumerate(self.angles)
-                  if min_angle <= angle <= max_angle]
+        angle, distance, _ = self.nearest_in_cone(angle_range[0], angle_range[1], 0)
+        return angle, distance
+    
+    def nearest_in_cone(self, lo, hi, threshold):
+        """
+        Obté el punt més proper dins d'un rang d'angles i el compara amb un llindar.
         
-        if not indices:
-            return None, None
+        Fa el filtre d'angles, el mínim i la comparació en una sola passada
+        sobre una vista coherent de l'escaneig.
         
-        # Obtenir l'obstacle més proper
-        filtered_distances = [self.distances[i] for i in indices]
-        min_idx = np.argmin(filtered_distances)
-        idx = indices[min_idx]
+        Args:
+            lo (float): Angle mínim en radians
+            hi (float): Angle màxim en radians
+            threshold (float): Distància en mm per sota de la qual hi ha obstacle
+            
+        Returns:
+            tuple: (angle en radians, distància en mm, True si distància < llindar)
+                   o (None, None, False) si no hi ha punts dins del rang
+        """
+        angles, distances = self.snapshot()
+        
+        # Distàncies fora del rang a infinit per trobar el mínim directament
+        masked = np.where((angles >= lo) & (angles <= hi), distances, np.inf)
+        if masked.size == 0:
+            return None, None, False
+        
+        idx = np.argmin(masked)
+        distance = masked[idx]
+        if distance == np.inf:
+            return None, None, False
         
-        return self.angles[idx], self.distances[idx]
+        return float(angles[idx]), float(distance), bool(distance < threshold)
     
     def get_sector_data(self, num_sectors=8):
         """
@@ -192,39 +430,19 @@ class LidarData:
         Returns:
             list: Llista de tuples (angle_central, distància_mínima)
         """
-        if not self.angles or not self.distances:
+        angles, distances = self.snapshot()
+        if angles.size == 0:
             return []
         
         # Calcular amplada del sector
         sector_width = 2 * np.pi / num_sectors
         
-        # Inicialitzar llista de resultats
-        sector_data = []
-        
-        # Per cada sector
-        for i in range(num_sectors):
-            # Calcular límits del sector
-            min_angle = i * sector_width - np.pi
-            max_angle = (i + 1) * sector_width - np.pi
-            mid_angle = (min_angle + max_angle) / 2
-            
-            # Obtenir punts dins del sector
-            indices = [j for j, angle in enumerate(self.angles)
-                      if min_angle <= angle < max_angle]
-            
-            # Si no hi ha punts, utilitzar màxim rang
-            if not indices:
-                sector_data.append((mid_angle, self.max_range))
-                continue
-            
-            # Obtenir distància mínima
-            distances = [self.distances[j] for j in indices]
-            min_distance = min(distances)
-            
-            # Afegir a la llista
-            sector_data.append((mid_angle, min_distance))
+        # Distància mínima per sector (max_range si no hi ha punts)
+        min_distances = sector_min(
+            angles, distances, self.max_range, num_sectors)
         
-        return sector_data
+        return [((i + 0.5) * sector_width - np.pi, float(min_distances[i]))
+                for i in range(num_sectors)]
     
     def get_polar_plot_data(self):
         """
@@ -242,11 +460,11 @@ class LidarData:
         Returns:
             tuple: (xs, ys)
         """
-        if not self.cartesian_points:
+        if len(self.cartesian_points) == 0:
             return [], []
         
-        xs = [p[0] for p in self.cartesian_points]
-        ys = [p[1] for p in self.cartesian_points]
+        xs = self.cartesian_points[:, 0]
+        ys = self.cartesian_points[:, 1]
         
         return xs, ys
     
@@ -254,6 +472,10 @@ class LidarData:
         """
         Obté dades pel gràfic de contorn.
         
+        El diccionari conté la graella d'ocupació 'grid' (uint8) i els límits
+        'bounds' en mm; les coordenades de les cel·les s'obtenen amb
+        get_grid_coordinates.
+        
         Returns:
             dict: Dades pel gràfic de contorn o None si no estan disponibles
         """
@@ -270,7 +492,8 @@ class LidarData:
         Returns:
             bool: True si el camí està lliure, False en cas contrari
         """
-        if not self.angles or not self.distances:
+        angles, distances = self.snapshot()
+        if angles.size == 0:
             return True
         
         # Calcular rang d'angles a comprovar (±30 graus)
@@ -279,20 +502,35 @@ class LidarData:
         max_angle = direction + angle_range
         
         # Obtenir punts dins del rang
-        indices = [i for i, angle in enumerate(self.angles)
+        indices = [i for i, angle in enumerate(angles)
                   if min_angle <= angle <= max_angle]
         
         if not indices:
             return True
         
         # Obtenir distàncies
-        distances = [self.distances[i] for i in indices]
-        min_distance = min(distances)
+        min_distance = min(distances[i] for i in indices)
         
         # Comprovar si hi ha obstacles
         return min_distance > distance_threshold
 
 
+class _ObstacleCheckRunnable(QRunnable):
+    """Tasca que comprova obstacles fora del fil de la interfície."""
+    
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+    
+    def run(self):
+        try:
+            self.manager._detect_obstacle()
+        except Exception as e:
+            logger.error(f"Error comprovant obstacles: {e}")
+        finally:
+            self.manager._obstacle_check_running = False
+
+
 class LidarManager(QObject):
     """
     Gestiona les dades i funcionalitats del LiDAR.
@@ -303,6 +541,15 @@ class LidarManager(QObject):
     lidar_data_updated = pyqtSignal(object)  # Dades del LiDAR actualitzades
     obstacle_detected = pyqtSignal(float, float)  # Angle, distància
     
+    # Màxim de direccions guardades a la memòria cau de seguretat
+    SAFETY_CACHE_SIZE = 256
+    
+    # Resolució de les direccions a la memòria cau de seguretat (radians)
+    SAFETY_ANGLE_STEP = np.radians(1.0)
+    
+    # Interval mínim entre regeneracions del mapa d'obstacles (segons)
+    MAP_UPDATE_INTERVAL = 0.5
+    
     def __init__(self, config):
         """
         Inicialitza el gestor del LiDAR.
@@ -321,8 +568,17 @@ class LidarManager(QObject):
         self.scan_frequency = lidar_config.get('scan_frequency', 5)  # Hz
         self.max_range = lidar_config.get('max_distance', 3000)  # mm
         
-        # Inicialitzar objecte de dades
-        self.lidar_data = LidarData(max_range=self.max_range)
+        # Inicialitzar objectes de dades (doble buffer: update escriu al de
+        # darrere i després s'intercanvien, les lectures no esperen)
+        self._snapshots = [LidarData(max_range=self.max_range),
+                           LidarData(max_range=self.max_range)]
+        self._cur = 0
+        self._swap_lock = threading.Lock()
+        
+        # Últim mapa d'obstacles i moment en què es va regenerar, comuns als
+        # dos buffers (el buffer que no el regenera hereta l'últim)
+        self._obstacle_map = None
+        self._last_map_t = 0.0
         
         # Estats
         self.scanning = False
@@ -331,6 +587,10 @@ class LidarManager(QObject):
         # Timer per detector d'obstacles
         self.obstacle_timer = QTimer()
         self.obstacle_timer.timeout.connect(self._check_obstacles)
+        self._obstacle_check_running = False
+        
+        # Memòria cau de seguretat per (scan_id, direcció quantificada)
+        self._safety_cache = LRUCache(self.SAFETY_CACHE_SIZE)
         
         logger.info("LidarManager inicialitzat")
     
@@ -348,21 +608,58 @@ class LidarManager(QObject):
         
         # Comprovar tipus de dades
         if data.get('type') == 'lidar_data':
-            # Obtenir dades del LiDAR
+            # Obtenir dades del LiDAR (binàries en base64 o llista de tuples)
+            scan_bytes = data.get('scan_bytes')
+            if scan_bytes is not None:
+                try:
+                    if isinstance(scan_bytes, str):
+                        scan_bytes = base64.b64decode(scan_bytes)
+                    if len(scan_bytes) % LIDAR_DTYPE.itemsize:
+                        raise ValueError(
+                            f"{len(scan_bytes)} bytes no és múltiple de "
+                            f"{LIDAR_DTYPE.itemsize}")
+                except (binascii.Error, ValueError, TypeError) as e:
+                    logger.error(f"Dades LiDAR binàries invàlides, ignorant scan: {e}")
+                    return
             scan_data = data.get('data', [])
             
-            # Actualitzar dades
-            if self.lidar_data.update(scan_data):
+            # Actualitzar el buffer de darrere mantenint la numeració d'escaneigs
+            back = self._snapshots[1 - self._cur]
+            scan_id = self._snapshots[self._cur].scan_id + 1
+            
+            # Limitar la freqüència de regeneració del mapa d'obstacles
+            now = time.time()
+            rebuild_map = now - self._last_map_t >= self.MAP_UPDATE_INTERVAL
+            
+            if scan_bytes is not None:
+                updated = back.update(scan_bytes=scan_bytes, scan_id=scan_id,
+                                      rebuild_map=rebuild_map)
+            else:
+                updated = back.update(scan_data, scan_id=scan_id,
+                                      rebuild_map=rebuild_map)
+            
+            if updated:
+                if rebuild_map:
+                    self._last_map_t = now
+                    self._obstacle_map = back.obstacle_map
+                else:
+                    back.obstacle_map = self._obstacle_map
+                
+                # Publicar el nou escaneig
+                with self._swap_lock:
+                    self._cur ^= 1
+                
                 # Actualitzar timestamp
                 self.last_scan_time = time.time()
                 
                 # Establir estat d'escaneig
                 self.scanning = True
                 
-                # Emetre senyal d'actualització
-                self.lidar_data_updated.emit(self.lidar_data)
+                # Emetre senyal d'actualització amb una còpia immutable: el
+                # buffer es tornarà a omplir d'aquí a dos escaneigs
+                self.lidar_data_updated.emit(back.freeze())
                 
-                logger.debug(f"Dades LiDAR actualitzades: {len(scan_data)} punts")
+                logger.debug("Dades LiDAR actualitzades: %d punts", back.angles.size)
                 
                 # Iniciar timer d'obstacles si no està actiu
                 if not self.obstacle_timer.isActive():
@@ -444,40 +741,58 @@ class LidarManager(QObject):
         Returns:
             LidarData: Objecte amb les dades del LiDAR
         """
-        return self.lidar_data
+        return self._snapshots[self._cur]
     
     def get_direction_safety(self, direction_radians):
         """
         Calcula la seguretat d'una direcció (0 = bloquejada, 1 = completament lliure).
         
+        La direcció s'arrodoneix a SAFETY_ANGLE_STEP i el resultat es guarda
+        a la memòria cau per a l'escaneig actual.
+        
         Args:
             direction_radians (float): Direcció en radians
             
         Returns:
             float: Valor de seguretat entre 0 i 1
         """
-        # Si no hi ha dades, retornar seguretat mitjana
-        if not self.lidar_data.angles or not self.lidar_data.distances:
-            return 0.5
-        
-        # Calcular rang d'angles a comprovar (±45 graus)
-        angle_range = 0.78  # radians (≈45 graus)
-        min_angle = direction_radians - angle_range
-        max_angle = direction_radians + angle_range
-        
-        # Obtenir punts dins del rang
-        indices = [i for i, angle in enumerate(self.lidar_data.angles)
-                  if min_angle <= angle <= max_angle]
+        # Identificador i dades del mateix escaneig, llegits alhora
+        scan_id, angles, distances = self.get_current_data().snapshot_with_id()
+        
+        step = round(float(direction_radians) / self.SAFETY_ANGLE_STEP)
+        key = (scan_id, step)
+        safety = self._safety_cache.get(key)
+        if safety is None:
+            # Si no hi ha dades, retornar seguretat mitjana
+            if angles.size == 0:
+                safety = 0.5
+            else:
+                direction = step * self.SAFETY_ANGLE_STEP
+                safety = float(self._safety_values(angles, distances, [direction])[0])
+            self._safety_cache.put(key, safety)
         
-        if not indices:
-            return 0.5
+        return safety
+    
+    def _safety_values(self, angles, distances, directions):
+        """
+        Calcula la seguretat de diverses direccions alhora.
         
-        # Obtenir distàncies
-        distances = [self.lidar_data.distances[i] for i in indices]
-        min_distance = min(distances)
+        Args:
+            angles (np.ndarray): Angles de l'escaneig en radians
+            distances (np.ndarray): Distàncies de l'escaneig en mm
+            directions (array-like): Direccions en radians
+            
+        Returns:
+            np.ndarray: Seguretat entre 0 i 1 per direcció (0.5 si no hi ha punts)
+        """
+        # Distància mínima dins de ±45 graus de cada direcció
+        angle_range = 0.78  # radians (≈45 graus)
+        min_distances = cone_min_distances(
+            angles, distances, directions, angle_range)
         
         # Calcular seguretat (0 = molt a prop, 1 = molt lluny)
-        safety = min(1.0, max(0.0, min_distance / self.max_range))
+        safety = np.clip(min_distances / self.max_range, 0.0, 1.0)
+        safety[np.isinf(min_distances)] = 0.5
         
         return safety
     
@@ -493,49 +808,50 @@ class LidarManager(QObject):
             float: Millor direcció en radians
         """
         # Si no hi ha dades, mantenir direcció actual
-        if not self.lidar_data.angles or not self.lidar_data.distances:
+        scan_angles, scan_distances = self.get_current_data().snapshot()
+        if scan_angles.size == 0:
             return current_direction
         
-        # Dividir el cercle en sectors
-        angles = []
-        safety_values = []
-        
-        for i in range(angle_resolution):
-            angle = i * (2 * np.pi / angle_resolution) - np.pi
-            safety = self.get_direction_safety(angle)
-            
-            # Afegir a les llistes
-            angles.append(angle)
-            safety_values.append(safety)
+        # Direccions candidates repartides pel cercle
+        angles = np.arange(angle_resolution) * (2 * np.pi / angle_resolution) - np.pi
+        safety_values = self._safety_values(scan_angles, scan_distances, angles)
         
         # Trobar les direccions més segures
-        safe_indices = [i for i, safety in enumerate(safety_values)
-                       if safety > 0.7]  # Llindar de seguretat
+        safe_indices = np.flatnonzero(safety_values > 0.7)  # Llindar de seguretat
         
-        if not safe_indices:
+        if safe_indices.size == 0:
             # Si no hi ha direccions segures, utilitzar la més segura
             best_idx = np.argmax(safety_values)
         else:
             # Entre les direccions segures, trobar la més propera a l'actual
-            angle_diffs = [abs(angles[i] - current_direction) for i in safe_indices]
-            min_diff_idx = np.argmin(angle_diffs)
-            best_idx = safe_indices[min_diff_idx]
+            angle_diffs = np.abs(angles[safe_indices] - current_direction)
+            best_idx = safe_indices[np.argmin(angle_diffs)]
         
-        return angles[best_idx]
+        return float(angles[best_idx])
     
     @pyqtSlot()
     def _check_obstacles(self):
-        """Comprova si hi ha obstacles propers i emet senyals."""
+        """Llança la comprovació d'obstacles al pool de fils."""
         if not self.enabled or not self.scanning:
             return
         
-        # Obtenir l'obstacle més proper davant (±30 graus)
-        angle, distance = self.lidar_data.get_nearest_obstacle((-0.5, 0.5))
+        # No encuar una nova comprovació si l'anterior encara no ha acabat
+        if self._obstacle_check_running:
+            return
         
-        if angle is not None and distance < 500:  # 50 cm
-            # Emetre senyal d'obstacle
-            self.obstacle_detected.emit(angle, distance)
-            logger.debug(f"Obstacle detectat: angle={angle:.2f} rad, distància={distance} mm")
+        self._obstacle_check_running = True
+        QThreadPool.globalInstance().start(_ObstacleCheckRunnable(self))
+    
+    def _detect_obstacle(self):
+        """Comprova si hi ha obstacles propers i emet senyals (s'executa en un fil del pool)."""
+        # Obstacle més proper a davant (±30 graus) i a menys de 50 cm
+        angle, distance, triggered = self.get_current_data().nearest_in_cone(-0.5, 0.5, 500)
+        if not triggered:
+            return
+        
+        # Emetre senyal d'obstacle (connexió encuada cap al fil principal)
+        self.obstacle_detected.emit(angle, distance)
+        logger.debug("Obstacle detectat: angle=%.2f rad, distància=%s mm", angle, distance)
     
     def cleanup(self):
         """Neteja recursos abans de tancar."""
@@ -543,4 +859,7 @@ class LidarManager(QObject):
         if self.obstacle_timer.isActive():
             self.obstacle_timer.stop()
         
+        # Esperar que acabin les comprovacions d'obstacles pendents
+        QThreadPool.globalInstance().waitForDone(1000)
+        
         logger.info("LidarManager netejat")
@@ -6,11 +6,13 @@ i proporciona funcions per la navegació basada en LiDAR.
 """
 
 import time
-import math
+from math import remainder, tau
 import logging
 import numpy as np
 from enum import Enum
-from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from modules.utils import RateLimiter, TimerService
 
 # Configuració de logging
 logger = logging.getLogger("Navigation")
@@ -30,6 +32,16 @@ class Mode(Enum):
     ASSISTED = "assisted"
     AUTONOMOUS = "autonomous"
 
+# Membres per valor, per convertir les cadenes rebudes
+_DIRECTION_LOOKUP = {d.value: d for d in Direction}
+_MODE_LOOKUP = {m.value: m for m in Mode}
+
+# Costat de cada gir suau, per als missatges de registre
+_TURN_SIDE = {
+    Direction.SOFT_LEFT: "l'esquerra",
+    Direction.SOFT_RIGHT: "la dreta",
+}
+
 class NavigationManager(QObject):
     """
     Gestiona la navegació del robot.
@@ -40,6 +52,20 @@ class NavigationManager(QObject):
     navigation_status_changed = pyqtSignal(str, dict)  # Mode, estat
     obstacle_alert = pyqtSignal(str, float, float)  # Direcció, angle, distància
     
+    # Llindars de diferència d'angle de la navegació autònoma (radians)
+    AUTO_STRAIGHT_THRESHOLD = 0.2  # ±11 graus
+    AUTO_SOFT_TURN_THRESHOLD = 0.5  # ±29 graus
+    
+    # Canvi mínim de direcció (radians) perquè el pas autònom torni a decidir
+    AUTO_UNCHANGED_EPSILON = 0.02
+    
+    # Mitja obertura del con frontal per classificar obstacles (radians, ±29 graus)
+    FRONT_CONE_HALF = 0.5
+    
+    # Període del timer de navegació i cada quants ticks es comprova l'auto-stop
+    TICK_INTERVAL_MS = 200  # 5 Hz
+    AUTO_STOP_TICKS = 5  # 1 segon
+    
     def __init__(self, config):
         """
         Inicialitza el gestor de navegació.
@@ -57,6 +83,11 @@ class NavigationManager(QObject):
         self.default_speed = nav_config.get('default_speed', 150)
         self.auto_stop_timeout = nav_config.get('auto_stop_timeout', 30)  # segons
         self.obstacle_threshold = nav_config.get('obstacle_threshold', 500)  # mm
+        self._obstacle_close = self.obstacle_threshold * 0.5  # Distància d'aturada (mm)
+        self.max_command_rate = nav_config.get('max_command_rate', 20)  # comandes/segon
+        
+        # Limitador de comandes repetides cap al firmware
+        self._cmd_limiter = RateLimiter(max_calls=self.max_command_rate, period=1.0)
         
         # Estat actual
         self.current_mode = Mode.MANUAL
@@ -65,15 +96,13 @@ class NavigationManager(QObject):
         self.is_moving = False
         self.last_command_time = 0
         self.auto_target_direction = 0  # Radians
+        self._last_auto_direction = None  # Última direcció enviada pel mode autònom
+        self._last_best_direction = None  # Millor direcció de l'últim pas autònom
+        self._last_target_direction = None  # Direcció objectiu de l'últim pas autònom
         
-        # Timer per a navegació autònoma
-        self.auto_timer = QTimer()
-        self.auto_timer.timeout.connect(self._auto_navigation_step)
-        
-        # Timer per a auto-stop
-        self.auto_stop_timer = QTimer()
-        self.auto_stop_timer.timeout.connect(self._check_auto_stop)
-        self.auto_stop_timer.start(1000)  # 1 segon
+        # Tick periòdic per a navegació autònoma i auto-stop (timer compartit,
+        # només subscrit quan cal)
+        self._tick_count = 0
         
         # Referència a altres components
         self.connection_manager = None
@@ -107,10 +136,10 @@ class NavigationManager(QObject):
             bool: True si s'ha canviat correctament, False en cas contrari
         """
         if not isinstance(mode, Mode):
-            try:
-                mode = Mode(mode)
-            except ValueError:
-                logger.error(f"Mode de navegació no vàlid: {mode}")
+            mode_value = mode
+            mode = _MODE_LOOKUP.get(mode) if isinstance(mode, str) else None
+            if mode is None:
+                logger.error(f"Mode de navegació no vàlid: {mode_value}")
                 return False
         
         # Si és el mateix mode, no fer res
@@ -123,6 +152,8 @@ class NavigationManager(QObject):
         # Canviar mode
         old_mode = self.current_mode
         self.current_mode = mode
+        self._last_auto_direction = None
+        self._last_best_direction = None
         
         # Accions específiques segons el mode
         if mode == Mode.AUTONOMOUS:
@@ -130,13 +161,10 @@ class NavigationManager(QObject):
             if self.lidar_manager and not self.lidar_manager.is_scan_active():
                 self.lidar_manager.start_scan(self.connection_manager)
             
-            # Iniciar timer de navegació autònoma
-            self.auto_timer.start(200)  # 5 Hz
             logger.info("Mode de navegació autònoma activat")
-        else:
-            # Aturar timer de navegació autònoma
-            if self.auto_timer.isActive():
-                self.auto_timer.stop()
+        
+        # Engegar o aturar el timer de navegació segons el nou mode
+        self._update_tick_timer()
         
         # Emetre senyal de canvi d'estat
         self.navigation_status_changed.emit(
@@ -148,9 +176,20 @@ class NavigationManager(QObject):
             }
         )
         
-        logger.info(f"Mode de navegació canviat de {old_mode.value} a {mode.value}")
+        logger.info("Mode de navegació canviat de %s a %s", old_mode.value, mode.value)
         return True
     
+    def set_obstacle_threshold(self, threshold):
+        """
+        Estableix el llindar de distància d'obstacles.
+        
+        Args:
+            threshold (float): Nou llindar en mm
+        """
+        self.obstacle_threshold = threshold
+        self._obstacle_close = threshold * 0.5
+        logger.info("Llindar d'obstacles canviat a %s mm", threshold)
+    
     def set_speed(self, speed):
         """
         Estableix la velocitat del robot.
@@ -176,7 +215,7 @@ class NavigationManager(QObject):
                 "action": "set_speed",
                 "value": speed
             })
-            logger.info(f"Velocitat canviada a {speed}")
+            logger.info("Velocitat canviada a %s", speed)
         
         return True
     
@@ -191,10 +230,10 @@ class NavigationManager(QObject):
             bool: True si s'ha enviat correctament, False en cas contrari
         """
         if not isinstance(direction, Direction):
-            try:
-                direction = Direction(direction)
-            except ValueError:
-                logger.error(f"Direcció no vàlida: {direction}")
+            direction_value = direction
+            direction = _DIRECTION_LOOKUP.get(direction) if isinstance(direction, str) else None
+            if direction is None:
+                logger.error(f"Direcció no vàlida: {direction_value}")
                 return False
         
         # Verificar si estem en mode manual
@@ -202,11 +241,33 @@ class NavigationManager(QObject):
             logger.warning("No es pot moure manualment en mode autònom")
             return False
         
+        return self._send_direction(direction)
+    
+    def _send_direction(self, direction):
+        """
+        Envia una comanda de moviment sense comprovar el mode de navegació.
+        
+        La fan servir move (després de validar el mode) i el pas de
+        navegació autònoma.
+        
+        Args:
+            direction (Direction): Direcció de moviment
+            
+        Returns:
+            bool: True si s'ha enviat correctament, False en cas contrari
+        """
         # Comprovar si tenim connexió
         if not self.connection_manager or not self.connection_manager.connected:
             logger.error("No es pot moure: no hi ha connexió")
             return False
         
+        # Agrupar comandes repetides si se supera la freqüència màxima (STOP sempre passa)
+        if (direction == self.current_direction and direction != Direction.STOP
+                and not self._cmd_limiter.can_call()):
+            # L'usuari continua conduint: evitar l'auto-stop per inactivitat
+            self.last_command_time = time.monotonic()
+            return True
+        
         # Desar direcció actual
         self.current_direction = direction
         
@@ -215,7 +276,9 @@ class NavigationManager(QObject):
             self.is_moving = False
         else:
             self.is_moving = True
-            self.last_command_time = time.time()
+            self.last_command_time = time.monotonic()
+        
+        self._update_tick_timer()
         
         # Enviar comanda al robot
         command = {
@@ -226,7 +289,7 @@ class NavigationManager(QObject):
         success = self.connection_manager.send_command(command)
         
         if success:
-            logger.info(f"Moviment {direction.value} enviat")
+            logger.info("Moviment %s enviat", direction.value)
             
             # Emetre senyal de canvi d'estat
             self.navigation_status_changed.emit(
@@ -313,9 +376,33 @@ class NavigationManager(QObject):
             direction_radians (float): Direcció en radians
         """
         self.auto_target_direction = direction_radians
-        logger.debug(f"Direcció objectiu autònoma establerta a {direction_radians} radians")
+        logger.debug("Direcció objectiu autònoma establerta a %s radians", direction_radians)
+    
+    def _update_tick_timer(self):
+        """Engega el timer de navegació si el robot es mou o és en mode autònom, i l'atura si no."""
+        needed = self.is_moving or self.current_mode == Mode.AUTONOMOUS
+        timer_service = TimerService.instance()
+        active = timer_service.is_subscribed(self.TICK_INTERVAL_MS, self._on_tick)
+        
+        if needed and not active:
+            self._tick_count = 0
+            timer_service.subscribe(self.TICK_INTERVAL_MS, self._on_tick)
+        elif not needed and active:
+            timer_service.unsubscribe(self.TICK_INTERVAL_MS, self._on_tick)
     
     @pyqtSlot()
+    def _on_tick(self):
+        """Executa les tasques periòdiques de navegació."""
+        self._tick_count += 1
+        
+        # Comprovar auto-stop cada segon
+        if self._tick_count % self.AUTO_STOP_TICKS == 0:
+            self._check_auto_stop()
+        
+        # Pas de navegació autònoma a cada tick
+        if self.current_mode == Mode.AUTONOMOUS:
+            self._auto_navigation_step()
+    
     def _auto_navigation_step(self):
         """Executa un pas de navegació autònoma."""
         if self.current_mode != Mode.AUTONOMOUS:
@@ -330,38 +417,55 @@ class NavigationManager(QObject):
         lidar_data = self.lidar_manager.get_current_data()
         
         # Si no hi ha dades de LiDAR, aturar-se per seguretat
-        if not lidar_data or not lidar_data.angles or not lidar_data.distances:
+        if not lidar_data or len(lidar_data.angles) == 0:
             logger.warning("No hi ha dades de LiDAR disponibles, aturant robot")
             self.stop()
+            self._last_auto_direction = None
+            self._last_best_direction = None
             return
         
         # Trobar millor direcció per evitar obstacles
         best_direction = self.lidar_manager.find_best_direction(self.auto_target_direction)
         
-        # Calcular diferència d'angle
-        angle_diff = best_direction - self.auto_target_direction
+        # Si res no ha canviat des de l'últim pas i el robot segueix la mateixa
+        # comanda, no cal tornar a decidir
+        if (self._last_best_direction is not None
+                and self.current_direction == self._last_auto_direction
+                and abs(best_direction - self._last_best_direction) < self.AUTO_UNCHANGED_EPSILON
+                and abs(self.auto_target_direction - self._last_target_direction) < self.AUTO_UNCHANGED_EPSILON):
+            # El robot continua actiu: evitar l'auto-stop per inactivitat
+            self.last_command_time = time.monotonic()
+            return
+        
+        self._last_best_direction = best_direction
+        self._last_target_direction = self.auto_target_direction
         
-        # Normalitzar a [-π, π]
-        angle_diff = (angle_diff + math.pi) % (2 * math.pi) - math.pi
+        # Calcular diferència d'angle normalitzada a [-π, π]
+        angle_diff = remainder(best_direction - self.auto_target_direction, tau)
+        abs_diff = abs(angle_diff)
         
         # Decidir quin moviment fer
-        if abs(angle_diff) < 0.2:  # ±11 graus
+        if abs_diff < self.AUTO_STRAIGHT_THRESHOLD:
             # Recte
-            self.move(Direction.FORWARD)
-        elif abs(angle_diff) < 0.5:  # ±29 graus
+            new_direction = Direction.FORWARD
+        elif abs_diff < self.AUTO_SOFT_TURN_THRESHOLD:
             # Gir suau
-            if angle_diff > 0:
-                self.move(Direction.SOFT_LEFT)
-            else:
-                self.move(Direction.SOFT_RIGHT)
+            new_direction = Direction.SOFT_LEFT if angle_diff > 0 else Direction.SOFT_RIGHT
         else:
             # Gir pronunciat
-            if angle_diff > 0:
-                self.move(Direction.LEFT)
-            else:
-                self.move(Direction.RIGHT)
+            new_direction = Direction.LEFT if angle_diff > 0 else Direction.RIGHT
+        
+        # Només enviar la comanda si la direcció ha canviat (o algú altre
+        # ha enviat una comanda diferent des de l'últim pas)
+        if new_direction == self._last_auto_direction == self.current_direction:
+            # El robot continua actiu: evitar l'auto-stop per inactivitat
+            self.last_command_time = time.monotonic()
+            return
+        
+        if self._send_direction(new_direction):
+            self._last_auto_direction = new_direction
         
-        logger.debug(f"Navegació autònoma: direcció={best_direction:.2f}, diff={angle_diff:.2f}")
+        logger.debug("Navegació autònoma: direcció=%.2f, diff=%.2f", best_direction, angle_diff)
     
     @pyqtSlot(float, float)
     def _on_obstacle_detected(self, angle, distance):
@@ -373,40 +477,45 @@ class NavigationManager(QObject):
             distance (float): Distància de l'obstacle en mm
         """
         # Determinar direcció de l'obstacle
-        direction = "frontal"
-        if angle > 0.5:
+        if angle > self.FRONT_CONE_HALF:
             direction = "esquerra"
-        elif angle < -0.5:
+        elif angle < -self.FRONT_CONE_HALF:
             direction = "dreta"
+        else:
+            direction = "frontal"
         
         # Emetre senyal d'alerta
         self.obstacle_alert.emit(direction, angle, distance)
         
-        # Si estem en mode assistit, ajudar a evitar l'obstacle
-        if self.current_mode == Mode.ASSISTED and self.is_moving:
-            # Si l'obstacle és molt proper, aturar-se
-            if distance < self.obstacle_threshold / 2:
-                logger.warning(f"Obstacle molt proper ({distance} mm), aturant robot")
-                self.stop()
-            # Si estem anant endavant i hi ha un obstacle frontal, ajudar a evitar-lo
-            elif self.current_direction == Direction.FORWARD and abs(angle) < 0.5:
-                # Decidir cap a on girar
-                if angle > 0:
-                    logger.info(f"Obstacle frontal ({distance} mm), ajudant a girar a la dreta")
-                    self.move(Direction.SOFT_RIGHT)
-                else:
-                    logger.info(f"Obstacle frontal ({distance} mm), ajudant a girar a l'esquerra")
-                    self.move(Direction.SOFT_LEFT)
+        # Només cal ajudar en mode assistit i amb el robot en moviment
+        if self.current_mode != Mode.ASSISTED or not self.is_moving:
+            return
+        
+        # Si l'obstacle és molt proper, aturar-se
+        if distance < self._obstacle_close:
+            logger.warning("Obstacle molt proper (%s mm), aturant robot", distance)
+            self.stop()
+        # Si estem anant endavant i hi ha un obstacle frontal, ajudar a evitar-lo
+        elif self.current_direction == Direction.FORWARD and abs(angle) < self.FRONT_CONE_HALF:
+            # Girar cap al costat contrari de l'obstacle
+            turn = Direction.SOFT_RIGHT if angle > 0 else Direction.SOFT_LEFT
+            logger.info("Obstacle frontal (%s mm), ajudant a girar a %s",
+                        distance, _TURN_SIDE[turn])
+            self.move(turn)
     
-    @pyqtSlot()
     def _check_auto_stop(self):
         """Comprova si cal aturar automàticament el robot per inactivitat."""
         if not self.is_moving:
             return
         
         # Comprovar si ha passat massa temps des de l'última comanda
-        time_since_last_command = time.time() - self.last_command_time
+        time_since_last_command = time.monotonic() - self.last_command_time
         
         if time_since_last_command > self.auto_stop_timeout:
             logger.warning(f"Auto-stop per inactivitat ({self.auto_stop_timeout} segons)")
             self.stop()
+    
+    def cleanup(self):
+        """Neteja recursos abans de tancar."""
+        TimerService.instance().unsubscribe(self.TICK_INTERVAL_MS, self._on_tick)
+        logger.info("NavigationManager netejat")
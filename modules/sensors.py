@@ -6,8 +6,13 @@ de dades dels diferents tipus de sensors.
 """
 
 import logging
+import operator
 import time
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+import types
+import numpy as np
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from modules.utils import Debouncer, RateLimiter, TimerService
 
 # Configuració del logger
 logger = logging.getLogger("Sensors")
@@ -21,44 +26,66 @@ class SensorManager(QObject):
     # Senyals per comunicar canvis d'estat
     sensor_data_updated = pyqtSignal(str, float)  # Tipus de sensor, valor
     sensor_alert = pyqtSignal(str, str)           # Tipus de sensor, missatge
-    sensors_status_updated = pyqtSignal(dict)     # Dict amb tots els valors
+    # Vista de només lectura amb tots els valors (els receptors no la poden modificar)
+    sensors_status_updated = pyqtSignal(object)
+    
+    # Període mínim entre alertes repetides d'un mateix sensor (segons)
+    ALERT_PERIOD = 5.0
     
-    # Definició dels tipus de sensors i propietats
+    # Definició dels tipus de sensors i propietats. 'status_epsilon' és el
+    # canvi mínim (en unitats del sensor) perquè l'estat general s'emeti
+    # fora del període del debouncer, i 'alert_worsening' l'empitjorament
+    # que permet repetir una alerta dins d'ALERT_PERIOD
     SENSOR_TYPES = {
         'temperature': {
             'name': 'Temperatura',
             'unit': '°C',
             'threshold': 45.0,
+            'clip': (15, 60),  # Rang de valors simulats
+            'status_epsilon': 0.1,
+            'alert_worsening': 2.0,
             'alert_message': 'Temperatura elevada detectada: {value}°C'
         },
         'humidity': {
             'name': 'Humitat',
             'unit': '%',
             'threshold': 90.0,
+            'clip': (0, 100),
+            'status_epsilon': 0.5,
+            'alert_worsening': 5.0,
             'alert_message': 'Humitat elevada detectada: {value}%'
         },
         'gas': {
             'name': 'Gas',
             'unit': 'ppm',
             'threshold': 1000.0,
+            'status_epsilon': 5.0,
+            'alert_worsening': 100.0,
             'alert_message': 'Nivell de gas perillós detectat: {value} ppm'
         },
         'co': {
             'name': 'Monòxid de Carboni',
             'unit': 'ppm',
             'threshold': 50.0,
+            'status_epsilon': 1.0,
+            'alert_worsening': 10.0,
             'alert_message': 'Nivell perillós de CO detectat: {value} ppm'
         },
         'smoke': {
             'name': 'Fum',
             'unit': '%',
             'threshold': 30.0,
+            'status_epsilon': 0.5,
+            'alert_worsening': 5.0,
             'alert_message': 'Fum detectat: {value}%'
         },
         'battery': {
             'name': 'Bateria',
             'unit': '%',
             'threshold': 20.0,
+            'clip': (0, 100),
+            'status_epsilon': 1.0,
+            'alert_worsening': 5.0,
             'alert_message': 'Nivell de bateria baix: {value}%'
         }
     }
@@ -84,16 +111,38 @@ class SensorManager(QObject):
         
         # Inicialitzar l'estat dels sensors
         self.sensor_values = {sensor_type: 0.0 for sensor_type in self.SENSOR_TYPES}
+        self._status_view = types.MappingProxyType(self.sensor_values)
         self.sensor_thresholds = {}
         
+        # Generador i límits per a la simulació (ordre fix dels sensors)
+        self._sim_rng = np.random.default_rng()
+        self._sim_keys = list(self.SENSOR_TYPES)
+        clips = [self.SENSOR_TYPES[k].get('clip', (-np.inf, np.inf)) for k in self._sim_keys]
+        self._sim_lo = np.array([lo for lo, _ in clips], dtype=float)
+        self._sim_hi = np.array([hi for _, hi in clips], dtype=float)
+        
         # Carregar llindars dels sensors de la configuració
         self._load_sensor_thresholds(config)
         
         # Timer per a simulació de lectures si no hi ha connexió real
-        self.simulation_timer = QTimer()
-        self.simulation_timer.timeout.connect(self._simulate_readings)
+        self.simulation_interval = 1000  # ms (timer compartit)
         self.simulation_active = False
         
+        # Limitar l'emissió de l'estat general (màxim 4 Hz si no hi ha canvis rellevants)
+        self._status_debounce = Debouncer(0.25)
+        self._last_status_snapshot = {}
+        self._status_epsilon = {k: p['status_epsilon'] for k, p in self.SENSOR_TYPES.items()}
+        
+        # Emissió final dels canvis petits que han quedat dins del període
+        self._status_trailing = QTimer(self)
+        self._status_trailing.setSingleShot(True)
+        self._status_trailing.setInterval(int(self._status_debounce.wait_time * 1000))
+        self._status_trailing.timeout.connect(self._flush_status)
+        
+        # Limitar les alertes repetides de cada sensor
+        self._alert_limiters = {k: RateLimiter(1, self.ALERT_PERIOD) for k in self.SENSOR_TYPES}
+        self._last_alert_values = {}
+        
         logger.info("SensorManager inicialitzat")
     
     def _load_sensor_thresholds(self, config):
@@ -127,46 +176,71 @@ class SensorManager(QObject):
                 
                 # Guardar llindar
                 self.sensor_thresholds[sensor_type] = threshold
-                logger.info(f"Llindar per {properties['name']}: {threshold} {properties['unit']}")
+                logger.info("Llindar per %s: %s %s", properties['name'], threshold, properties['unit'])
         
         except Exception as e:
             logger.error(f"Error carregant llindars de sensors: {e}")
             # Establir llindars per defecte
             self.sensor_thresholds = {sensor_type: properties['threshold'] 
                                      for sensor_type, properties in self.SENSOR_TYPES.items()}
+        
+        self._update_simulation_ranges()
+        
+        # Taula de comprovació d'alertes (llindar, comparador, missatge,
+        # empitjorament amb signe) per sensor
+        self._check_table = {}
+        for sensor_type in self.SENSOR_TYPES:
+            self._update_check_entry(sensor_type)
+    
+    def _update_check_entry(self, sensor_type):
+        """
+        Recalcula l'entrada de la taula de comprovació d'alertes d'un sensor.
+        
+        Args:
+            sensor_type (str): Tipus de sensor
+        """
+        # Per la bateria, l'alerta és si el valor és MENOR que el llindar;
+        # per la resta, si és MAJOR
+        comparator = operator.lt if sensor_type == 'battery' else operator.gt
+        properties = self.SENSOR_TYPES[sensor_type]
+        worsening = properties['alert_worsening']
+        self._check_table[sensor_type] = (
+            self.sensor_thresholds[sensor_type],
+            comparator,
+            properties['alert_message'],
+            worsening if comparator is operator.gt else -worsening
+        )
+    
+    def _update_simulation_ranges(self):
+        """Recalcula el valor base i la variació de la simulació a partir dels llindars."""
+        thresholds = np.array([self.sensor_thresholds[k] for k in self._sim_keys], dtype=float)
+        self._sim_base = thresholds * 0.8
+        self._sim_var = thresholds * 0.4
     
     def start_simulation(self):
         """Inicia la simulació de lectures de sensors."""
         if not self.simulation_active:
             logger.info("Iniciant simulació de sensors")
             self.simulation_active = True
-            self.simulation_timer.start(1000)  # Actualitzar cada segon
+            TimerService.instance().subscribe(self.simulation_interval, self._simulate_readings)
     
     def stop_simulation(self):
         """Atura la simulació de lectures de sensors."""
         if self.simulation_active:
             logger.info("Aturant simulació de sensors")
             self.simulation_active = False
-            self.simulation_timer.stop()
+            TimerService.instance().unsubscribe(self.simulation_interval, self._simulate_readings)
     
     def _simulate_readings(self):
         """Genera lectures simulades per a tots els sensors."""
-        import random
+        # Generar valors simulats (propers al llindar per veure alertes ocasionalment)
+        values = self._sim_base + self._sim_rng.uniform(-self._sim_var, self._sim_var)
         
-        for sensor_type, properties in self.SENSOR_TYPES.items():
-            # Generar valor simulat (propera al llindar per veure alertes ocasionalment)
-            base_value = self.sensor_thresholds[sensor_type] * 0.8
-            variance = self.sensor_thresholds[sensor_type] * 0.4
-            value = base_value + random.uniform(-variance, variance)
-            
-            # Assegurar que els valors estan dins de rangs raonables
-            if sensor_type == 'humidity' or sensor_type == 'battery':
-                value = max(0, min(100, value))  # 0-100%
-            elif sensor_type == 'temperature':
-                value = max(15, min(60, value))  # 15-60°C
-            
-            # Actualitzar valor
-            self.update_sensor_value(sensor_type, value)
+        # Assegurar que els valors estan dins de rangs raonables
+        np.clip(values, self._sim_lo, self._sim_hi, out=values)
+        
+        # Actualitzar tots els valors d'un sol cop
+        self.update_sensor_values(dict(zip(self._sim_keys, values.tolist())))
     
     def update_sensor_value(self, sensor_type, value):
         """
@@ -178,7 +252,7 @@ class SensorManager(QObject):
         """
         # Validar tipus de sensor
         if sensor_type not in self.SENSOR_TYPES:
-            logger.warning(f"Tipus de sensor desconegut: {sensor_type}")
+            logger.warning("Tipus de sensor desconegut: %s", sensor_type)
             return
         
         # Actualitzar valor
@@ -191,7 +265,63 @@ class SensorManager(QObject):
         self._check_threshold(sensor_type, value)
         
         # Actualitzar estat general
-        self.sensors_status_updated.emit(self.sensor_values.copy())
+        self._emit_status()
+    
+    def update_sensor_values(self, values):
+        """
+        Actualitza diversos sensors alhora i emet l'estat general un sol cop.
+        
+        Args:
+            values (dict): Diccionari {tipus de sensor: nou valor}
+        """
+        changed = False
+        
+        for sensor_type, value in values.items():
+            # Validar tipus de sensor
+            if sensor_type not in self.SENSOR_TYPES:
+                logger.warning("Tipus de sensor desconegut: %s", sensor_type)
+                continue
+            
+            # Actualitzar valor i comprovar alerta
+            self.sensor_values[sensor_type] = value
+            self.sensor_data_updated.emit(sensor_type, value)
+            self._check_threshold(sensor_type, value)
+            changed = True
+        
+        # Actualitzar estat general
+        if changed:
+            self._emit_status()
+    
+    def _emit_status(self):
+        """
+        Emet l'estat general si algun valor ha canviat prou o ha passat el període mínim.
+        
+        Els canvis petits que arriben dins del període es publiquen en vèncer-lo.
+        """
+        last = self._last_status_snapshot
+        epsilon = self._status_epsilon
+        changed = any(abs(value - last.get(sensor_type, float('inf'))) >= epsilon[sensor_type]
+                      for sensor_type, value in self.sensor_values.items())
+        
+        if not changed and not self._status_debounce.should_call():
+            if not self._status_trailing.isActive():
+                self._status_trailing.start()
+            return
+        
+        self._publish_status()
+    
+    def _flush_status(self):
+        """Publica l'estat general pendent si difereix de l'últim emès."""
+        if self._last_status_snapshot != self.sensor_values:
+            self._publish_status()
+    
+    def _publish_status(self):
+        """Emet l'estat general i en guarda la instantània."""
+        self._status_trailing.stop()
+        self._status_debounce.last_call = time.monotonic()
+        # Reutilitzar el mateix diccionari per a la instantània (sense noves assignacions)
+        self._last_status_snapshot.update(self.sensor_values)
+        self.sensors_status_updated.emit(self._status_view)
     
     def _check_threshold(self, sensor_type, value):
         """
@@ -201,22 +331,21 @@ class SensorManager(QObject):
             sensor_type (str): Tipus de sensor
             value (float): Valor a comprovar
         """
-        properties = self.SENSOR_TYPES[sensor_type]
-        threshold = self.sensor_thresholds[sensor_type]
-        
-        # Condició d'alerta (depèn del tipus de sensor)
-        if sensor_type == 'battery':
-            # Per la bateria, l'alerta és si el valor és MENOR que el llindar
-            if value < threshold:
-                message = properties['alert_message'].format(value=round(value, 1))
-                self.sensor_alert.emit(sensor_type, message)
-                logger.warning(message)
-        else:
-            # Per la resta de sensors, l'alerta és si el valor és MAJOR que el llindar
-            if value > threshold:
-                message = properties['alert_message'].format(value=round(value, 1))
-                self.sensor_alert.emit(sensor_type, message)
-                logger.warning(message)
+        threshold, comparator, alert_message, worsening = self._check_table[sensor_type]
+        
+        if not comparator(value, threshold):
+            return
+        
+        # Evitar alertes repetides, tret que el valor hagi empitjorat clarament
+        last_value = self._last_alert_values.get(sensor_type)
+        worsened = last_value is not None and comparator(value - last_value, worsening)
+        if not worsened and not self._alert_limiters[sensor_type].can_call():
+            return
+        
+        self._last_alert_values[sensor_type] = value
+        message = alert_message.format(value=round(value, 1))
+        self.sensor_alert.emit(sensor_type, message)
+        logger.warning(message)
     
     def get_sensor_value(self, sensor_type):
         """
@@ -254,8 +383,10 @@ class SensorManager(QObject):
             logger.warning(f"Tipus de sensor desconegut per establir llindar: {sensor_type}")
             return False
         
-        logger.info(f"Canviant llindar de {self.SENSOR_TYPES[sensor_type]['name']} a {threshold}")
+        logger.info("Canviant llindar de %s a %s", self.SENSOR_TYPES[sensor_type]['name'], threshold)
         self.sensor_thresholds[sensor_type] = threshold
+        self._update_check_entry(sensor_type)
+        self._update_simulation_ranges()
         return True
     
     def get_threshold(self, sensor_type):
@@ -275,3 +406,4 @@ class SensorManager(QObject):
         """Neteja i allibera recursos."""
         logger.info("Netejant recursos de SensorManager")
         self.stop_simulation()
+        self._status_trailing.stop()
@@ -5,12 +5,25 @@ Mòdul d'Utilitats (utils.py)
 Proporciona funcions i classes d'utilitat comunes per als altres mòduls del sistema.
 """
 
+import functools
 import os
 import sys
 import json
 import logging
+from logging.handlers import RotatingFileHandler
 import time
+from collections import OrderedDict, deque
 from datetime import datetime
+from PyQt5.QtCore import QObject, QTimer
+
+# Importació opcional d'orjson (anàlisi de JSON en C, més ràpida)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
 
 # Configuració de logging
 logger = logging.getLogger("Utils")
@@ -28,8 +41,7 @@ def setup_logging(log_dir="logs", level=logging.INFO, log_to_console=True):
         logging.Logger: Logger principal
     """
     # Crear directori de logs si no existeix
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
     # Nom del fitxer de log amb timestamp
     log_file = os.path.join(
@@ -46,8 +58,11 @@ def setup_logging(log_dir="logs", level=logging.INFO, log_to_console=True):
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     
-    # Handler per fitxer
-    file_handler = logging.FileHandler(log_file)
+    # Handler per fitxer (rotatiu: màxim 10 MB per fitxer i 5 còpies; el
+    # fitxer no s'obre fins a la primera escriptura)
+    file_handler = RotatingFileHandler(
+        log_file, maxBytes=10 * 1024 * 1024, backupCount=5,
+        encoding='utf-8', delay=True)
     file_handler.setFormatter(formatter)
     root_logger.addHandler(file_handler)
     
@@ -57,7 +72,7 @@ def setup_logging(log_dir="logs", level=logging.INFO, log_to_console=True):
         console_handler.setFormatter(formatter)
         root_logger.addHandler(console_handler)
     
-    logger.info(f"Logging configurat. Fitxer de log: {log_file}")
+    logger.info("Logging configurat. Fitxer de log: %s", log_file)
     return root_logger
 
 def format_time(timestamp=None):
@@ -87,18 +102,23 @@ def parse_json_safe(json_str, default=None):
         dict/list/value: El resultat de l'anàlisi o el valor per defecte
     """
     try:
-        return json.loads(json_str)
+        return _json_loads(json_str)
     except json.JSONDecodeError:
-        logger.warning(f"Error analitzant JSON: {json_str[:50]}...")
+        # orjson.JSONDecodeError també és subclasse de json.JSONDecodeError
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Error analitzant JSON: %s...", json_str[:50])
         return default
     except Exception as e:
         logger.error(f"Error desconegut analitzant JSON: {e}")
         return default
 
+@functools.lru_cache(maxsize=1)
 def get_app_dir():
     """
     Obté el directori de l'aplicació.
     
+    El resultat es calcula un sol cop (no canvia durant l'execució).
+    
     Returns:
         str: Ruta al directori de l'aplicació
     """
@@ -133,7 +153,7 @@ class Debouncer:
             wait_time (float): Temps mínim entre crides (segons)
         """
         self.wait_time = wait_time
-        self.last_call = 0
+        self.last_call = float('-inf')
     
     def should_call(self):
         """
@@ -142,7 +162,7 @@ class Debouncer:
         Returns:
             bool: True si ha passat més temps que wait_time
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self.last_call > self.wait_time:
             self.last_call = current_time
             return True
@@ -150,7 +170,7 @@ class Debouncer:
     
     def reset(self):
         """Reinicia el comptador de temps."""
-        self.last_call = 0
+        self.last_call = float('-inf')
 
 class RateLimiter:
     """Classe per limitar la freqüència de crides a funcions."""
@@ -165,7 +185,7 @@ class RateLimiter:
         """
         self.max_calls = max_calls
         self.period = period
-        self.calls = []
+        self.calls = deque(maxlen=max_calls + 1)
     
     def can_call(self):
         """
@@ -174,10 +194,12 @@ class RateLimiter:
         Returns:
             bool: True si es pot fer la crida
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         
-        # Eliminar crides antigues
-        self.calls = [t for t in self.calls if current_time - t < self.period]
+        # Eliminar crides antigues (les més velles són al principi)
+        cutoff = current_time - self.period
+        while self.calls and self.calls[0] <= cutoff:
+            self.calls.popleft()
         
         # Comprovar si es pot fer una nova crida
         if len(self.calls) < self.max_calls:
@@ -188,4 +210,148 @@ class RateLimiter:
     
     def reset(self):
         """Reinicia el comptador de crides."""
-        self.calls = []
+        self.calls.clear()
+
+class LRUCache:
+    """Memòria cau amb un màxim d'entrades que descarta la menys usada."""
+    
+    def __init__(self, max_size):
+        """
+        Inicialitza la memòria cau.
+        
+        Args:
+            max_size (int): Nombre màxim d'entrades
+        """
+        self.max_size = max_size
+        self._items = OrderedDict()  # La més recent al final
+    
+    def get(self, key, default=None):
+        """
+        Obté una entrada i la marca com a la més recent.
+        
+        Args:
+            key: Clau de l'entrada
+            default: Valor a retornar si no hi és
+            
+        Returns:
+            El valor desat o default
+        """
+        if key not in self._items:
+            return default
+        self._items.move_to_end(key)
+        return self._items[key]
+    
+    def put(self, key, value):
+        """
+        Desa una entrada i descarta la menys usada si se supera el màxim.
+        
+        Args:
+            key: Clau de l'entrada
+            value: Valor a desar
+        """
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+    
+    def __contains__(self, key):
+        return key in self._items
+    
+    def __len__(self):
+        return len(self._items)
+    
+    def clear(self):
+        """Buida la memòria cau."""
+        self._items.clear()
+
+class TimerService(QObject):
+    """
+    Servei de timers compartits.
+    Agrupa els subscriptors per interval i fa servir un sol QTimer per interval.
+    """
+    
+    _instance = None
+    
+    @classmethod
+    def instance(cls):
+        """
+        Obté la instància compartida del servei.
+        
+        Returns:
+            TimerService: Instància única
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
+    def __init__(self):
+        """Inicialitza el servei de timers."""
+        super().__init__()
+        self._timers = {}       # interval (ms) -> QTimer
+        self._subscribers = {}  # interval (ms) -> llista de callbacks
+    
+    def subscribe(self, interval_ms, callback):
+        """
+        Registra una funció per ser cridada periòdicament.
+        
+        Args:
+            interval_ms (int): Període en mil·lisegons
+            callback (callable): Funció sense arguments a cridar
+        """
+        callbacks = self._subscribers.setdefault(interval_ms, [])
+        if callback in callbacks:
+            return
+        callbacks.append(callback)
+        
+        # Crear el timer d'aquest interval si encara no existeix
+        timer = self._timers.get(interval_ms)
+        if timer is None:
+            timer = QTimer(self)
+            timer.timeout.connect(lambda: self._dispatch(interval_ms))
+            self._timers[interval_ms] = timer
+        
+        if not timer.isActive():
+            timer.start(interval_ms)
+    
+    def unsubscribe(self, interval_ms, callback):
+        """
+        Elimina una funció registrada i atura el timer si ja no té subscriptors.
+        
+        Args:
+            interval_ms (int): Període amb què es va registrar
+            callback (callable): Funció registrada
+        """
+        callbacks = self._subscribers.get(interval_ms, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+        
+        timer = self._timers.get(interval_ms)
+        if not callbacks and timer is not None and timer.isActive():
+            timer.stop()
+    
+    def is_subscribed(self, interval_ms, callback):
+        """
+        Comprova si una funció està registrada.
+        
+        Args:
+            interval_ms (int): Període
+            callback (callable): Funció
+            
+        Returns:
+            bool: True si està registrada
+        """
+        return callback in self._subscribers.get(interval_ms, ())
+    
+    def _dispatch(self, interval_ms):
+        """Crida tots els subscriptors d'un interval."""
+        for callback in list(self._subscribers.get(interval_ms, ())):
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Error en callback del timer ({interval_ms} ms): {e}")
+    
+    def shutdown(self):
+        """Atura tots els timers i elimina els subscriptors."""
+        for timer in self._timers.values():
+            timer.stop()
+        self._subscribers.clear()
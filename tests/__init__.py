@@ -0,0 +1,6 @@
+"""Proves del projecte (python -m unittest)."""
+
+import os
+
+# Les proves amb widgets s'executen sense pantalla
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
@@ -0,0 +1,40 @@
+"""Proves de la memòria cau de models (modules/utils.py, modules/ai.py)."""
+
+import unittest
+
+from modules import ai
+from modules.utils import LRUCache
+
+
+class LRUCacheTest(unittest.TestCase):
+    """Memòria cau LRU compartida pels gestors d'IA."""
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+
+class SetModelTest(unittest.TestCase):
+    """Canvi de model al gestor d'IA."""
+
+    def test_failed_load_keeps_active_path(self):
+        manager = ai.AIManager({'ai': {'model_path': 'a.pb'}})
+        manager.enabled = False
+        self.assertFalse(manager.set_model('b.pb'))
+        self.assertEqual(manager.model_path, 'a.pb')
+
+    def test_simulated_model_is_not_cached(self):
+        manager = ai.AIManager({'ai': {'model_path': 'a.pb'}})
+        manager._activate_model(None, 'b.pb')
+        self.assertEqual(manager.model_path, 'b.pb')
+        self.assertNotIn('b.pb', manager._model_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""Proves del diàleg de configuració de connexió (ui/connection_config_dialog.py)."""
+
+import unittest
+
+from PyQt5.QtGui import QValidator
+from PyQt5.QtWidgets import QApplication
+
+from ui.connection_config_dialog import (
+    DEFAULT_CONFIG, ConnectionConfigDialog, HostValidator)
+
+
+class HostValidatorTest(unittest.TestCase):
+    """Validació de l'adreça del robot."""
+
+    VALID = (
+        "192.168.1.100",
+        "0.0.0.0",
+        "255.255.255.255",
+        "localhost",
+        "robot.local",
+        "robot-01.lab.example",
+        "::1",
+        "2001:db8::1",
+        "fe80::1%eth0",
+    )
+
+    INVALID = (
+        "",
+        "999.1.1.1",
+        "256.0.0.1",
+        "192.168.1",
+        "1.2.3.4.5",
+        "-robot",
+        "robot-",
+        "robot..local",
+        "::g",
+        "1::2::3",
+    )
+
+    # Caràcters que no poden formar mai una adreça: es rebutgen en escriure
+    REJECTED = (
+        "robot local",
+        "robot_1",
+        "http://robot",
+    )
+
+    def setUp(self):
+        self.validator = HostValidator()
+
+    def _state(self, text):
+        return self.validator.validate(text, len(text))[0]
+
+    def test_valid_addresses(self):
+        for text in self.VALID:
+            with self.subTest(text=text):
+                self.assertEqual(self._state(text), QValidator.Acceptable)
+
+    def test_invalid_addresses(self):
+        for text in self.INVALID:
+            with self.subTest(text=text):
+                self.assertNotEqual(self._state(text), QValidator.Acceptable)
+
+    def test_rejected_characters(self):
+        for text in self.REJECTED:
+            with self.subTest(text=text):
+                self.assertEqual(self._state(text), QValidator.Invalid)
+
+
+class NumericFieldsTest(unittest.TestCase):
+    """Camps numèrics amb valors mal formats a la configuració."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_non_numeric_values_fall_back_to_defaults(self):
+        dialog = ConnectionConfigDialog({'port': '', 'timeout': 'abc', 'host': 'robot'})
+        config = dialog.get_config()
+
+        self.assertEqual(config['port'], DEFAULT_CONFIG['port'])
+        self.assertEqual(config['timeout'], DEFAULT_CONFIG['timeout'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""Proves del mòdul de LiDAR (modules/lidar.py)."""
+
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from modules import lidar
+
+
+class ConeMinDistancesTest(unittest.TestCase):
+    """Distància mínima per con, amb NumPy i amb Numba."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.angles = rng.uniform(-np.pi, np.pi, 500).astype(np.float32)
+        self.distances = rng.uniform(100, 3000, 500).astype(np.float32)
+        # La darrera direcció no té cap punt dins del con
+        self.directions = np.array([-2.0, -0.5, 0.0, 0.7, 3.0, 10.0])
+        self.half_cone = 0.3
+
+    def test_numpy_marks_empty_cones_as_inf(self):
+        result = lidar._cone_min_numpy(
+            self.angles, self.distances, self.directions, self.half_cone)
+
+        self.assertTrue(np.isinf(result[-1]))
+        self.assertTrue(np.isfinite(result[:-1]).all())
+
+    @unittest.skipUnless(lidar.HAS_NUMBA, "Numba no instal·lat")
+    def test_numba_matches_numpy(self):
+        expected = lidar._cone_min_numpy(
+            self.angles, self.distances, self.directions, self.half_cone)
+        result = lidar._cone_min_numba(
+            self.angles, self.distances, self.directions, self.half_cone)
+
+        np.testing.assert_allclose(result, expected)
+        self.assertTrue(np.isinf(result[-1]))
+
+
+class SpatialIndexTest(unittest.TestCase):
+    """Índex espacial construït només quan es consulta."""
+
+    def test_index_is_built_on_first_query(self):
+        data = lidar.LidarData()
+        data.update([(angle, 1000) for angle in range(0, 360, 10)])
+        self.assertIsNone(data._kdtree)
+
+        # Punt a 0 graus i 1000 mm: (1000, 0)
+        self.assertEqual(data.get_obstacles_near(1000, 0, 50), [0])
+        self.assertIsNotNone(data._kdtree)
+
+
+class ObstacleMapThrottleTest(unittest.TestCase):
+    """Mapa d'obstacles amb regeneració limitada i doble buffer."""
+
+    def setUp(self):
+        self.manager = lidar.LidarManager({})
+        self.scan = [(angle, 1000) for angle in range(0, 360, 10)]
+
+    def tearDown(self):
+        self.manager.obstacle_timer.stop()
+
+    def test_every_published_buffer_has_the_latest_map(self):
+        # Un escaneig cada 0.26 s: només es regenera el mapa un de cada dos
+        maps = []
+        for i in range(6):
+            with mock.patch.object(lidar.time, 'time', return_value=100 + 0.26 * i):
+                self.manager.process_data({'type': 'lidar_data', 'data': self.scan})
+            maps.append(self.manager.get_current_data().obstacle_map)
+
+        self.assertTrue(all(m is not None for m in maps))
+        self.assertIs(maps[1], maps[0])
+
+
+class DirectionSafetyCacheTest(unittest.TestCase):
+    """Memòria cau de seguretat per direcció."""
+
+    def setUp(self):
+        self.manager = lidar.LidarManager({})
+        self.manager.process_data({
+            'type': 'lidar_data',
+            'data': [(angle, 1000) for angle in range(0, 360, 10)]})
+
+    def tearDown(self):
+        self.manager.obstacle_timer.stop()
+
+    def test_near_identical_headings_share_an_entry(self):
+        self.manager.get_direction_safety(0.5)
+        self.manager.get_direction_safety(0.5 + 1e-4)
+        self.assertEqual(len(self.manager._safety_cache), 1)
+
+    def test_keeps_caching_once_full(self):
+        size = self.manager.SAFETY_CACHE_SIZE
+        step = self.manager.SAFETY_ANGLE_STEP
+        for i in range(size + 10):
+            self.manager.get_direction_safety(i * step)
+        self.assertEqual(len(self.manager._safety_cache), size)
+        self.assertIn((self.manager.get_current_data().scan_id, size + 9),
+                      self.manager._safety_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
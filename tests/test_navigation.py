@@ -0,0 +1,121 @@
+"""Proves del mòdul de navegació (modules/navigation.py)."""
+
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+from PyQt5.QtCore import QCoreApplication
+
+from modules import navigation
+from modules.navigation import Direction, Mode, NavigationManager
+
+
+class _FakeConnection:
+    """Gestor de connexió que guarda les comandes enviades."""
+
+    def __init__(self):
+        self.connected = True
+        self.commands = []
+
+    def send_command(self, command):
+        self.commands.append(command)
+        return True
+
+
+class _FakeLidarData:
+    def __init__(self):
+        self.angles = np.linspace(-np.pi, np.pi, 36, dtype=np.float32)
+
+
+class _FakeLidar:
+    """Gestor de LiDAR amb una millor direcció fixa."""
+
+    def __init__(self, best_direction=0.0):
+        self.best_direction = best_direction
+        self.obstacle_detected = mock.MagicMock()
+
+    def is_scan_active(self):
+        return True
+
+    def get_current_data(self):
+        return _FakeLidarData()
+
+    def find_best_direction(self, current_direction):
+        return self.best_direction
+
+
+class AutonomousNavigationTest(unittest.TestCase):
+    """Pas de navegació autònoma."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.connection = _FakeConnection()
+        self.lidar = _FakeLidar()
+        self.nav = NavigationManager({})
+        self.nav.setup_components(self.connection, self.lidar)
+        self.nav.set_mode(Mode.AUTONOMOUS)
+        self.connection.commands.clear()
+
+    def tearDown(self):
+        self.nav.cleanup()
+
+    def _actions(self):
+        return [command["action"] for command in self.connection.commands]
+
+    def test_repeated_ticks_send_one_command(self):
+        for _ in range(5):
+            self.nav._auto_navigation_step()
+
+        self.assertEqual(self._actions(), [Direction.FORWARD.value])
+        self.assertEqual(self.nav.current_direction, Direction.FORWARD)
+
+    def test_unchanged_ticks_skip_classification(self):
+        with mock.patch.object(navigation, 'remainder', wraps=math.remainder) as remainder:
+            for _ in range(4):
+                self.nav._auto_navigation_step()
+
+        self.assertEqual(remainder.call_count, 1)
+
+    def test_new_best_direction_sends_turn(self):
+        self.nav._auto_navigation_step()
+        self.lidar.best_direction = 1.0
+        self.nav._auto_navigation_step()
+        self.nav._auto_navigation_step()
+
+        self.assertEqual(self._actions(),
+                         [Direction.FORWARD.value, Direction.LEFT.value])
+
+
+class ManualNavigationTest(unittest.TestCase):
+    """Comandes manuals repetides."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.connection = _FakeConnection()
+        self.nav = NavigationManager({'navigation': {'max_command_rate': 1}})
+        self.nav.setup_components(self.connection, None)
+
+    def tearDown(self):
+        self.nav.cleanup()
+
+    def test_coalesced_repeat_refreshes_auto_stop_clock(self):
+        # La primera repetició gasta l'única crida permesa del segon
+        self.nav.forward()
+        self.nav.forward()
+        self.nav.last_command_time -= 10
+        before = self.nav.last_command_time
+
+        self.assertTrue(self.nav.forward())
+        self.assertEqual(len(self.connection.commands), 2)
+        self.assertGreater(self.nav.last_command_time, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Proves del gestor de sensors (modules/sensors.py)."""
+
+import time
+import unittest
+
+from PyQt5.QtCore import QCoreApplication
+
+from modules.sensors import SensorManager
+
+
+class StatusEmissionTest(unittest.TestCase):
+    """Emissió de l'estat general (sensors_status_updated)."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.sensors = SensorManager({})
+        self.emitted = []
+        self.sensors.sensors_status_updated.connect(
+            lambda status: self.emitted.append(dict(status)))
+
+    def tearDown(self):
+        self.sensors.cleanup()
+
+    def _wait_trailing(self):
+        deadline = time.monotonic() + 1.0
+        while self.sensors._status_trailing.isActive() and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+
+    def test_epsilon_is_per_sensor(self):
+        self.sensors.update_sensor_value('gas', 500.0)
+        # 1 ppm de gas no és rellevant; 1 °C de temperatura sí
+        self.sensors.update_sensor_value('gas', 501.0)
+        self.assertEqual(len(self.emitted), 1)
+
+        self.sensors.update_sensor_value('temperature', 1.0)
+        self.assertEqual(len(self.emitted), 2)
+        self.assertEqual(self.emitted[-1]['temperature'], 1.0)
+
+    def test_small_change_is_emitted_after_the_period(self):
+        self.sensors.update_sensor_value('gas', 500.0)
+        self.sensors.update_sensor_value('gas', 501.0)
+        self.assertEqual(self.emitted[-1]['gas'], 500.0)
+
+        self._wait_trailing()
+
+        self.assertEqual(self.emitted[-1]['gas'], 501.0)
+
+
+
+class AlertRepeatTest(unittest.TestCase):
+    """Alertes repetides dins d'ALERT_PERIOD."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.sensors = SensorManager({})
+        self.alerts = []
+        self.sensors.sensor_alert.connect(
+            lambda sensor_type, message: self.alerts.append(sensor_type))
+
+    def tearDown(self):
+        self.sensors.cleanup()
+
+    def test_worsening_delta_is_per_sensor(self):
+        # 10 ppm més de gas no justifiquen repetir l'alerta; 10 °C més sí
+        for value in (1100.0, 1110.0):
+            self.sensors.update_sensor_value('gas', value)
+        for value in (50.0, 60.0):
+            self.sensors.update_sensor_value('temperature', value)
+
+        self.assertEqual(self.alerts, ['gas', 'temperature', 'temperature'])
+
+    def test_battery_worsens_downwards(self):
+        for value in (15.0, 14.0, 5.0):
+            self.sensors.update_sensor_value('battery', value)
+
+        self.assertEqual(self.alerts, ['battery', 'battery'])
+
+
+if __name__ == '__main__':
+    unittest.main()
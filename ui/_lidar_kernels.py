@@ -0,0 +1,140 @@
+"""
+Nuclis numèrics de la visualització del LiDAR
+=============================================
+Conversió polar -> píxels, cerca del punt més proper i reducció dels núvols
+grans a un punt per píxel, compilades amb Numba si està disponible i amb
+NumPy si no.
+"""
+
+import numpy as np
+
+# Importació opcional de Numba per fusionar els càlculs en una sola passada
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# Taula de cos/sin calculada una sola vegada (resolució de 0.1°). Els escanejos
+# filtrats o mostrejats canvien de longitud i d'angles a cada trama, així que
+# s'indexa per angle quantitzat en lloc de per nombre de mostres.
+LUT_SIZE = 3600
+_LUT_STEPS_PER_RAD = LUT_SIZE / (2 * np.pi)
+_LUT_ANGLES = np.arange(LUT_SIZE) / _LUT_STEPS_PER_RAD
+COS_LUT = np.cos(_LUT_ANGLES).astype(np.float32)
+SIN_LUT = np.sin(_LUT_ANGLES).astype(np.float32)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _polar_to_pixels_numba(angles, dists, scale, cx, cy, cos_lut, sin_lut, steps, out):
+        size = cos_lut.size
+        for i in range(angles.size):
+            k = int(np.rint(angles[i] * steps)) % size
+            r = dists[i] * scale
+            out[i, 0] = int(cx - r * sin_lut[k])
+            out[i, 1] = int(cy - r * cos_lut[k])
+
+    @njit(cache=True, fastmath=True)
+    def _min_dir_numba(angles, dists):
+        best = 0
+        for i in range(1, dists.size):
+            if dists[i] < dists[best]:
+                best = i
+        return angles[best], dists[best]
+
+    @njit(cache=True)
+    def _grid_downsample_numba(pixels, width, height, occ, out):
+        m = 0
+        for i in range(pixels.shape[0]):
+            x = pixels[i, 0]
+            y = pixels[i, 1]
+            if x < 0 or x >= width or y < 0 or y >= height or occ[y, x]:
+                continue
+            occ[y, x] = 1
+            out[m, 0] = x
+            out[m, 1] = y
+            m += 1
+        return m
+
+
+def polar_to_pixels(angles, dists, scale, cx, cy, out):
+    """
+    Converteix mesures polars a píxels de pantalla dins d'un buffer existent.
+
+    El robot és a (cx, cy) mirant amunt: x (endavant) creix cap amunt i
+    y (esquerra) cap a l'esquerra. Els cosinus i sinus surten de COS_LUT i
+    SIN_LUT, sense cap funció trigonomètrica per trama.
+
+    Args:
+        angles (np.ndarray): Angles en radians
+        dists (np.ndarray): Distàncies en mm
+        scale (float): Píxels per mm
+        cx (float): Coordenada x del robot en píxels
+        cy (float): Coordenada y del robot en píxels
+        out (np.ndarray): Buffer int32 (n, 2) on s'escriuen els píxels
+    """
+    if HAS_NUMBA:
+        _polar_to_pixels_numba(angles, dists, scale, cx, cy,
+                               COS_LUT, SIN_LUT, _LUT_STEPS_PER_RAD, out)
+        return
+
+    k = np.rint(angles * _LUT_STEPS_PER_RAD).astype(np.intp)
+    k %= LUT_SIZE
+    r = dists * scale
+    out[:, 0] = cx - r * SIN_LUT[k]
+    out[:, 1] = cy - r * COS_LUT[k]
+
+
+def min_dir(angles, dists):
+    """
+    Troba el punt més proper d'un escaneig.
+
+    Args:
+        angles (np.ndarray): Angles en radians
+        dists (np.ndarray): Distàncies en mm
+
+    Returns:
+        tuple: (angle en radians, distància en mm) o (None, None) si és buit
+    """
+    if dists.size == 0:
+        return None, None
+
+    if HAS_NUMBA:
+        angle, distance = _min_dir_numba(angles, dists)
+        return float(angle), float(distance)
+
+    idx = int(np.argmin(dists))
+    return float(angles[idx]), float(dists[idx])
+
+
+def grid_downsample(pixels, width, height, occ, out):
+    """
+    Es queda amb un sol punt per píxel de pantalla (el primer que hi cau).
+
+    Els punts fora de l'àrea visible es descarten. La màscara d'ocupació es
+    buida aquí a cada crida i el resultat s'escriu al principi de `out`.
+
+    Args:
+        pixels (np.ndarray): Píxels int32 (n, 2)
+        width (int): Amplada de l'àrea de dibuix en píxels
+        height (int): Alçada de l'àrea de dibuix en píxels
+        occ (np.ndarray): Màscara uint8 (height, width) reutilitzada
+        out (np.ndarray): Buffer int32 (n, 2) de sortida
+
+    Returns:
+        int: Nombre de punts escrits a `out`
+    """
+    occ.fill(0)
+    if HAS_NUMBA:
+        return int(_grid_downsample_numba(pixels, width, height, occ, out))
+
+    x = pixels[:, 0]
+    y = pixels[:, 1]
+    inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    idx = np.flatnonzero(inside)
+    _, first = np.unique(y[idx] * width + x[idx], return_index=True)
+    keep = idx[np.sort(first)]
+    m = keep.size
+    out[:m] = pixels[keep]
+    return m
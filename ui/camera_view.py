@@ -0,0 +1,92 @@
+"""
+Visualització de Càmera (CameraView)
+====================================
+Widget que pinta les trames de la càmera directament amb QPainter, sense
+convertir-les a QPixmap ni reescalar-les prèviament.
+"""
+
+import logging
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QImage, QColor
+from PyQt5.QtCore import Qt, QRect
+
+# Configuració de logging
+logger = logging.getLogger("UI.CameraView")
+
+
+class CameraView(QWidget):
+    """
+    Mostra l'última trama rebuda ajustada al widget mantenint la proporció.
+
+    Accepta tant QImage com arrays de NumPy RGB (alt x ample x 3, uint8). En
+    el segon cas la QImage es construeix sobre el mateix buffer, sense còpia,
+    i es manté una referència a l'array mentre la trama és visible.
+    """
+
+    def __init__(self, placeholder="", smooth=True, parent=None):
+        """
+        Inicialitza el widget.
+
+        Args:
+            placeholder (str, optional): Text a mostrar mentre no hi ha trames
+            smooth (bool, optional): Escalat bilineal (True) o pel veí més
+                proper (False). Defaults to True.
+            parent (QWidget, optional): Widget pare
+        """
+        super().__init__(parent)
+        self._placeholder = placeholder
+        self.smooth = smooth
+        self._img = None
+        self._array = None  # Manté viu el buffer de la QImage
+        self._background = QColor(17, 17, 17)
+        self._text_color = QColor(200, 200, 200)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def set_frame(self, frame):
+        """
+        Estableix la trama a mostrar i programa un repintat.
+
+        Args:
+            frame (QImage | np.ndarray): Trama RGB
+        """
+        if isinstance(frame, np.ndarray):
+            if not frame.flags['C_CONTIGUOUS']:
+                frame = np.ascontiguousarray(frame)
+            h, w = frame.shape[:2]
+            self._img = QImage(frame.data, w, h, frame.strides[0], QImage.Format_RGB888)
+            self._array = frame
+        else:
+            self._img = frame
+            self._array = None
+        self.update()
+
+    def clear(self):
+        """Elimina la trama actual i torna a mostrar el text d'espera."""
+        self._img = None
+        self._array = None
+        self.update()
+
+    def has_frame(self):
+        """Indica si hi ha alguna trama a mostrar."""
+        return self._img is not None and not self._img.isNull()
+
+    def paintEvent(self, event):
+        """Pinta la trama centrada i ajustada, o el text d'espera."""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._background)
+
+        if self.has_frame():
+            # Rectangle destí amb la mateixa proporció que la imatge
+            size = self._img.size().scaled(self.size(), Qt.KeepAspectRatio)
+            target = QRect(0, 0, size.width(), size.height())
+            target.moveCenter(self.rect().center())
+            # Només cal filtrar si la imatge es reescala
+            if self.smooth and size != self._img.size():
+                painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.drawImage(target, self._img)
+        elif self._placeholder:
+            painter.setPen(self._text_color)
+            painter.drawText(self.rect(), Qt.AlignCenter, self._placeholder)
+
+        painter.end()
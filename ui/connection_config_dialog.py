@@ -1,9 +1,156 @@
+import functools
+
 from PyQt5.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
-    QPushButton, QLabel, QLineEdit, QCheckBox, QSpinBox,
+    QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
+    QLabel, QLineEdit, QCheckBox, QSpinBox,
     QDialogButtonBox, QComboBox, QTabWidget, QWidget
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QRegularExpression
+from PyQt5.QtGui import QColor, QPalette, QValidator
+from PyQt5.QtNetwork import QAbstractSocket, QHostAddress
+
+# Opcions dels desplegables
+CONNECTION_TYPES = ("TCP/IP", "Serial", "Bluetooth")
+SECURITY_PROTOCOLS = ("Cap", "SSL/TLS", "Personalitzat")
+LOG_LEVELS = ("INFO", "DEBUG", "WARNING", "ERROR")
+HEARTBEAT_ACTIONS = ("Reconnectar", "Notificar", "Ignorar")
+
+# Sintaxi acceptada per a l'adreça del robot: IPv4 amb octets 0-255 o nom de
+# host (etiquetes separades per punts, amb almenys una lletra perquè una
+# adreça IPv4 fora de rang no passi per nom). Les IPv6 les valida QHostAddress.
+IPV4_OR_HOST = QRegularExpression(
+    r"^(?:(?:(?:25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(?:25[0-5]|2[0-4]\d|1?\d?\d)"
+    r"|(?=.*[A-Za-z])"
+    r"[A-Za-z0-9](?:[A-Za-z0-9\-]*[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9\-]*[A-Za-z0-9])?)*)$")
+
+# Caràcters que poden aparèixer mentre s'escriu una adreça (IPv6 amb zona inclosa)
+HOST_CHARS = QRegularExpression(r"^[A-Za-z0-9.:%\-]*$")
+
+# Valors per defecte de tots els camps del diàleg
+DEFAULT_CONFIG = {
+    "host": "192.168.1.100",
+    "port": 9999,
+    "connection_type": "TCP/IP",
+    "timeout": 5,
+    "auto_reconnect": True,
+    "reconnect_interval": 5,
+    "max_reconnect_attempts": 5,
+    "buffer_size": 8192,
+    "security_protocol": "Cap",
+    "log_level": "INFO",
+    "verbose_logging": False,
+    "enable_heartbeat": True,
+    "heartbeat_interval": 5,
+    "heartbeat_timeout": 10,
+    "heartbeat_action": "Reconnectar",
+}
+
+
+class HostValidator(QValidator):
+    """Valida l'adreça del robot: IPv4, IPv6 o nom de host."""
+    
+    def validate(self, text, pos):
+        if not HOST_CHARS.match(text).hasMatch():
+            return QValidator.Invalid, text, pos
+        if IPV4_OR_HOST.match(text).hasMatch():
+            return QValidator.Acceptable, text, pos
+        if ':' in text:
+            address = QHostAddress()
+            if address.setAddress(text) and address.protocol() == QAbstractSocket.IPv6Protocol:
+                return QValidator.Acceptable, text, pos
+        return QValidator.Intermediate, text, pos
+
+
+def _line_edit(placeholder, value):
+    """Crea un QLineEdit amb text d'exemple i valor inicial."""
+    line_edit = QLineEdit(str(value))
+    line_edit.setPlaceholderText(placeholder)
+    return line_edit
+
+
+def _spinbox(minimum, maximum, value, default, step=1):
+    """Crea un QSpinBox amb rang, pas i valor inicial (default si no és numèric)."""
+    spinbox = QSpinBox()
+    spinbox.setRange(minimum, maximum)
+    spinbox.setSingleStep(step)
+    try:
+        spinbox.setValue(int(value))
+    except (ValueError, TypeError):
+        # Valor buit o no numèric a config.ini
+        spinbox.setValue(default)
+    return spinbox
+
+
+def _combo(items, value):
+    """Crea un QComboBox amb les opcions donades i el valor inicial seleccionat."""
+    combo = QComboBox()
+    combo.addItems(items)
+    combo.setCurrentText(str(value))
+    return combo
+
+
+def _checkbox(value):
+    """Crea un QCheckBox amb l'estat inicial."""
+    checkbox = QCheckBox()
+    checkbox.setChecked(bool(value))
+    return checkbox
+
+
+# Camps de la pestanya de connexió: (etiqueta, atribut, constructor, clau)
+_CONNECTION_ROWS = (
+    ("IP del robot:", "ip_input",
+     lambda value: _line_edit("p. ex. 192.168.1.100", value), "host"),
+    ("Port:", "port_input",
+     lambda value: _spinbox(1, 65535, value, DEFAULT_CONFIG["port"]), "port"),
+    # Tipus de connexió (per a futures expansions)
+    ("Tipus de connexió:", "connection_type",
+     lambda value: _combo(CONNECTION_TYPES, value), "connection_type"),
+    ("Temps d'espera (segons):", "timeout_input",
+     lambda value: _spinbox(1, 60, value, DEFAULT_CONFIG["timeout"]), "timeout"),
+    ("Reconnexió automàtica:", "auto_reconnect",
+     _checkbox, "auto_reconnect"),
+)
+
+# Camps de les opcions avançades
+_ADVANCED_ROWS = (
+    ("Interval de reconnexió (segons):", "reconnect_interval",
+     lambda value: _spinbox(1, 60, value, DEFAULT_CONFIG["reconnect_interval"]),
+     "reconnect_interval"),
+    ("Màxim d'intents de reconnexió:", "max_reconnect_attempts",
+     lambda value: _spinbox(1, 100, value, DEFAULT_CONFIG["max_reconnect_attempts"]),
+     "max_reconnect_attempts"),
+    ("Mida del buffer (bytes):", "buffer_size",
+     lambda value: _spinbox(1024, 65536, value, DEFAULT_CONFIG["buffer_size"],
+                            step=1024), "buffer_size"),
+    # Protocol d'encriptació (per a futures expansions)
+    ("Protocol de seguretat:", "security_protocol",
+     lambda value: _combo(SECURITY_PROTOCOLS, value), "security_protocol"),
+)
+
+# Camps de depuració i logs
+_DEBUG_ROWS = (
+    ("Nivell de log:", "log_level",
+     lambda value: _combo(LOG_LEVELS, value), "log_level"),
+    # Activar logs detallats de comunicació
+    ("Logs detallats de comunicació:", "verbose_logging",
+     _checkbox, "verbose_logging"),
+)
+
+# Camps de la pestanya de heartbeat
+_HEARTBEAT_ROWS = (
+    ("Activar heartbeat:", "enable_heartbeat",
+     _checkbox, "enable_heartbeat"),
+    ("Interval (segons):", "heartbeat_interval",
+     lambda value: _spinbox(1, 60, value, DEFAULT_CONFIG["heartbeat_interval"]),
+     "heartbeat_interval"),
+    ("Timeout (segons):", "heartbeat_timeout",
+     lambda value: _spinbox(2, 120, value, DEFAULT_CONFIG["heartbeat_timeout"]),
+     "heartbeat_timeout"),
+    # Acció en cas de timeout
+    ("Acció en timeout:", "heartbeat_action",
+     lambda value: _combo(HEARTBEAT_ACTIONS, value), "heartbeat_action"),
+)
+
 
 class ConnectionConfigDialog(QDialog):
     """
@@ -27,7 +174,9 @@ class ConnectionConfigDialog(QDialog):
             current_config = {}
         
         self.setWindowTitle("Configuració de Connexió")
-        self.setMinimumWidth(400)
+        
+        # Evitar passades de disseny intermèdies mentre s'afegeixen els camps
+        self.setUpdatesEnabled(False)
         
         # Crear el layout principal amb pestanyes
         self.tab_widget = QTabWidget()
@@ -43,10 +192,17 @@ class ConnectionConfigDialog(QDialog):
         self.tab_widget.addTab(self.advanced_tab, "Opcions Avançades")
         self.tab_widget.addTab(self.heartbeat_tab, "Heartbeat")
         
-        # Configurar cada pestanya
-        self._setup_connection_tab(current_config)
-        self._setup_advanced_tab(current_config)
-        self._setup_heartbeat_tab(current_config)
+        # Configurar només la pestanya bàsica; la resta es construeixen
+        # la primera vegada que es mostren
+        self._config = current_config
+        # Configuració viva: els senyals dels camps l'actualitzen a mesura
+        # que l'usuari edita, i les pestanyes no obertes conserven l'original
+        self._config_cache = {key: current_config.get(key, default)
+                              for key, default in DEFAULT_CONFIG.items()}
+        self._parent_ref = parent
+        self._built = {0: True, 1: False, 2: False}
+        self._setup_connection_tab()
+        self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
         # Botó de desar i cancel·lar
         self.button_box = QDialogButtonBox(QDialogButtonBox.Save | QDialogButtonBox.Cancel)
@@ -54,54 +210,43 @@ class ConnectionConfigDialog(QDialog):
         self.button_box.rejected.connect(self.reject)
         self.main_layout.addWidget(self.button_box)
         
-        # Configurar mida
+        # No permetre desar una adreça amb sintaxi invàlida
+        self.ip_input.textChanged.connect(self._update_save_enabled)
+        self._update_save_enabled()
+        
+        self.setUpdatesEnabled(True)
+        
+        # Configurar mida, un cop afegits tots els widgets
+        self.setMinimumWidth(400)
         self.resize(450, 350)
     
-    def _setup_connection_tab(self, config):
+    def _update_save_enabled(self):
+        """Habilita el botó de desar només si l'adreça és vàlida."""
+        self.button_box.button(QDialogButtonBox.Save).setEnabled(
+            self.ip_input.hasAcceptableInput())
+    
+    def _on_tab_changed(self, index):
+        """Construeix una pestanya secundària el primer cop que es selecciona."""
+        if self._built.get(index, True):
+            return
+        
+        if index == 1:
+            self._setup_advanced_tab()
+        elif index == 2:
+            self._setup_heartbeat_tab()
+        
+        self._built[index] = True
+    
+    def _setup_connection_tab(self):
         """Configura la pestanya de connexió bàsica."""
         layout = QVBoxLayout(self.connection_tab)
         
         # Grup de configuració de connexió
         connection_group = QGroupBox("Paràmetres de connexió")
-        connection_layout = QGridLayout()
-        
-        # IP del robot
-        connection_layout.addWidget(QLabel("IP del robot:"), 0, 0)
-        self.ip_input = QLineEdit()
-        self.ip_input.setText(config.get("host", "192.168.1.100"))
-        self.ip_input.setPlaceholderText("p. ex. 192.168.1.100")
-        connection_layout.addWidget(self.ip_input, 0, 1)
-        
-        # Port
-        connection_layout.addWidget(QLabel("Port:"), 1, 0)
-        self.port_input = QLineEdit()
-        self.port_input.setText(str(config.get("port", 9999)))
-        self.port_input.setPlaceholderText("p. ex. 9999")
-        connection_layout.addWidget(self.port_input, 1, 1)
-        
-        # Tipus de connexió (per a futures expansions)
-        connection_layout.addWidget(QLabel("Tipus de connexió:"), 2, 0)
-        self.connection_type = QComboBox()
-        self.connection_type.addItems(["TCP/IP", "Serial", "Bluetooth"])
-        # Seleccionar el tipus actual
-        current_type = config.get("connection_type", "TCP/IP")
-        index = self.connection_type.findText(current_type)
-        if index >= 0:
-            self.connection_type.setCurrentIndex(index)
-        connection_layout.addWidget(self.connection_type, 2, 1)
-        
-        # Temps d'espera de connexió
-        connection_layout.addWidget(QLabel("Temps d'espera (segons):"), 3, 0)
-        self.timeout_input = QSpinBox()
-        self.timeout_input.setRange(1, 60)
-        self.timeout_input.setValue(config.get("timeout", 5))
-        connection_layout.addWidget(self.timeout_input, 3, 1)
-        
-        # Reconnexió automàtica
-        connection_layout.addWidget(QLabel("Reconnexió automàtica:"), 4, 0)
-        self.auto_reconnect = QCheckBox()
-        self.auto_reconnect.setChecked(config.get("auto_reconnect", True))
-        connection_layout.addWidget(self.auto_reconnect, 4, 1)
+        connection_layout = QFormLayout()
+        
+        self._build_form(connection_layout, _CONNECTION_ROWS)
+        self.ip_input.setValidator(HostValidator(self))
         
         connection_group.setLayout(connection_layout)
         layout.addWidget(connection_group)
@@ -110,16 +255,12 @@ class ConnectionConfigDialog(QDialog):
         status_group = QGroupBox("Estat actual")
         status_layout = QHBoxLayout()
         
-        status_text = "Desconnectat"
-        status_color = "red"
-        
-        if hasattr(self.parent(), "connection_manager") and self.parent().connection_manager:
-            if getattr(self.parent().connection_manager, "connected", False):
-                status_text = f"Connectat a {config.get('host', '?')}:{config.get('port', '?')}"
-                status_color = "green"
-        
-        status_label = QLabel(f"<span style='color: {status_color};'>{status_text}</span>")
-        status_layout.addWidget(status_label)
+        # Text pla amb el color a la paleta (evita el motor de text enriquit).
+        # L'estat real es consulta després del primer pintat del diàleg.
+        self._status_label = QLabel("…")
+        self._status_label.setTextFormat(Qt.PlainText)
+        status_layout.addWidget(self._status_label)
+        QTimer.singleShot(0, self._refresh_status_label)
         
         status_group.setLayout(status_layout)
         layout.addWidget(status_group)
@@ -127,68 +268,39 @@ class ConnectionConfigDialog(QDialog):
         # Espai flexible
         layout.addStretch()
     
-    def _setup_advanced_tab(self, config):
+    def _refresh_status_label(self):
+        """Consulta l'estat de connexió del pare i actualitza l'etiqueta."""
+        status_text = "Desconnectat"
+        status_color = "red"
+        
+        connection_manager = getattr(self._parent_ref, "connection_manager", None)
+        if connection_manager and getattr(connection_manager, "connected", False):
+            status_text = f"Connectat a {self._config.get('host', '?')}:{self._config.get('port', '?')}"
+            status_color = "green"
+        
+        self._status_label.setText(status_text)
+        palette = self._status_label.palette()
+        palette.setColor(QPalette.WindowText, QColor(status_color))
+        self._status_label.setPalette(palette)
+    
+    def _setup_advanced_tab(self):
         """Configura la pestanya d'opcions avançades."""
         layout = QVBoxLayout(self.advanced_tab)
         
         # Grup d'opcions avançades
         advanced_group = QGroupBox("Opcions avançades")
-        advanced_layout = QGridLayout()
-        
-        # Interval de reconnexió
-        advanced_layout.addWidget(QLabel("Interval de reconnexió (segons):"), 0, 0)
-        self.reconnect_interval = QSpinBox()
-        self.reconnect_interval.setRange(1, 60)
-        self.reconnect_interval.setValue(config.get("reconnect_interval", 5))
-        advanced_layout.addWidget(self.reconnect_interval, 0, 1)
-        
-        # Nombre màxim d'intents
-        advanced_layout.addWidget(QLabel("Màxim d'intents de reconnexió:"), 1, 0)
-        self.max_reconnect_attempts = QSpinBox()
-        self.max_reconnect_attempts.setRange(1, 100)
-        self.max_reconnect_attempts.setValue(config.get("max_reconnect_attempts", 5))
-        advanced_layout.addWidget(self.max_reconnect_attempts, 1, 1)
-        
-        # Mida del buffer
-        advanced_layout.addWidget(QLabel("Mida del buffer (bytes):"), 2, 0)
-        self.buffer_size = QSpinBox()
-        self.buffer_size.setRange(1024, 65536)
-        self.buffer_size.setSingleStep(1024)
-        self.buffer_size.setValue(config.get("buffer_size", 8192))
-        advanced_layout.addWidget(self.buffer_size, 2, 1)
-        
-        # Protocol d'encriptació (per a futures expansions)
-        advanced_layout.addWidget(QLabel("Protocol de seguretat:"), 3, 0)
-        self.security_protocol = QComboBox()
-        self.security_protocol.addItems(["Cap", "SSL/TLS", "Personalitzat"])
-        current_protocol = config.get("security_protocol", "Cap")
-        index = self.security_protocol.findText(current_protocol)
-        if index >= 0:
-            self.security_protocol.setCurrentIndex(index)
-        advanced_layout.addWidget(self.security_protocol, 3, 1)
+        advanced_layout = QFormLayout()
+        
+        self._build_form(advanced_layout, _ADVANCED_ROWS)
         
         advanced_group.setLayout(advanced_layout)
         layout.addWidget(advanced_group)
         
         # Opcions per a logs i depuració
         debug_group = QGroupBox("Depuració i logs")
-        debug_layout = QGridLayout()
-        
-        # Nivell de log
-        debug_layout.addWidget(QLabel("Nivell de log:"), 0, 0)
-        self.log_level = QComboBox()
-        self.log_level.addItems(["INFO", "DEBUG", "WARNING", "ERROR"])
-        current_level = config.get("log_level", "INFO")
-        index = self.log_level.findText(current_level)
-        if index >= 0:
-            self.log_level.setCurrentIndex(index)
-        debug_layout.addWidget(self.log_level, 0, 1)
-        
-        # Activar logs detallats de comunicació
-        debug_layout.addWidget(QLabel("Logs detallats de comunicació:"), 1, 0)
-        self.verbose_logging = QCheckBox()
-        self.verbose_logging.setChecked(config.get("verbose_logging", False))
-        debug_layout.addWidget(self.verbose_logging, 1, 1)
+        debug_layout = QFormLayout()
+        
+        self._build_form(debug_layout, _DEBUG_ROWS)
         
         debug_group.setLayout(debug_layout)
         layout.addWidget(debug_group)
@@ -196,43 +308,15 @@ class ConnectionConfigDialog(QDialog):
         # Espai flexible
         layout.addStretch()
     
-    def _setup_heartbeat_tab(self, config):
+    def _setup_heartbeat_tab(self):
         """Configura la pestanya de heartbeat."""
         layout = QVBoxLayout(self.heartbeat_tab)
         
         # Grup de configuració de heartbeat
         heartbeat_group = QGroupBox("Configuració de Heartbeat")
-        heartbeat_layout = QGridLayout()
-        
-        # Activar heartbeat
-        heartbeat_layout.addWidget(QLabel("Activar heartbeat:"), 0, 0)
-        self.enable_heartbeat = QCheckBox()
-        self.enable_heartbeat.setChecked(config.get("enable_heartbeat", True))
-        heartbeat_layout.addWidget(self.enable_heartbeat, 0, 1)
-        
-        # Interval de heartbeat
-        heartbeat_layout.addWidget(QLabel("Interval (segons):"), 1, 0)
-        self.heartbeat_interval = QSpinBox()
-        self.heartbeat_interval.setRange(1, 60)
-        self.heartbeat_interval.setValue(config.get("heartbeat_interval", 5))
-        heartbeat_layout.addWidget(self.heartbeat_interval, 1, 1)
-        
-        # Timeout de heartbeat
-        heartbeat_layout.addWidget(QLabel("Timeout (segons):"), 2, 0)
-        self.heartbeat_timeout = QSpinBox()
-        self.heartbeat_timeout.setRange(2, 120)
-        self.heartbeat_timeout.setValue(config.get("heartbeat_timeout", 10))
-        heartbeat_layout.addWidget(self.heartbeat_timeout, 2, 1)
-        
-        # Acció en cas de timeout
-        heartbeat_layout.addWidget(QLabel("Acció en timeout:"), 3, 0)
-        self.heartbeat_action = QComboBox()
-        self.heartbeat_action.addItems(["Reconnectar", "Notificar", "Ignorar"])
-        current_action = config.get("heartbeat_action", "Reconnectar")
-        index = self.heartbeat_action.findText(current_action)
-        if index >= 0:
-            self.heartbeat_action.setCurrentIndex(index)
-        heartbeat_layout.addWidget(self.heartbeat_action, 3, 1)
+        heartbeat_layout = QFormLayout()
+        
+        self._build_form(heartbeat_layout, _HEARTBEAT_ROWS)
         
         heartbeat_group.setLayout(heartbeat_layout)
         layout.addWidget(heartbeat_group)
@@ -240,6 +324,47 @@ class ConnectionConfigDialog(QDialog):
         # Espai flexible
         layout.addStretch()
     
+    def _build_form(self, layout, rows):
+        """
+        Omple un QFormLayout (etiqueta, camp) a partir d'una taula de camps.
+        
+        Args:
+            layout (QFormLayout): Layout a omplir
+            rows (tuple): Tuples (etiqueta, atribut, constructor a partir del valor, clau de configuració)
+        """
+        # Noms locals: s'usen un cop per camp dins del bucle
+        add_row = layout.addRow
+        bind_value = self._bind_value
+        cache = self._config_cache
+        for label, attr, factory, key in rows:
+            widget = factory(cache[key])
+            bind_value(widget, key)
+            setattr(self, attr, widget)
+            add_row(label, widget)
+    
+    def _bind_value(self, widget, key):
+        """
+        Desa el valor normalitzat del camp a la configuració viva i el manté
+        actualitzat amb el senyal de canvi corresponent.
+        
+        Args:
+            widget (QWidget): Camp del diàleg
+            key (str): Clau de configuració
+        """
+        setter = functools.partial(self._config_cache.__setitem__, key)
+        if isinstance(widget, QLineEdit):
+            setter(widget.text())
+            widget.textChanged.connect(setter)
+        elif isinstance(widget, QSpinBox):
+            setter(widget.value())
+            widget.valueChanged.connect(setter)
+        elif isinstance(widget, QComboBox):
+            setter(widget.currentText())
+            widget.currentTextChanged.connect(setter)
+        elif isinstance(widget, QCheckBox):
+            setter(widget.isChecked())
+            widget.toggled.connect(setter)
+    
     def get_config(self):
         """
         Obté la configuració actual del diàleg.
@@ -247,27 +372,4 @@ class ConnectionConfigDialog(QDialog):
         Returns:
             dict: Configuració actualitzada
         """
-        config = {
-            # Pestanya de connexió bàsica
-            "host": self.ip_input.text(),
-            "port": int(self.port_input.text()),
-            "connection_type": self.connection_type.currentText(),
-            "timeout": self.timeout_input.value(),
-            "auto_reconnect": self.auto_reconnect.isChecked(),
-            
-            # Pestanya d'opcions avançades
-            "reconnect_interval": self.reconnect_interval.value(),
-            "max_reconnect_attempts": self.max_reconnect_attempts.value(),
-            "buffer_size": self.buffer_size.value(),
-            "security_protocol": self.security_protocol.currentText(),
-            "log_level": self.log_level.currentText(),
-            "verbose_logging": self.verbose_logging.isChecked(),
-            
-            # Pestanya de heartbeat
-            "enable_heartbeat": self.enable_heartbeat.isChecked(),
-            "heartbeat_interval": self.heartbeat_interval.value(),
-            "heartbeat_timeout": self.heartbeat_timeout.value(),
-            "heartbeat_action": self.heartbeat_action.currentText()
-        }
-        
-        return config
+        return dict(self._config_cache)
@@ -0,0 +1,89 @@
+"""
+Model de Deteccions (DetectionsModel)
+=====================================
+Model de taula per a la llista d'objectes detectats per la IA. Les files es
+guarden com a tuples i només es converteixen a text quan la vista les pinta.
+"""
+
+from collections import deque
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+
+
+class DetectionsModel(QAbstractTableModel):
+    """
+    Taula (objecte, confiança, posició) amb un nombre màxim de files.
+    Les deteccions més antigues es descarten quan s'arriba al límit.
+    """
+
+    HEADERS = ("Objecte", "Confiança", "Posició")
+
+    def __init__(self, max_rows=10, parent=None):
+        """
+        Inicialitza el model.
+
+        Args:
+            max_rows (int, optional): Nombre màxim de files. Defaults to 10.
+            parent (QObject, optional): Objecte pare
+        """
+        super().__init__(parent)
+        self.max_rows = max_rows
+        self._rows = deque()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return QVariant()
+
+        object_type, confidence, position = self._rows[index.row()]
+        column = index.column()
+        if column == 0:
+            return object_type
+        if column == 1:
+            return f"{confidence:.2f}"
+        return position
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return QVariant()
+
+    def add_detection(self, object_type, confidence, position):
+        """
+        Afegeix una detecció al final i descarta la més antiga si cal.
+
+        Args:
+            object_type (str): Tipus d'objecte
+            confidence (float): Confiança de la detecció (0-1)
+            position (str): Posició de l'objecte
+        """
+        if len(self._rows) >= self.max_rows:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._rows.popleft()
+            self.endRemoveRows()
+
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append((object_type, confidence, position))
+        self.endInsertRows()
+
+    def set_rows(self, rows):
+        """
+        Substitueix totes les deteccions de cop (una sola notificació a la vista).
+
+        Args:
+            rows (iterable): Tuples (objecte, confiança, posició)
+        """
+        self.beginResetModel()
+        self._rows = deque(rows)
+        while len(self._rows) > self.max_rows:
+            self._rows.popleft()
+        self.endResetModel()
+
+    def clear(self):
+        """Elimina totes les deteccions."""
+        self.set_rows(())
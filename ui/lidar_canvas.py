@@ -0,0 +1,236 @@
+"""
+Visualització del LiDAR (LidarCanvas)
+=====================================
+Widget lleuger que dibuixa el núvol de punts del LiDAR directament amb
+QPainter, sense passar pel pipeline de rasteritzat de Matplotlib.
+"""
+
+import logging
+import numpy as np
+from PyQt5.QtWidgets import QWidget
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygon
+from PyQt5.QtCore import Qt, QPoint, QPointF
+
+from ui._lidar_kernels import polar_to_pixels, grid_downsample
+
+# Configuració de logging
+logger = logging.getLogger("UI.LidarCanvas")
+
+
+class _PolygonBuffer:
+    """
+    QPolygon reutilitzable amb una vista int32 (n, 2) sobre les seves dades.
+
+    QPolygon conserva la memòria reservada quan s'encongeix, així que canviar
+    el nombre de punts entre trames no reserva memòria nova mentre no se
+    superi el màxim ja vist.
+    """
+
+    def __init__(self):
+        self.polygon = QPolygon()
+        self._address = 0
+        self._view = np.empty((0, 2), dtype=np.int32)
+
+    def view(self, n):
+        """
+        Redimensiona el polígon a n punts i en retorna la vista de NumPy.
+
+        Args:
+            n (int): Nombre de punts
+
+        Returns:
+            np.ndarray: Vista int32 (n, 2) sobre les dades del polígon
+        """
+        if self.polygon.size() != n:
+            self.polygon.fill(QPoint(), n)
+        if not n:
+            return self._view[:0]
+
+        # Només cal una vista nova si el buffer de Qt s'ha mogut o ha crescut
+        ptr = self.polygon.data()
+        if int(ptr) != self._address or self._view.shape[0] < n:
+            ptr.setsize(n * 2 * np.dtype(np.int32).itemsize)
+            self._view = np.frombuffer(ptr, dtype=np.int32).reshape(n, 2)
+            self._address = int(ptr)
+        return self._view[:n]
+
+    def truncate(self, m):
+        """Es queda amb els m primers punts sense alliberar memòria."""
+        size = self.polygon.size()
+        if m < size:
+            self.polygon.remove(m, size - m)
+
+
+class LidarCanvas(QWidget):
+    """
+    Dibuixa un escaneig del LiDAR en vista cartesiana o polar.
+
+    El robot és al centre mirant amunt (x endavant, y esquerra). Els punts
+    s'escriuen en QPolygons reutilitzats a través de vistes de NumPy, de
+    manera que no es crea cap QPoint per punt ni es reserva memòria per trama.
+    """
+
+    CARTESIAN = 0
+    POLAR = 1
+
+    # Separació de la quadrícula en mm (vista cartesiana)
+    GRID_STEP = 500
+    # Nombre d'anells de distància (vista polar)
+    POLAR_RINGS = 4
+    # Marge en píxels al voltant de l'àrea de dibuix
+    MARGIN = 10
+    # A partir d'aquest nombre de punts es dibuixa només un punt per píxel
+    DOWNSAMPLE_MIN = 2000
+
+    def __init__(self, mode=CARTESIAN, max_range=3000, parent=None):
+        """
+        Inicialitza el widget.
+
+        Args:
+            mode (int, optional): LidarCanvas.CARTESIAN o LidarCanvas.POLAR
+            max_range (float, optional): Rang màxim representat en mm
+            parent (QWidget, optional): Widget pare
+        """
+        super().__init__(parent)
+        self.mode = mode
+        self.max_range = max_range
+        self.show_obstacles = True
+
+        # Últim escaneig rebut
+        self._angles = np.empty(0, dtype=np.float32)
+        self._distances = np.empty(0, dtype=np.float32)
+        self._nearest = None
+
+        # Punts en píxels (tots i, per als núvols grans, un per píxel)
+        self._pixels = _PolygonBuffer()
+        self._reduced = _PolygonBuffer()
+
+        # Màscara d'ocupació per píxel dels núvols grans
+        self._occ = np.zeros((0, 0), dtype=np.uint8)
+
+        # Estils
+        self._background = QColor(255, 255, 255)
+        self._grid_pen = QPen(QColor(220, 220, 220))
+        self._point_pen = QPen(QColor(0, 90, 200), 3)
+        self._line_pen = QPen(QColor(0, 90, 200), 1)
+        self._robot_pen = QPen(QColor(0, 160, 0), 2)
+        self._obstacle_pen = QPen(QColor(220, 0, 0), 2)
+
+        self.setMinimumSize(200, 200)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+
+    def set_scan(self, angles, distances, nearest=None, max_range=None):
+        """
+        Estableix l'escaneig a dibuixar i programa un repintat.
+
+        Args:
+            angles (np.ndarray): Angles en radians
+            distances (np.ndarray): Distàncies en mm
+            nearest (tuple, optional): (angle, distància) de l'obstacle més proper
+            max_range (float, optional): Rang màxim en mm
+        """
+        self._angles = angles
+        self._distances = distances
+        self._nearest = nearest
+        if max_range:
+            self.max_range = max_range
+        self.update()
+
+    def set_show_obstacles(self, show):
+        """Mostra o amaga el marcador de l'obstacle més proper."""
+        self.show_obstacles = bool(show)
+        self.update()
+
+    def _downsample(self, pixels):
+        """
+        Redueix els punts a un per píxel visible.
+
+        Args:
+            pixels (np.ndarray): Píxels int32 (n, 2) de l'escaneig
+
+        Returns:
+            QPolygon: Punts a dibuixar
+        """
+        h, w = self.height(), self.width()
+        if self._occ.shape != (h, w):
+            self._occ = np.zeros((h, w), dtype=np.uint8)
+
+        out = self._reduced.view(pixels.shape[0])
+        self._reduced.truncate(grid_downsample(pixels, w, h, self._occ, out))
+        return self._reduced.polygon
+
+    def paintEvent(self, event):
+        """Dibuixa la quadrícula, el robot, els punts i l'obstacle més proper."""
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self._background)
+
+        cx = self.width() / 2
+        cy = self.height() / 2
+        radius = max(min(cx, cy) - self.MARGIN, 1)
+        scale = radius / self.max_range
+
+        if self.mode == self.POLAR:
+            self._draw_polar_grid(painter, cx, cy, radius)
+        else:
+            self._draw_cartesian_grid(painter, cx, cy, scale)
+
+        # Robot al centre
+        painter.setPen(self._robot_pen)
+        painter.drawEllipse(QPointF(cx, cy), 5, 5)
+
+        angles = self._angles
+        distances = self._distances
+        n = distances.shape[0]
+        if n:
+            if self.mode == self.POLAR:
+                # Contorn continu: ordenar per angle (l'escaneig pot estar mostrejat)
+                order = np.argsort(angles)
+                angles = angles[order]
+                distances = distances[order]
+
+            # Escriure els píxels directament al buffer del QPolygon
+            pixels = self._pixels.view(n)
+            polar_to_pixels(angles, distances, scale, cx, cy, pixels)
+
+            if self.mode == self.POLAR:
+                painter.setPen(self._line_pen)
+                painter.drawPolyline(self._pixels.polygon)
+            painter.setPen(self._point_pen)
+            if n >= self.DOWNSAMPLE_MIN:
+                painter.drawPoints(self._downsample(pixels))
+            else:
+                painter.drawPoints(self._pixels.polygon)
+
+        # Obstacle més proper
+        if self.show_obstacles and self._nearest and self._nearest[0] is not None:
+            angle, distance = self._nearest
+            r = distance * scale
+            painter.setPen(self._obstacle_pen)
+            painter.drawEllipse(
+                QPointF(cx - r * np.sin(angle), cy - r * np.cos(angle)), 6, 6)
+
+        painter.end()
+
+    def _draw_cartesian_grid(self, painter, cx, cy, scale):
+        """Dibuixa una quadrícula regular cada GRID_STEP mm."""
+        painter.setPen(self._grid_pen)
+        step = self.GRID_STEP * scale
+        if step < 4:
+            return
+        w, h = self.width(), self.height()
+        k = int(max(cx, cy) / step) + 1
+        for i in range(-k, k + 1):
+            x = cx + i * step
+            y = cy + i * step
+            painter.drawLine(QPointF(x, 0), QPointF(x, h))
+            painter.drawLine(QPointF(0, y), QPointF(w, y))
+
+    def _draw_polar_grid(self, painter, cx, cy, radius):
+        """Dibuixa anells de distància i els eixos principals."""
+        painter.setPen(self._grid_pen)
+        center = QPointF(cx, cy)
+        for i in range(1, self.POLAR_RINGS + 1):
+            r = radius * i / self.POLAR_RINGS
+            painter.drawEllipse(center, r, r)
+        painter.drawLine(QPointF(cx - radius, cy), QPointF(cx + radius, cy))
+        painter.drawLine(QPointF(cx, cy - radius), QPointF(cx, cy + radius))
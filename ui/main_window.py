@@ -9,8 +9,14 @@ import os
 import time
 import logging
 import json
+import csv
+import math
+import platform
+import subprocess
+from functools import partial
 import numpy as np
 from datetime import datetime
+from pathlib import Path
 from PyQt5.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -35,21 +41,156 @@ from PyQt5.QtWidgets import (
     QInputDialog,
     QApplication,
     QListWidget,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QAbstractItemView,
     QCheckBox,
     QStackedWidget,
-    QCalendarWidget)
-from PyQt5.QtGui import QIcon, QPixmap, QImage, QColor, QPalette
-from PyQt5.QtCore import Qt, QSize, pyqtSlot, QTimer, QLocale, QDate, QDateTime
+    QDateEdit)
+from PyQt5.QtGui import QIcon, QImage, QColor, QPalette
+from PyQt5.QtCore import (
+    Qt, QSize, pyqtSignal, pyqtSlot, QTimer, QLocale, QDate, QDateTime,
+    QRunnable, QThreadPool)
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from ui.lidar_canvas import LidarCanvas
+from ui._lidar_kernels import min_dir
+from ui.camera_view import CameraView
+from ui.detections_model import DetectionsModel
+from ui.connection_config_dialog import ConnectionConfigDialog
+
 # Configuració de logging
 logger = logging.getLogger("UI.MainWindow")
 
+# Diàleg de projectes (opcional: només es fa servir amb base de dades)
+try:
+    from ui.project_dialog import ProjectDialog
+except ImportError as e:
+    ProjectDialog = None
+    logger.warning(f"Diàleg de projectes no disponible: {e}")
+
+# Factors de conversió per a la visualització (radiants -> graus, mm -> m)
+_RAD2DEG = 180.0 / math.pi
+_MM2M = 1.0 / 1000.0
+
+# Estils dels panells de sensors per tipus
+_SENSOR_STYLES = {
+    'temperature': "background-color: #ffe0e0; border: 1px solid #ffb0b0; border-radius: 5px;",
+    'humidity': "background-color: #e0f0ff; border: 1px solid #b0d0ff; border-radius: 5px;",
+    'gas': "background-color: #e0ffe0; border: 1px solid #b0ffb0; border-radius: 5px;",
+    'co': "background-color: #fff0e0; border: 1px solid #ffd0b0; border-radius: 5px;",
+    'smoke': "background-color: #f0e0ff; border: 1px solid #d0b0ff; border-radius: 5px;",
+    'battery': "background-color: #e0ffff; border: 1px solid #b0ffff; border-radius: 5px;"
+}
+
+# Posició de l'obstacle indexada per (angle > 0.5) + 2 * (angle < -0.5)
+_POSITIONS = ("davant", "esquerra", "dreta", "davant")
+
+# Rutes de recursos, relatives a l'arrel del projecte
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+_ICON_PATH = _ROOT_DIR / "resources" / "icons" / "robot_icon.png"
+_MODELS_DIR = _ROOT_DIR / "models"
+_MANUAL_PATH = _ROOT_DIR / "docs" / "manual.pdf"
+
+# Barra de menú: (títol, entrades). Cada entrada és (text, drecera, mètode)
+# o None per a un separador
+_MENU_SPEC = (
+    ("&Arxiu", (
+        ("&Projectes", "Ctrl+P", "_manage_projects"),
+        ("&Guardar configuració", "Ctrl+S", "_save_config"),
+        ("&Carregar configuració", "Ctrl+L", "_load_config"),
+        None,
+        ("&Sortir", "Ctrl+Q", "close"),
+    )),
+    ("&Eines", (
+        ("&Calibrar sensors", None, "_calibrate_sensors"),
+        ("&Reiniciar connexió", None, "_reconnect"),
+        ("&Capturar pantalla", "F12", "_take_screenshot"),
+        None,
+        ("&Preferències", None, "_show_preferences"),
+    )),
+    ("&Visualització", (
+        ("Tema &fosc", None, "_toggle_theme"),
+    )),
+    ("A&juda", (
+        ("&Manual d'usuari", None, "_show_manual"),
+        ("&Sobre", None, "_show_about"),
+    )),
+)
+
+# Sensors configurables al panell de configuració: clau -> (nom, unitat)
+_CONFIG_SENSORS = {
+    'mq2': ("MQ-002 (Gas)", "ppm"),
+    'mq135': ("MQ-135 (Qualitat aire)", "ppm"),
+    'k001': ("K-001 (Temperatura)", "°C"),
+    'k026': ("K-026 (Flama)", ""),
+    'k36': ("K-36 (So)", "dB"),
+    'gy521': ("GY-521 (MPU6050)", ""),
+}
+
+# Modes de navegació per índex del combo
+_NAV_MODES = {0: "manual", 1: "assisted", 2: "autonomous"}
+
+# Modes de processament de càmera per índex del combo
+_CAMERA_PROCESSING = {
+    0: None,  # Cap
+    1: "edge",  # Vores
+    2: "motion",  # Moviment
+    3: "thermal"  # Tèrmic
+}
+
+# Sensors de gas amb calibració: (clau, nom curt)
+_GAS_SENSORS = (('mq2', "MQ-002"), ('mq135', "MQ-135"))
+
+# Accions del submenú Vista LiDAR, en l'ordre de lidar_view_stack
+_LIDAR_VIEW_ACTIONS = ("&Cartesiana", "&Polar", "&Combinada")
+
+
+
+def _dict_get(mapping, key):
+    """Retorna mapping[key] si és un diccionari, o un diccionari buit."""
+    value = mapping.get(key)
+    return value if isinstance(value, dict) else {}
+
+
+def _dict_entry(mapping, key):
+    """Retorna mapping[key] com a diccionari, creant-lo si no existeix o no ho és."""
+    value = mapping.get(key)
+    if not isinstance(value, dict):
+        value = mapping[key] = {}
+    return value
+
+
+class _ImageSaveRunnable(QRunnable):
+    """Tasca que codifica i desa una QImage fora del fil de la interfície."""
+
+    def __init__(self, image, filepath, done_signal):
+        super().__init__()
+        self.image = image
+        self.filepath = filepath
+        self.done_signal = done_signal
+
+    def run(self):
+        error = ""
+        try:
+            if not self.image.save(self.filepath):
+                error = f"no s'ha pogut escriure {self.filepath}"
+        except Exception as e:
+            error = str(e)
+        self.done_signal.emit(self.filepath, error)
+
+
+# Nombre de lectures guardades a l'historial de cada sensor
+_HISTORY_SAMPLES = 120
+
+# Color de la línia de l'historial per tipus de sensor
+_HISTORY_COLORS = {
+    'temperature': 'red',
+    'humidity': 'blue',
+    'gas': 'green',
+}
+
 # Imports condicionals
 try:
     import matplotlib
@@ -70,6 +211,9 @@ class MainWindow(QMainWindow):
     Integra tots els components i gestiona la interacció amb l'usuari.
     """
 
+    # Captura desada en segon pla: ruta, missatge d'error (buit si ha anat bé)
+    _capture_saved = pyqtSignal(str, str)
+
     def __init__(
             self,
             config,
@@ -108,23 +252,66 @@ class MainWindow(QMainWindow):
         self.config_manager = config_manager
         self.ai_manager = ai_manager
 
+        # Mètodes opcionals de la càmera, usats a cada trama i a cada segon:
+        # es comproven una sola vegada
+        self._cam_get_fps = getattr(camera_manager, 'get_fps', None)
+        self._cam_get_frame = getattr(camera_manager, 'get_current_frame', None)
+        self._camera_streaming_ui = False
+
+        # Petició opcional de lectura dels sensors (cada segon si hi ha connexió)
+        self._request_sensor_update = getattr(sensor_manager, 'request_update', None)
+
         # Configurar interdependències entre gestors
         self.navigation_manager.setup_components(
             connection_manager, lidar_manager)
 
+        # Missatges de la barra d'estat agrupats: només es pinta l'últim de
+        # cada ràfega
+        self._pending_status = None
+        self._status_flush_timer = QTimer(self)
+        self._status_flush_timer.setSingleShot(True)
+        self._status_flush_timer.setInterval(16)
+        self._status_flush_timer.timeout.connect(self._flush_status)
+
+        # Velocitat del control lliscant: com a màxim un set_speed cada 50 ms
+        self._pending_speed = None
+        self._speed_timer = QTimer(self)
+        self._speed_timer.setSingleShot(True)
+        self._speed_timer.setInterval(50)
+        self._speed_timer.timeout.connect(self._flush_speed)
+
+        # Resultat de les captures del LiDAR desades al pool de fils
+        self._capture_saved.connect(self._on_capture_saved)
+
         # Inicialitzar la interfície
         self._init_ui()
 
+        # La topologia de la interfície és fixa després de construir-la
+        self._has_min_dist = hasattr(self, 'min_distance_label')
+        self._has_dir = hasattr(self, 'direction_label')
+
         # Connectar signals i slots
         self._connect_signals()
 
-        # Timer per a actualitzacions periòdiques
+        # Timer per a actualitzacions periòdiques (estat de connexió i sensors)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self._periodic_update)
         self.update_timer.start(1000)  # 1 segon
 
-        # Emmagatzemar l'última lectura del LiDAR
+        # Timer de la informació de càmera: només actiu amb la pestanya visible
+        self._camera_timer = QTimer(self)
+        self._camera_timer.setInterval(1000)
+        self._camera_timer.timeout.connect(self._update_camera_info)
+
+        # Emmagatzemar l'última lectura del LiDAR i l'última dibuixada
         self.last_lidar_data = None
+        self._last_drawn_lidar = None
+
+        # Agrupar les lectures del LiDAR: com a màxim un renderitzat cada 33 ms
+        self._lidar_timer = QTimer(self)
+        self._lidar_timer.setSingleShot(True)
+        self._lidar_timer.setInterval(33)
+        self._lidar_timer.timeout.connect(self._render_last_lidar)
 
         logger.info("MainWindow inicialitzada")
 
@@ -135,10 +322,8 @@ class MainWindow(QMainWindow):
         self.resize(1200, 800)
 
         # Icona de l'aplicació
-        icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                 "../resources/icons/robot_icon.png")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
+        if _ICON_PATH.exists():
+            self.setWindowIcon(QIcon(str(_ICON_PATH)))
 
         # Barra d'estat
         self.statusBar = QStatusBar()
@@ -177,112 +362,40 @@ class MainWindow(QMainWindow):
         right_panel.addTab(ai_panel, "Intel·ligència Artificial")
 
     def _create_menu(self):
-        """Crea la barra de menú."""
-        # Menú Arxiu
-        file_menu = self.menuBar().addMenu("&Arxiu")
-
-        # Acció Projectes
-        projects_action = QAction("&Projectes", self)
-        projects_action.setShortcut("Ctrl+P")
-        projects_action.triggered.connect(self._manage_projects)
-        file_menu.addAction(projects_action)
-
-        # Acció Guardar configuració
-        save_config_action = QAction("&Guardar configuració", self)
-        save_config_action.setShortcut("Ctrl+S")
-        save_config_action.triggered.connect(self._save_config)
-        file_menu.addAction(save_config_action)
-
-        # Acció Carregar configuració
-        load_config_action = QAction("&Carregar configuració", self)
-        load_config_action.setShortcut("Ctrl+L")
-        load_config_action.triggered.connect(self._load_config)
-        file_menu.addAction(load_config_action)
-
-        file_menu.addSeparator()
-
-        # Acció Sortir
-        exit_action = QAction("&Sortir", self)
-        exit_action.setShortcut("Ctrl+Q")
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-
-        # Menú Eines
-        tools_menu = self.menuBar().addMenu("&Eines")
-
-        # Acció Calibrar sensors
-        calibrate_action = QAction("&Calibrar sensors", self)
-        calibrate_action.triggered.connect(self._calibrate_sensors)
-        tools_menu.addAction(calibrate_action)
-
-        # Acció Reiniciar connexió
-        reconnect_action = QAction("&Reiniciar connexió", self)
-        reconnect_action.triggered.connect(self._reconnect)
-        tools_menu.addAction(reconnect_action)
-
-        # Acció Captures de pantalla
-        screenshot_action = QAction("&Capturar pantalla", self)
-        screenshot_action.setShortcut("F12")
-        screenshot_action.triggered.connect(self._take_screenshot)
-        tools_menu.addAction(screenshot_action)
-
-        tools_menu.addSeparator()
-
-        # Acció Preferències
-        preferences_action = QAction("&Preferències", self)
-        preferences_action.triggered.connect(self._show_preferences)
-        tools_menu.addAction(preferences_action)
-
-        # Menú Visualització
-        view_menu = self.menuBar().addMenu("&Visualització")
+        """Crea la barra de menú a partir de _MENU_SPEC."""
+        menus = {}
+        actions = {}
+        for title, entries in _MENU_SPEC:
+            menu = self.menuBar().addMenu(title)
+            menus[title] = menu
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, shortcut, handler = entry
+                action = menu.addAction(text)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(getattr(self, handler))
+                actions[handler] = action
 
         # Acció Tema clar/fosc
-        self.toggle_theme_action = QAction("Tema &fosc", self)
+        self.toggle_theme_action = actions['_toggle_theme']
         self.toggle_theme_action.setCheckable(True)
-        self.toggle_theme_action.triggered.connect(self._toggle_theme)
-        view_menu.addAction(self.toggle_theme_action)
-
-        # Acció Vista LiDAR (selector de vista)
-        lidar_view_menu = view_menu.addMenu("Vista &LiDAR")
 
-        self.lidar_cartesian_action = QAction("&Cartesiana", self)
-        self.lidar_cartesian_action.setCheckable(True)
-        self.lidar_cartesian_action.setChecked(True)
-        self.lidar_cartesian_action.triggered.connect(
-            lambda: self._set_lidar_view(0))
-        lidar_view_menu.addAction(self.lidar_cartesian_action)
-
-        self.lidar_polar_action = QAction("&Polar", self)
-        self.lidar_polar_action.setCheckable(True)
-        self.lidar_polar_action.triggered.connect(
-            lambda: self._set_lidar_view(1))
-        lidar_view_menu.addAction(self.lidar_polar_action)
-
-        self.lidar_combined_action = QAction("&Combinada", self)
-        self.lidar_combined_action.setCheckable(True)
-        self.lidar_combined_action.triggered.connect(
-            lambda: self._set_lidar_view(2))
-        lidar_view_menu.addAction(self.lidar_combined_action)
-
-        # Grup d'accions per al tipus de vista
+        # Vista LiDAR (selector de vista, mateix ordre que el combo)
+        lidar_view_menu = menus["&Visualització"].addMenu("Vista &LiDAR")
         self.lidar_view_group = QActionGroup(self)
-        self.lidar_view_group.addAction(self.lidar_cartesian_action)
-        self.lidar_view_group.addAction(self.lidar_polar_action)
-        self.lidar_view_group.addAction(self.lidar_combined_action)
         self.lidar_view_group.setExclusive(True)
-
-        # Menú Ajuda
-        help_menu = self.menuBar().addMenu("A&juda")
-
-        # Acció Manual d'usuari
-        manual_action = QAction("&Manual d'usuari", self)
-        manual_action.triggered.connect(self._show_manual)
-        help_menu.addAction(manual_action)
-
-        # Acció Sobre
-        about_action = QAction("&Sobre", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        for index, text in enumerate(_LIDAR_VIEW_ACTIONS):
+            action = self.lidar_view_group.addAction(text)
+            action.setCheckable(True)
+            action.setData(index)
+            lidar_view_menu.addAction(action)
+        (self.lidar_cartesian_action, self.lidar_polar_action,
+         self.lidar_combined_action) = self.lidar_view_group.actions()
+        self.lidar_cartesian_action.setChecked(True)
+        self.lidar_view_group.triggered.connect(self._set_lidar_view)
 
         # I implementar:
     def _create_ai_panel(self):
@@ -310,18 +423,18 @@ class MainWindow(QMainWindow):
         layout.addLayout(controls_layout)
     
         # Visualització de deteccions
-        self.detection_view = QLabel("Esperant deteccions...")
-        self.detection_view.setAlignment(Qt.AlignCenter)
+        # Escalat pel veí més proper: les caixes de detecció queden nítides
+        self.detection_view = CameraView("Esperant deteccions...", smooth=False)
         self.detection_view.setMinimumSize(640, 480)
-        self.detection_view.setStyleSheet("border: 1px solid #999; background-color: #111;")
         layout.addWidget(self.detection_view)
     
         # Llista d'objectes detectats
         detections_group = QGroupBox("Objectes detectats")
         detections_layout = QVBoxLayout(detections_group)
     
-        self.detections_list = QTableWidget(0, 3)
-        self.detections_list.setHorizontalHeaderLabels(["Objecte", "Confiança", "Posició"])
+        self.detections_model = DetectionsModel(max_rows=10)
+        self.detections_list = QTableView()
+        self.detections_list.setModel(self.detections_model)
         self.detections_list.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
         detections_layout.addWidget(self.detections_list)
     
@@ -339,56 +452,93 @@ class MainWindow(QMainWindow):
         
         # Mostrar estat
             if enabled:
-                self.statusBar.showMessage("IA activada")
+                self._set_status("IA activada")
             else:
-                self.statusBar.showMessage("IA desactivada")
+                self._set_status("IA desactivada")
 
     def _change_ai_model(self, index):
         """Canvia el model d'IA."""
-        # Implementació bàsica
         model_names = ["object_detection", "face_recognition", "custom"]
-        if hasattr(self.ai_manager, 'model_path'):
-        # Crear ruta al model
-            model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                 "../models", model_names[index])
-        
-        # Aquí caldria implementar la recàrrega del model
-        # Per ara, només mostrem un missatge
-        self.statusBar.showMessage(f"Canviant a model: {model_names[index]}")
+        if hasattr(self.ai_manager, 'set_model'):
+            # El gestor reutilitza els models ja carregats
+            self.ai_manager.set_model(str(_MODELS_DIR / model_names[index]))
+
+        self._set_status(f"Canviant a model: {model_names[index]}")
 
     def _create_right_panel(self):
         """Crea el panell dret amb visualitzacions."""
         right_panel = QTabWidget()
 
+        # Pestanyes que es construeixen la primera vegada que es mostren
+        # (marcador -> (constructor, títol))
+        self._panel_builders = {}
+
         # Pestanya LiDAR
-        if HAS_MATPLOTLIB:
-            lidar_panel = self._create_lidar_panel()
-            right_panel.addTab(lidar_panel, "LiDAR")
-        else:
-            lidar_panel = QWidget()
-            lidar_layout = QVBoxLayout(lidar_panel)
-            lidar_layout.addWidget(
-                QLabel("Matplotlib no disponible. Visualització LiDAR limitada."))
-            right_panel.addTab(lidar_panel, "LiDAR (No disponible)")
+        lidar_panel = self._create_lidar_panel()
+        right_panel.addTab(lidar_panel, "LiDAR")
+        self._lidar_panel = lidar_panel
+        right_panel.currentChanged.connect(self._on_right_tab_changed)
 
         # Pestanya Càmera
         camera_panel = self._create_camera_panel()
         right_panel.addTab(camera_panel, "Càmera")
+        self._camera_panel = camera_panel
 
-        # Pestanya Sensors
-        sensors_panel = self._create_sensors_panel()
-        right_panel.addTab(sensors_panel, "Sensors")
+        # Pestanya Sensors (diferida: inclou la figura de l'historial). Fins
+        # que es construeixi, les actualitzacions de sensors no tenen on pintar
+        self._sensor_iter = ()
+        self._last_sensor_data = None
+        self._hist_buf = None
+        self.sensor_panels = {}
+        self.sensor_data_labels = {}
+        self.sensor_alert_labels = {}
+        self._add_lazy_tab(right_panel, self._create_sensors_panel, "Sensors")
 
-        # Pestanya Configuració
-        config_panel = self._create_config_panel()
-        right_panel.addTab(config_panel, "Configuració")
+        # Pestanya Configuració (diferida). Els canvis de configuració que
+        # arribin abans de construir-la s'apliquen en construir-la
+        self.threshold_widgets = {}
+        self._pending_config_view = None
+        self._add_lazy_tab(right_panel, self._create_config_panel, "Configuració")
 
-        # Pestanya Informes (nova)
-        reports_panel = self._create_reports_panel()
-        right_panel.addTab(reports_panel, "Informes")
+        # Pestanya Informes (diferida)
+        self._add_lazy_tab(right_panel, self._create_reports_panel, "Informes")
 
         return right_panel
 
+    def _add_lazy_tab(self, tab_widget, builder, title):
+        """Afegeix una pestanya amb un marcador buit que es construirà en mostrar-la."""
+        placeholder = QWidget()
+        self._panel_builders[placeholder] = (builder, title)
+        tab_widget.addTab(placeholder, title)
+
+    def _build_lazy_tab(self, tab_widget, index):
+        """
+        Substitueix el marcador de la pestanya pel panell real si encara no s'ha construït.
+
+        Returns:
+            QWidget: El widget de la pestanya
+        """
+        current = tab_widget.widget(index)
+        entry = self._panel_builders.pop(current, None)
+        if entry is None:
+            return current
+
+        builder, title = entry
+        panel = builder()
+        # Canvi de marcador a panell sense repintar la pestanya intermèdia
+        # que removeTab deixaria seleccionada
+        tab_widget.setUpdatesEnabled(False)
+        tab_widget.blockSignals(True)
+        try:
+            tab_widget.removeTab(index)
+            tab_widget.insertTab(index, panel, title)
+            tab_widget.setCurrentIndex(index)
+        finally:
+            tab_widget.blockSignals(False)
+            tab_widget.setUpdatesEnabled(True)
+        current.deleteLater()
+        return panel
+
     def _create_left_panel(self):
         """Crea el panell esquerre amb controls."""
         left_panel = QWidget()
@@ -417,19 +567,19 @@ class MainWindow(QMainWindow):
         # Botons de direcció
         self.up_button = QPushButton("Endavant")
         self.up_button.clicked.connect(
-            lambda: self.navigation_manager.move("forward"))
+            partial(self.navigation_manager.move, "forward"))
 
         self.down_button = QPushButton("Endarrere")
         self.down_button.clicked.connect(
-            lambda: self.navigation_manager.move("backward"))
+            partial(self.navigation_manager.move, "backward"))
 
         self.left_button = QPushButton("Esquerra")
         self.left_button.clicked.connect(
-            lambda: self.navigation_manager.move("left"))
+            partial(self.navigation_manager.move, "left"))
 
         self.right_button = QPushButton("Dreta")
         self.right_button.clicked.connect(
-            lambda: self.navigation_manager.move("right"))
+            partial(self.navigation_manager.move, "right"))
 
         self.stop_button = QPushButton("Aturar")
         self.stop_button.clicked.connect(self.navigation_manager.stop)
@@ -519,57 +669,31 @@ class MainWindow(QMainWindow):
         # Vista cartesiana
         self.cartesian_view = QWidget()
         cartesian_layout = QVBoxLayout(self.cartesian_view)
-
-        if HAS_MATPLOTLIB:
-            self.cartesian_figure = Figure(figsize=(5, 5), dpi=100)
-            self.cartesian_axes = self.cartesian_figure.add_subplot(111)
-            self.cartesian_canvas = FigureCanvas(self.cartesian_figure)
-            cartesian_layout.addWidget(self.cartesian_canvas)
-        else:
-            cartesian_layout.addWidget(QLabel("Matplotlib no disponible"))
-
+        self.cartesian_canvas = LidarCanvas(LidarCanvas.CARTESIAN)
+        cartesian_layout.addWidget(self.cartesian_canvas)
         self.lidar_view_stack.addWidget(self.cartesian_view)
 
         # Vista polar
         self.polar_view = QWidget()
         polar_layout = QVBoxLayout(self.polar_view)
-
-        if HAS_MATPLOTLIB:
-            self.polar_figure = Figure(figsize=(5, 5), dpi=100)
-            self.polar_axes = self.polar_figure.add_subplot(
-                111, projection='polar')
-            self.polar_canvas = FigureCanvas(self.polar_figure)
-            polar_layout.addWidget(self.polar_canvas)
-        else:
-            polar_layout.addWidget(QLabel("Matplotlib no disponible"))
-
+        self.polar_canvas = LidarCanvas(LidarCanvas.POLAR)
+        polar_layout.addWidget(self.polar_canvas)
         self.lidar_view_stack.addWidget(self.polar_view)
 
         # Vista combinada
         self.combined_view = QWidget()
         combined_layout = QHBoxLayout(self.combined_view)
-
-        if HAS_MATPLOTLIB:
-            # Vista cartesiana
-            self.combined_cartesian_figure = Figure(figsize=(5, 5), dpi=100)
-            self.combined_cartesian_axes = self.combined_cartesian_figure.add_subplot(
-                111)
-            self.combined_cartesian_canvas = FigureCanvas(
-                self.combined_cartesian_figure)
-            combined_layout.addWidget(self.combined_cartesian_canvas)
-
-            # Vista polar
-            self.combined_polar_figure = Figure(figsize=(5, 5), dpi=100)
-            self.combined_polar_axes = self.combined_polar_figure.add_subplot(
-                111, projection='polar')
-            self.combined_polar_canvas = FigureCanvas(
-                self.combined_polar_figure)
-            combined_layout.addWidget(self.combined_polar_canvas)
-        else:
-            combined_layout.addWidget(QLabel("Matplotlib no disponible"))
-
+        self.combined_cartesian_canvas = LidarCanvas(LidarCanvas.CARTESIAN)
+        combined_layout.addWidget(self.combined_cartesian_canvas)
+        self.combined_polar_canvas = LidarCanvas(LidarCanvas.POLAR)
+        combined_layout.addWidget(self.combined_polar_canvas)
         self.lidar_view_stack.addWidget(self.combined_view)
 
+        # Mostrar/amagar el marcador d'obstacles a totes les vistes
+        for canvas in (self.cartesian_canvas, self.polar_canvas,
+                       self.combined_cartesian_canvas, self.combined_polar_canvas):
+            self.show_obstacles_check.toggled.connect(canvas.set_show_obstacles)
+
         layout.addWidget(self.lidar_view_stack)
 
         # Informació de distàncies
@@ -631,11 +755,8 @@ class MainWindow(QMainWindow):
         layout.addLayout(controls_layout)
 
         # Visualització de càmera
-        self.camera_label = QLabel("Flux de càmera no disponible")
-        self.camera_label.setAlignment(Qt.AlignCenter)
+        self.camera_label = CameraView("Flux de càmera no disponible")
         self.camera_label.setMinimumSize(640, 480)
-        self.camera_label.setStyleSheet(
-            "border: 1px solid #999; background-color: #111;")
         layout.addWidget(self.camera_label)
 
         # Informació de FPS i estat
@@ -678,16 +799,6 @@ class MainWindow(QMainWindow):
         # Crear una graella per als sensors
         sensors_grid = QGridLayout()
 
-        # Definir estils per als diferents tipus de sensors
-        sensor_styles = {
-            'temperature': "background-color: #ffe0e0; border: 1px solid #ffb0b0; border-radius: 5px;",
-            'humidity': "background-color: #e0f0ff; border: 1px solid #b0d0ff; border-radius: 5px;",
-            'gas': "background-color: #e0ffe0; border: 1px solid #b0ffb0; border-radius: 5px;",
-            'co': "background-color: #fff0e0; border: 1px solid #ffd0b0; border-radius: 5px;",
-            'smoke': "background-color: #f0e0ff; border: 1px solid #d0b0ff; border-radius: 5px;",
-            'battery': "background-color: #e0ffff; border: 1px solid #b0ffff; border-radius: 5px;"
-        }
-
         # Crear widgets per a cada sensor
         self.sensor_panels = {}
         self.sensor_data_labels = {}
@@ -697,19 +808,29 @@ class MainWindow(QMainWindow):
         col = 0
         max_cols = 2
 
-        for sensor_type, properties in self.sensor_manager.SENSOR_TYPES.items():
+        # (tipus, nom, unitat, estil) de cada sensor, resolts una sola vegada
+        sensor_specs = tuple(
+            (sensor_type, properties['name'], properties['unit'],
+             _SENSOR_STYLES.get(sensor_type, ""))
+            for sensor_type, properties in self.sensor_manager.SENSOR_TYPES.items())
+
+        # (tipus, etiqueta de valor, unitat) per al camí d'actualització
+        sensor_iter = []
+
+        for sensor_type, name, unit, style in sensor_specs:
             # Crear un grup per al sensor
-            sensor_group = QGroupBox(properties['name'])
-            sensor_group.setStyleSheet(sensor_styles.get(sensor_type, ""))
+            sensor_group = QGroupBox(name)
+            sensor_group.setStyleSheet(style)
 
             sensor_layout = QVBoxLayout(sensor_group)
 
             # Valor actual
-            data_label = QLabel(f"-- {properties['unit']}")
+            data_label = QLabel(f"-- {unit}")
             data_label.setStyleSheet("font-size: 18px; font-weight: bold;")
             data_label.setAlignment(Qt.AlignCenter)
             sensor_layout.addWidget(data_label)
             self.sensor_data_labels[sensor_type] = data_label
+            sensor_iter.append((sensor_type, data_label, unit))
 
             # Estat d'alerta
             alert_label = QLabel("Normal")
@@ -730,6 +851,8 @@ class MainWindow(QMainWindow):
             # Guardar referència
             self.sensor_panels[sensor_type] = sensor_group
 
+        self._sensor_iter = tuple(sensor_iter)
+
         layout.addLayout(sensors_grid)
 
         # Historial de lectures (gràfic)
@@ -744,6 +867,25 @@ class MainWindow(QMainWindow):
                 self.sensor_history_figure)
             history_layout.addWidget(self.sensor_history_canvas)
 
+            # Historial en un buffer circular (una fila per sensor) dibuixat
+            # amb una sola línia persistent que només canvia de dades. La línia
+            # és animada: es pinta amb blit sobre el fons desat a cada dibuix
+            self._hist_types = tuple(self.sensor_manager.SENSOR_TYPES)
+            self._hist_buf = np.full(
+                (len(self._hist_types), _HISTORY_SAMPLES), np.nan, dtype=np.float32)
+            self._hist_t = np.arange(
+                1 - _HISTORY_SAMPLES, 1, dtype=np.float32)
+            self._hist_head = 0
+            self._hist_row = 0
+            self._hist_line, = self.sensor_history_axes.plot(
+                [], [], lw=1, animated=True)
+            self._hist_bg = None
+            self.sensor_history_axes.set_xlim(self._hist_t[0], self._hist_t[-1])
+            self.sensor_history_axes.set_xlabel('Lectures')
+            self.sensor_history_axes.grid(True)
+            self.sensor_history_canvas.mpl_connect(
+                'draw_event', self._on_sensor_history_draw)
+
             # Dropdown per seleccionar sensor
             history_controls = QHBoxLayout()
             history_controls.addWidget(QLabel("Sensor:"))
@@ -754,6 +896,7 @@ class MainWindow(QMainWindow):
             self.history_sensor_combo.currentIndexChanged.connect(
                 self._update_sensor_history)
             history_controls.addWidget(self.history_sensor_combo)
+            self._update_sensor_history(self.history_sensor_combo.currentIndex())
 
             history_controls.addStretch()
 
@@ -764,6 +907,10 @@ class MainWindow(QMainWindow):
         history_group.setLayout(history_layout)
         layout.addWidget(history_group)
 
+        # Mostrar els últims valors rebuts en lloc d'esperar la pròxima lectura
+        if self._last_sensor_data is not None:
+            self.update_all_sensors_data(self._last_sensor_data)
+
         return sensors_panel
 
     def _create_config_panel(self):
@@ -804,12 +951,7 @@ class MainWindow(QMainWindow):
         # Llindar de detecció d'obstacles
         lidar_layout.addWidget(QLabel("Llindar d'obstacles (mm):"), 0, 0)
 
-        # Assegurar que 'lidar' és un diccionari
-        lidar_config = self.config.get('lidar', {})
-        if not isinstance(lidar_config, dict):
-            lidar_config = {}
-
-        obstacle_threshold = lidar_config.get('obstacle_threshold', 500)
+        obstacle_threshold = _dict_get(self.config, 'lidar').get('obstacle_threshold', 500)
         self.lidar_threshold_label = QLabel(str(obstacle_threshold))
         lidar_layout.addWidget(self.lidar_threshold_label, 0, 1)
 
@@ -830,110 +972,59 @@ class MainWindow(QMainWindow):
         sensors_layout.addWidget(QLabel("<b>Llindar</b>"), 0, 1)
         sensors_layout.addWidget(QLabel("<b>Editar</b>"), 0, 2)
 
-        # Diccionari de sensors disponibles amb els seus noms amigables
-        available_sensors = {
-            'mq2': "MQ-002 (Gas)",
-            'mq135': "MQ-135 (Qualitat aire)",
-            'k001': "K-001 (Temperatura)",
-            'k026': "K-026 (Flama)",
-            'k36': "K-36 (So)",
-            'gy521': "GY-521 (MPU6050)"
-        }
-
-        # Assegurar que 'sensors' és un diccionari
-        sensors_config = self.config.get('sensors', {})
-        if not isinstance(sensors_config, dict):
-            sensors_config = {}
+        sensors_config = _dict_get(self.config, 'sensors')
+        sensor_types = self.sensor_manager.SENSOR_TYPES
+        add_widget = sensors_layout.addWidget
 
         # Afegir només els sensors disponibles
         row = 1
-        self.threshold_widgets = {}
+        self.threshold_widgets = threshold_widgets = {}
 
-        for sensor_key, sensor_name in available_sensors.items():
+        for sensor_key, (sensor_name, unit) in _CONFIG_SENSORS.items():
             # Buscar el sensor a la configuració actual o a SENSOR_TYPES
-            if sensor_key in self.sensor_manager.SENSOR_TYPES or sensor_key in sensors_config:
+            if sensor_key in sensor_types or sensor_key in sensors_config:
                 # Nom del sensor
                 name_label = QLabel(sensor_name)
-                sensors_layout.addWidget(name_label, row, 0)
+                add_widget(name_label, row, 0)
 
                 # Obtenir llindar o valor per defecte
-                sensor_config = sensors_config.get(sensor_key, {})
-                if not isinstance(sensor_config, dict):
-                    sensor_config = {}
-
-                threshold = sensor_config.get('threshold', 0)
-
-                # Unitat (depenent del sensor)
-                unit = ""
-                if "temperatura" in sensor_name.lower():
-                    unit = "°C"
-                elif "gas" in sensor_name.lower() or "aire" in sensor_name.lower():
-                    unit = "ppm"
-                elif "so" in sensor_name.lower():
-                    unit = "dB"
+                threshold = _dict_get(sensors_config, sensor_key).get('threshold', 0)
 
                 # Llindar actual
                 threshold_label = QLabel(f"{threshold} {unit}")
-                sensors_layout.addWidget(threshold_label, row, 1)
+                add_widget(threshold_label, row, 1)
 
                 # Botó per editar
                 edit_btn = QPushButton("Editar")
-                edit_btn.clicked.connect(
-                    lambda checked,
-                    sk=sensor_key,
-                    sn=sensor_name,
-                    u=unit: self._edit_sensor_threshold(
-                        sk,
-                        sn,
-                        u))
-                sensors_layout.addWidget(edit_btn, row, 2)
+                edit_btn.clicked.connect(partial(
+                    self._edit_sensor_threshold, sensor_key, sensor_name, unit))
+                add_widget(edit_btn, row, 2)
 
                 # Desar referències
-                self.threshold_widgets[sensor_key] = threshold_label
+                threshold_widgets[sensor_key] = threshold_label
 
                 row += 1
 
         # Afegir calibració dels sensors de gas
-        sensors_layout.addWidget(
-            QLabel("<b>Calibració Sensors Gas</b>"), row, 0, 1, 3)
+        add_widget(QLabel("<b>Calibració Sensors Gas</b>"), row, 0, 1, 3)
         row += 1
 
-        # MQ-002 Calibració
-        if 'mq2' in available_sensors:
-            sensors_layout.addWidget(QLabel("Calibració MQ-002:"), row, 0)
-            mq2_config = sensors_config.get('mq2', {})
-            if not isinstance(mq2_config, dict):
-                mq2_config = {}
-
-            calib_mq2 = mq2_config.get('calibration', "No calibrat")
-            self.calib_mq2_label = QLabel(str(calib_mq2))
-            sensors_layout.addWidget(self.calib_mq2_label, row, 1)
-
-            # Botó per calibrar
-            self.calib_mq2_btn = QPushButton("Calibrar")
-            self.calib_mq2_btn.clicked.connect(
-                lambda: self._calibrate_gas_sensor(
-                    'mq2', "MQ-002"))
-            sensors_layout.addWidget(self.calib_mq2_btn, row, 2)
-            row += 1
-
-        # MQ-135 Calibració
-        if 'mq135' in available_sensors:
-            sensors_layout.addWidget(QLabel("Calibració MQ-135:"), row, 0)
-            mq135_config = sensors_config.get('mq135', {})
-            if not isinstance(mq135_config, dict):
-                mq135_config = {}
-
-            calib_mq135 = mq135_config.get('calibration', "No calibrat")
-            self.calib_mq135_label = QLabel(str(calib_mq135))
-            sensors_layout.addWidget(self.calib_mq135_label, row, 1)
+        for sensor_key, display_name in _GAS_SENSORS:
+            add_widget(QLabel(f"Calibració {display_name}:"), row, 0)
+            calibration = _dict_get(sensors_config, sensor_key).get(
+                'calibration', "No calibrat")
+            calib_label = QLabel(str(calibration))
+            add_widget(calib_label, row, 1)
 
             # Botó per calibrar
-            self.calib_mq135_btn = QPushButton("Calibrar")
-            self.calib_mq135_btn.clicked.connect(
-                lambda: self._calibrate_gas_sensor(
-                    'mq135', "MQ-135"))
-            sensors_layout.addWidget(self.calib_mq135_btn, row, 2)
+            calib_btn = QPushButton("Calibrar")
+            calib_btn.clicked.connect(partial(
+                self._calibrate_gas_sensor, sensor_key, display_name))
+            add_widget(calib_btn, row, 2)
+
+            # Desar referències (calib_<clau>_label, calib_<clau>_btn)
+            setattr(self, f"calib_{sensor_key}_label", calib_label)
+            setattr(self, f"calib_{sensor_key}_btn", calib_btn)
             row += 1
 
         sensors_box.setLayout(sensors_layout)
@@ -967,6 +1058,10 @@ class MainWindow(QMainWindow):
         profiles_box.setLayout(profiles_layout)
         config_layout.addWidget(profiles_box)
 
+        if self._pending_config_view is not None:
+            self.update_config_view(self._pending_config_view)
+            self._pending_config_view = None
+
         return config_panel
 
     def _create_reports_panel(self):
@@ -977,17 +1072,23 @@ class MainWindow(QMainWindow):
         # Controls de dates
         date_layout = QHBoxLayout()
 
+        # Selectors compactes: el calendari només es crea en desplegar-lo
+        today = QDate.currentDate()
+
         date_layout.addWidget(QLabel("Data inici:"))
-        self.start_date = QCalendarWidget()
-        self.start_date.setMaximumHeight(200)
+        self.start_date = QDateEdit(today)
+        self.start_date.setCalendarPopup(True)
+        self.start_date.setDisplayFormat("yyyy-MM-dd")
         date_layout.addWidget(self.start_date)
 
         date_layout.addWidget(QLabel("Data fi:"))
-        self.end_date = QCalendarWidget()
-        self.end_date.setMaximumHeight(200)
-        self.end_date.setSelectedDate(QDate.currentDate())
+        self.end_date = QDateEdit(today)
+        self.end_date.setCalendarPopup(True)
+        self.end_date.setDisplayFormat("yyyy-MM-dd")
         date_layout.addWidget(self.end_date)
 
+        date_layout.addStretch()
+
         layout.addLayout(date_layout)
 
         # Tipus d'informe
@@ -1028,11 +1129,11 @@ class MainWindow(QMainWindow):
         export_layout.addStretch()
 
         self.export_pdf_btn = QPushButton("Exportar PDF")
-        self.export_pdf_btn.clicked.connect(lambda: self._export_report("pdf"))
+        self.export_pdf_btn.clicked.connect(partial(self._export_report, "pdf"))
         export_layout.addWidget(self.export_pdf_btn)
 
         self.export_csv_btn = QPushButton("Exportar CSV")
-        self.export_csv_btn.clicked.connect(lambda: self._export_report("csv"))
+        self.export_csv_btn.clicked.connect(partial(self._export_report, "csv"))
         export_layout.addWidget(self.export_csv_btn)
 
         layout.addLayout(export_layout)
@@ -1041,27 +1142,25 @@ class MainWindow(QMainWindow):
 
     def _update_profiles_combo(self):
         """Actualitza el combo box de perfils amb els perfils disponibles."""
+        # Perfil per defecte i perfils disponibles del config_manager
+        items = ["Perfil per defecte"]
+        combo = self.profiles_combo
+        combo.blockSignals(True)
         try:
-            self.profiles_combo.clear()
-
-            # Afegir perfil per defecte
-            self.profiles_combo.addItem("Perfil per defecte")
-
-            # Obtenir perfils disponibles del config_manager
             if hasattr(self.config_manager, 'get_available_profiles'):
-                profiles = self.config_manager.get_available_profiles()
+                items.extend(self.config_manager.get_available_profiles() or ())
 
-                if profiles:
-                    for profile in profiles:
-                        self.profiles_combo.addItem(profile)
+            # Omplir el combo d'una sola vegada
+            combo.clear()
+            combo.addItems(items)
         except Exception as e:
             logger.error(f"Error actualitzant combo de perfils: {e}")
+        finally:
+            combo.blockSignals(False)
 
     def _toggle_connection(self):
         """Commuta l'estat de connexió."""
-        if hasattr(
-                self.connection_manager,
-                'connected') and self.connection_manager.connected:
+        if self._is_connected():
             self.connection_manager.disconnect()
         else:
             self.connection_manager.connect()
@@ -1070,39 +1169,55 @@ class MainWindow(QMainWindow):
         """Actualitza la velocitat del robot."""
         self.speed_label.setText(f"{value}%")
 
-        # Adaptar el valor al rang necessari
-        adjusted_value = int(value * 2.55)  # Convertir de 0-100 a 0-255
-        self.navigation_manager.set_speed(adjusted_value)
+        # Adaptar el valor al rang necessari i enviar-lo agrupat
+        self._pending_speed = int(value * 2.55)  # Convertir de 0-100 a 0-255
+        if not self._speed_timer.isActive():
+            self._speed_timer.start()
+
+    def _flush_speed(self):
+        """Envia l'última velocitat pendent al NavigationManager."""
+        if self._pending_speed is not None:
+            self.navigation_manager.set_speed(self._pending_speed)
+            self._pending_speed = None
 
     def _change_mode(self, index):
         """Canvia el mode de navegació."""
-        mode_map = {
-            0: "manual",
-            1: "assisted",
-            2: "autonomous"
-        }
-        if index in mode_map:
-            self.navigation_manager.set_mode(mode_map[index])
+        mode = _NAV_MODES.get(index)
+        if mode is not None:
+            self.navigation_manager.set_mode(mode)
 
     def _switch_lidar_view(self, index):
         """Canvia entre les diferents vistes del LiDAR."""
         self.lidar_view_stack.setCurrentIndex(index)
 
-        # Actualitzar les accions del menú
-        if index == 0:
-            self.lidar_cartesian_action.setChecked(True)
-        elif index == 1:
-            self.lidar_polar_action.setChecked(True)
-        elif index == 2:
-            self.lidar_combined_action.setChecked(True)
+        # Actualitzar les accions del menú (en el mateix ordre que el combo)
+        actions = self.lidar_view_group.actions()
+        if 0 <= index < len(actions):
+            actions[index].setChecked(True)
 
         # Si hi ha dades disponibles, actualitzar la visualització
         if self.last_lidar_data:
             self.update_lidar_view(self.last_lidar_data)
 
-    def _set_lidar_view(self, index):
-        """Estableix la vista del LiDAR des de les accions del menú."""
-        self.lidar_view_combo.setCurrentIndex(index)
+    def _on_right_tab_changed(self, index):
+        """
+        Activa només les actualitzacions de la pestanya visible i reprodueix
+        l'última lectura del LiDAR quan la seva pestanya torna a ser visible.
+        """
+        current = self._build_lazy_tab(self.sender(), index)
+
+        if current is self._camera_panel:
+            self._update_camera_info()
+            self._camera_timer.start()
+        else:
+            self._camera_timer.stop()
+
+        if current is self._lidar_panel and self.last_lidar_data:
+            self.update_lidar_view(self.last_lidar_data)
+
+    def _set_lidar_view(self, action):
+        """Estableix la vista del LiDAR des de l'acció del menú activada."""
+        self.lidar_view_combo.setCurrentIndex(action.data())
 
     def _load_profile(self):
         """Carrega un perfil de configuració seleccionat."""
@@ -1220,46 +1335,9 @@ class MainWindow(QMainWindow):
 
     def _capture_lidar_view(self):
         """Captura la vista actual del LiDAR i la desa com a imatge."""
-        if not HAS_MATPLOTLIB:
-            QMessageBox.warning(
-                self,
-                "Captura no disponible",
-                "Matplotlib no està instal·lat. No es pot capturar la vista.")
-            return
-
         try:
-            # Determinar quina figura capturar
-            current_view = self.lidar_view_stack.currentIndex()
-
-            if current_view == 0:  # Cartesiana
-                figure = self.cartesian_figure
-            elif current_view == 1:  # Polar
-                figure = self.polar_figure
-            else:  # Combinada
-                # Crear una nova figura combinant les dues
-                figure = Figure(figsize=(10, 5), dpi=100)
-
-                # Còpia de la vista cartesiana
-                ax1 = figure.add_subplot(121)
-                for line in self.combined_cartesian_axes.get_lines():
-                    ax1.plot(line.get_xdata(), line.get_ydata(),
-                             color=line.get_color(),
-                             marker=line.get_marker(),
-                             linestyle=line.get_linestyle())
-                ax1.set_title("Vista Cartesiana")
-                ax1.grid(True)
-
-                # Còpia de la vista polar
-                ax2 = figure.add_subplot(122, projection='polar')
-                for line in self.combined_polar_axes.get_lines():
-                    ax2.plot(line.get_xdata(), line.get_ydata(),
-                             color=line.get_color(),
-                             marker=line.get_marker(),
-                             linestyle=line.get_linestyle())
-                ax2.set_title("Vista Polar")
-                ax2.grid(True)
-
-                figure.tight_layout()
+            # La vista visible (inclosa la combinada) es captura tal com es veu
+            view = self.lidar_view_stack.currentWidget()
 
             # Demanar on guardar la imatge
             filepath, _ = QFileDialog.getSaveFileName(
@@ -1272,19 +1350,30 @@ class MainWindow(QMainWindow):
             if not filepath:
                 return
 
-            # Desar la figura
-            figure.savefig(filepath, dpi=150, bbox_inches='tight')
-
-            QMessageBox.information(
-                self,
-                "Captura desada",
-                f"La captura s'ha desat a {filepath}")
+            # La captura es fa aquí (QPixmap només al fil de la interfície),
+            # però la codificació PNG/JPG es fa al pool de fils
+            image = view.grab().toImage()
+            QThreadPool.globalInstance().start(
+                _ImageSaveRunnable(image, filepath, self._capture_saved))
 
         except Exception as e:
             logger.error(f"Error capturant vista del LiDAR: {e}")
             QMessageBox.critical(
                 self, "Error", f"No s'ha pogut capturar la vista: {e}")
 
+    def _on_capture_saved(self, filepath, error):
+        """Informa del resultat de desar una captura del LiDAR."""
+        if error:
+            logger.error(f"Error capturant vista del LiDAR: {error}")
+            QMessageBox.critical(
+                self, "Error", f"No s'ha pogut capturar la vista: {error}")
+            return
+
+        QMessageBox.information(
+            self,
+            "Captura desada",
+            f"La captura s'ha desat a {filepath}")
+
     def _start_camera_stream(self):
         """Inicia l'streaming de la càmera."""
         if hasattr(self.camera_manager, 'start_stream'):
@@ -1307,6 +1396,7 @@ class MainWindow(QMainWindow):
                 self.start_stream_btn.setEnabled(True)
                 self.stop_stream_btn.setEnabled(False)
                 self.camera_status_label.setText("Streaming aturat")
+                self._camera_streaming_ui = False
             else:
                 QMessageBox.warning(
                     self, "Error", "No s'ha pogut aturar l'streaming de la càmera")
@@ -1348,14 +1438,7 @@ class MainWindow(QMainWindow):
     def _change_camera_processing(self, index):
         """Canvia el mode de processament de la càmera."""
         if hasattr(self.camera_manager, 'enable_processing'):
-            processing_modes = {
-                0: None,  # Cap
-                1: "edge",  # Vores
-                2: "motion",  # Moviment
-                3: "thermal"  # Tèrmic
-            }
-
-            mode = processing_modes.get(index)
+            mode = _CAMERA_PROCESSING.get(index)
 
             if index == 0:
                 # Desactivar processament
@@ -1396,65 +1479,74 @@ class MainWindow(QMainWindow):
                 self.simulate_sensors_btn.setText("Simular sensors")
 
     def _update_sensor_history(self, index):
-        """Actualitza el gràfic d'historial de sensors."""
-        if not HAS_MATPLOTLIB:
+        """Canvia el sensor mostrat al gràfic d'historial."""
+        if self._hist_buf is None or not 0 <= index < len(self._hist_types):
             return
 
-        # Obtenir el tipus de sensor seleccionat (segons l'ordre d'afegit al
-        # combo)
-        sensor_types = list(self.sensor_manager.SENSOR_TYPES.keys())
+        sensor_type = self._hist_types[index]
+        properties = self.sensor_manager.SENSOR_TYPES[sensor_type]
+        self._hist_row = index
+        self._hist_line.set_color(_HISTORY_COLORS.get(sensor_type, 'purple'))
+        self.sensor_history_axes.set_ylabel(
+            f"{properties['name']} ({properties['unit']})")
+        self._redraw_sensor_history(full=True)
 
-        if index < 0 or index >= len(sensor_types):
-            return
+    def _push_sensor_history(self, sensor_data):
+        """
+        Afegeix una lectura de tots els sensors al buffer circular.
+
+        Args:
+            sensor_data (dict): Valors per tipus de sensor
+        """
+        get_value = sensor_data.get
+        self._hist_buf[:, self._hist_head] = [
+            get_value(sensor_type, np.nan) for sensor_type in self._hist_types]
+        self._hist_head = (self._hist_head + 1) % _HISTORY_SAMPLES
+
+        if self.sensor_history_canvas.isVisible():
+            self._redraw_sensor_history()
+
+    def _redraw_sensor_history(self, full=False):
+        """
+        Actualitza les dades de la línia d'historial i la dibuixa.
 
-        selected_sensor = sensor_types[index]
+        Si les dades caben als eixos actuals només es repinta la línia (blit);
+        altrament es reescalen els eixos i es programa un dibuix complet.
 
-        # Actualitzar gràfic amb dades simulades (en un cas real s'usarien
-        # dades reals)
+        Args:
+            full (bool, optional): Forçar el reescalat i el dibuix complet
+        """
+        axes = self.sensor_history_axes
+        canvas = self.sensor_history_canvas
         try:
-            self.sensor_history_axes.clear()
-
-            # En un cas real, obtindríem l'historial de dades
-            # Per ara simulem algunes dades
-            import numpy as np
-
-            x = np.arange(20)
-
-            # Generar dades segons el tipus de sensor
-            if selected_sensor == 'temperature':
-                y = 25 + 5 * np.sin(x / 3) + np.random.normal(0, 0.5, 20)
-                label = 'Temperatura (°C)'
-                color = 'red'
-            elif selected_sensor == 'humidity':
-                y = 60 + 15 * np.sin(x / 5) + np.random.normal(0, 2, 20)
-                label = 'Humitat (%)'
-                color = 'blue'
-            elif selected_sensor == 'gas':
-                y = 800 + 200 * np.sin(x / 4) + np.random.normal(0, 50, 20)
-                label = 'Gas (ppm)'
-                color = 'green'
-            else:
-                # Valors aleatoris per altres sensors
-                y = 50 + 20 * np.sin(x / 3) + np.random.normal(0, 5, 20)
-                label = 'Valor'
-                color = 'purple'
-
-            # Dibuixar dades
-            self.sensor_history_axes.plot(
-                x, y, marker='o', color=color, label=label)
-
-            # Configurar eixos
-            self.sensor_history_axes.set_xlabel('Temps (minuts)')
-            self.sensor_history_axes.set_ylabel(label)
-            self.sensor_history_axes.grid(True)
-            self.sensor_history_axes.legend()
+            # Ordenar de la lectura més antiga a la més recent
+            row = self._hist_buf[self._hist_row]
+            head = self._hist_head
+            values = np.concatenate((row[head:], row[:head]))
+            self._hist_line.set_data(self._hist_t, values)
+
+            ymin, ymax = axes.get_ylim()
+            if (full or self._hist_bg is None
+                    or (values < ymin).any() or (values > ymax).any()):
+                axes.relim()
+                axes.autoscale_view(scalex=False)
+                self._hist_bg = None
+                canvas.draw_idle()
+                return
 
-            # Actualitzar el gràfic
-            self.sensor_history_canvas.draw()
+            canvas.restore_region(self._hist_bg)
+            axes.draw_artist(self._hist_line)
+            canvas.blit(axes.bbox)
 
         except Exception as e:
             logger.error(f"Error actualitzant l'historial de sensors: {e}")
 
+    def _on_sensor_history_draw(self, event):
+        """Desa el fons dels eixos després d'un dibuix complet i hi pinta la línia."""
+        self._hist_bg = self.sensor_history_canvas.copy_from_bbox(
+            self.sensor_history_axes.bbox)
+        self.sensor_history_axes.draw_artist(self._hist_line)
+
     def _manage_projects(self):
         """Obre el diàleg de gestió de projectes."""
         if not self.db_manager:
@@ -1462,8 +1554,12 @@ class MainWindow(QMainWindow):
                                 "El gestor de base de dades no està disponible")
             return
 
+        if ProjectDialog is None:
+            QMessageBox.warning(self, "Projectes no disponibles",
+                                "El diàleg de gestió de projectes no està disponible")
+            return
+
         try:
-            from ui.project_dialog import ProjectDialog
             dialog = ProjectDialog(self.db_manager, self)
             dialog.exec_()
         except Exception as e:
@@ -1485,11 +1581,7 @@ class MainWindow(QMainWindow):
     def _edit_lidar_threshold(self):
         """Edita el llindar d'obstacles del LiDAR."""
         # Obtenir valor actual
-        lidar_config = self.config.get('lidar', {})
-        if not isinstance(lidar_config, dict):
-            lidar_config = {}
-
-        current_value = lidar_config.get('obstacle_threshold', 500)
+        current_value = _dict_get(self.config, 'lidar').get('obstacle_threshold', 500)
 
         # Mostrar diàleg d'edició
         new_value, ok = QInputDialog.getInt(
@@ -1503,19 +1595,17 @@ class MainWindow(QMainWindow):
         )
 
         if ok:
-            # Actualitzar valor al ConfigManager
-            if not isinstance(self.config.get('lidar', {}), dict):
-                self.config['lidar'] = {}
-
-            self.config['lidar']['obstacle_threshold'] = new_value
-            self.config_manager.update_section('lidar', self.config['lidar'])
+            # Actualitzar només aquest valor al ConfigManager
+            _dict_entry(self.config, 'lidar')['obstacle_threshold'] = new_value
+            self.config_manager.update_config(
+                'lidar', 'obstacle_threshold', new_value)
 
             # Actualitzar etiqueta
             self.lidar_threshold_label.setText(str(new_value))
 
             # Actualitzar el NavigationManager si és necessari
-            if hasattr(self.navigation_manager, 'obstacle_threshold'):
-                self.navigation_manager.obstacle_threshold = new_value
+            if hasattr(self.navigation_manager, 'set_obstacle_threshold'):
+                self.navigation_manager.set_obstacle_threshold(new_value)
 
             # Mostrar confirmació
             QMessageBox.information(
@@ -1550,20 +1640,14 @@ class MainWindow(QMainWindow):
                 success = self.connection_manager.send_command(calibration_cmd)
 
                 if success:
-                    # Actualitzar la configuració
-                    if not isinstance(self.config.get('sensors', {}), dict):
-                        self.config['sensors'] = {}
-                    if not isinstance(
-                        self.config['sensors'].get(
-                            sensor_key, {}), dict):
-                        self.config['sensors'][sensor_key] = {}
-
-                    # Guardar la data de calibració
-                    import datetime
-                    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M")
-                    self.config['sensors'][sensor_key]['calibration'] = now
-                    self.config_manager.update_section(
-                        'sensors', self.config['sensors'])
+                    # Guardar la data de calibració a la configuració
+                    now = datetime.now().strftime("%Y-%m-%d %H:%M")
+                    # (només l'entrada d'aquest sensor, no tota la secció)
+                    sensor_config = _dict_entry(
+                        _dict_entry(self.config, 'sensors'), sensor_key)
+                    sensor_config['calibration'] = now
+                    self.config_manager.update_config(
+                        'sensors', sensor_key, sensor_config)
 
                     # Actualitzar etiqueta
                     if hasattr(self, f"calib_{sensor_key}_label"):
@@ -1590,15 +1674,8 @@ class MainWindow(QMainWindow):
     def _edit_sensor_threshold(self, sensor_key, sensor_name="", unit=""):
         """Edita el llindar d'alerta per a un sensor específic."""
         # Obtenir valor actual
-        sensors_config = self.config.get('sensors', {})
-        if not isinstance(sensors_config, dict):
-            sensors_config = {}
-
-        sensor_config = sensors_config.get(sensor_key, {})
-        if not isinstance(sensor_config, dict):
-            sensor_config = {}
-
-        current_value = sensor_config.get('threshold', 0)
+        current_value = _dict_get(
+            _dict_get(self.config, 'sensors'), sensor_key).get('threshold', 0)
 
         # Mostrar diàleg d'edició
         new_value, ok = QInputDialog.getDouble(
@@ -1612,17 +1689,11 @@ class MainWindow(QMainWindow):
         )
 
         if ok:
-            # Actualitzar valor al ConfigManager
-            if not isinstance(self.config.get('sensors', {}), dict):
-                self.config['sensors'] = {}
-            if not isinstance(
-    self.config['sensors'].get(
-        sensor_key, {}), dict):
-                self.config['sensors'][sensor_key] = {}
-
-            self.config['sensors'][sensor_key]['threshold'] = new_value
-            self.config_manager.update_section(
-                'sensors', self.config['sensors'])
+            # Actualitzar només l'entrada d'aquest sensor al ConfigManager
+            sensor_config = _dict_entry(
+                _dict_entry(self.config, 'sensors'), sensor_key)
+            sensor_config['threshold'] = new_value
+            self.config_manager.update_config('sensors', sensor_key, sensor_config)
 
             # Actualitzar etiqueta
             if sensor_key in self.threshold_widgets:
@@ -1712,14 +1783,10 @@ class MainWindow(QMainWindow):
         """Mostra el manual d'usuari."""
         try:
             # Comprovar si existeix el manual
-            manual_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                       "../docs/manual.pdf")
+            manual_path = str(_MANUAL_PATH)
 
-            if os.path.exists(manual_path):
+            if _MANUAL_PATH.exists():
                 # Obrir el manual amb l'aplicació predeterminada
-                import subprocess
-                import platform
-
                 if platform.system() == 'Windows':
                     os.startfile(manual_path)
                 elif platform.system() == 'Darwin':  # macOS
@@ -1747,7 +1814,6 @@ class MainWindow(QMainWindow):
             if not isinstance(current_config, dict):
                 current_config = {}
 
-            from ui.connection_config_dialog import ConnectionConfigDialog
             dialog = ConnectionConfigDialog(current_config, self)
 
             if dialog.exec_() == QDialog.Accepted:
@@ -1918,8 +1984,8 @@ class MainWindow(QMainWindow):
         """Genera un informe segons els paràmetres seleccionats."""
         try:
             # Obtenir dates seleccionades
-            start_date = self.start_date.selectedDate().toString("yyyy-MM-dd")
-            end_date = self.end_date.selectedDate().toString("yyyy-MM-dd")
+            start_date = self.start_date.date().toString("yyyy-MM-dd")
+            end_date = self.end_date.date().toString("yyyy-MM-dd")
 
             # Obtenir tipus d'informe
             report_type = self.report_type_combo.currentText()
@@ -2043,13 +2109,16 @@ class MainWindow(QMainWindow):
                 # Aquí s'utilitzaria una biblioteca com csv o pandas
                 # per generar un CSV amb les dades
                 try:
-                    # Simulem la creació d'un CSV
-                    with open(filepath, 'w') as f:
-                        f.write("Mètrica,Valor\n")
-                        f.write("Temps total d'operació,23.5 hores\n")
-                        f.write("Distància recorreguda,1.2 km\n")
-                        f.write("Nombre d'alertes,12\n")
-                        f.write("Nivell mitjà de bateria,78%\n")
+                    # Simulem la creació d'un CSV (totes les files d'un cop)
+                    rows = (
+                        ("Mètrica", "Valor"),
+                        ("Temps total d'operació", "23.5 hores"),
+                        ("Distància recorreguda", "1.2 km"),
+                        ("Nombre d'alertes", "12"),
+                        ("Nivell mitjà de bateria", "78%"),
+                    )
+                    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                        csv.writer(f).writerows(rows)
 
                     QMessageBox.information(
                         self,
@@ -2067,8 +2136,7 @@ class MainWindow(QMainWindow):
     def _update_ui_state(self):
         """Actualitza l'estat de la interfície segons l'estat actual del sistema."""
         # Actualitzar estat de connexió
-        is_connected = hasattr(self.connection_manager,
-                               'connected') and self.connection_manager.connected
+        is_connected = self._is_connected()
         self.connection_status_label.setText(
             f"Estat: {'Connectat' if is_connected else 'Desconnectat'}")
         self.connect_button.setText(
@@ -2087,18 +2155,19 @@ class MainWindow(QMainWindow):
         self.start_stream_btn.setEnabled(is_connected)
         self.stop_stream_btn.setEnabled(False)  # Inicialment desactivat
         self.snapshot_btn.setEnabled(
-            is_connected and hasattr(
-                self.camera_manager,
-                'get_current_frame') and self.camera_manager.get_current_frame() is not None)
+            is_connected and self._cam_get_frame is not None
+            and self._cam_get_frame() is not None)
+        self._camera_streaming_ui = False
 
-        # Actualitzar visualització de configuració
-        connection_config = self.config.get('connection', {})
-        self.config_host_input.setText(
-            connection_config.get(
-                'host', '192.168.1.100'))
+        # Actualitzar visualització de configuració (si ja s'ha construït)
+        if hasattr(self, 'config_host_input'):
+            connection_config = self.config.get('connection', {})
+            self.config_host_input.setText(
+                connection_config.get(
+                    'host', '192.168.1.100'))
 
-        self.config_port_input.setText(
-            str(connection_config.get('port', 9999)))
+            self.config_port_input.setText(
+                str(connection_config.get('port', 9999)))
 
         # Actualitzar llindars de sensors
         for sensor_type, properties in self.sensor_manager.SENSOR_TYPES.items():
@@ -2106,28 +2175,39 @@ class MainWindow(QMainWindow):
                 self.threshold_widgets[sensor_type].setText(
                     f"{properties['threshold']} {properties['unit']}")
 
+    def _is_connected(self):
+        """
+        Indica si hi ha connexió amb el robot.
+
+        L'atribut 'connected' pot no existir fins al primer canvi d'estat
+        (vegeu update_connection_status), per això no es guarda a la memòria cau.
+        """
+        return bool(getattr(self.connection_manager, 'connected', False))
+
     def _periodic_update(self):
         """Realitza actualitzacions periòdiques de la interfície."""
         # Actualitzar estat de connexió
-        is_connected = hasattr(self.connection_manager,
-                               'connected') and self.connection_manager.connected
+        is_connected = self._is_connected()
         self.connection_status_label.setText(
             f"Estat: {'Connectat' if is_connected else 'Desconnectat'}")
 
         # Actualitzar dades de sensors
         if is_connected:
             # Simular una actualització dels sensors
-            if hasattr(self.sensor_manager, 'request_update'):
-                self.sensor_manager.request_update()
+            if self._request_sensor_update is not None:
+                self._request_sensor_update()
+
+    def _update_camera_info(self):
+        """Actualitza la informació de la pestanya de càmera."""
+        is_connected = self._is_connected()
 
         # Actualitzar FPS de càmera
-        if hasattr(self.camera_manager, 'get_fps'):
-            fps = self.camera_manager.get_fps()
-            self.fps_label.setText(str(fps))
+        if self._cam_get_fps is not None:
+            self.fps_label.setText(str(self._cam_get_fps()))
 
         # Comprovar si cal activar el botó de snapshot
-        if hasattr(self.camera_manager, 'get_current_frame'):
-            has_frame = self.camera_manager.get_current_frame() is not None
+        if self._cam_get_frame is not None:
+            has_frame = self._cam_get_frame() is not None
             self.snapshot_btn.setEnabled(is_connected and has_frame)
 
     def _connect_signals(self):
@@ -2199,62 +2279,101 @@ class MainWindow(QMainWindow):
             distance (float): Distància a l'obstacle (mm)
         """
         # Convertir angle a graus per mostrar-lo
-        angle_degrees = round(angle * 180 / 3.14159, 1)
+        angle_degrees = angle * _RAD2DEG
         
         # Convertir distància a metres per mostrar-la
-        distance_meters = round(distance / 1000, 2)
+        distance_meters = distance * _MM2M
         
         # Determinar la posició aproximada
-        position = "davant"
-        if angle > 0.5:
-            position = "esquerra"
-        elif angle < -0.5:
-            position = "dreta"
+        position = _POSITIONS[(angle > 0.5) + 2 * (angle < -0.5)]
         
         # Mostrar l'alerta a la interfície
-        self.alerts_label.setText(f"ALERTA: Obstacle detectat a {position} ({distance_meters} m)")
+        self.alerts_label.setText(f"ALERTA: Obstacle detectat a {position} ({distance_meters:.2f} m)")
         self.alerts_label.setStyleSheet("color: red; font-weight: bold;")
         
         # Actualitzar les etiquetes de distància i direcció si existeixen
-        if hasattr(self, 'min_distance_label'):
-            self.min_distance_label.setText(f"{distance_meters} m")
+        if self._has_min_dist:
+            self.min_distance_label.setText(f"{distance_meters:.2f} m")
         
-        if hasattr(self, 'direction_label'):
-            self.direction_label.setText(f"{angle_degrees}°")
+        if self._has_dir:
+            self.direction_label.setText(f"{angle_degrees:.1f}°")
         
         # Registrar a log
-        logger.warning(f"Obstacle detectat: angle={angle_degrees}°, distància={distance_meters}m, posició={position}")
+        logger.warning("Obstacle detectat: angle=%.1f°, distància=%.2fm, posició=%s",
+                       angle_degrees, distance_meters, position)
 
     def update_lidar_view(self, lidar_data):
         """
         Actualitza la visualització del LiDAR amb noves dades.
 
         Args:
-            lidar_data: Objecte LidarData amb les dades del LiDAR
+            lidar_data (LidarScan): Escaneig immutable emès pel LidarManager
         """
-        # Guardar les dades més recents
+        # Guardar les dades més recents i programar un únic renderitzat; les
+        # lectures que arribin abans que venci el timer el reaprofiten
         self.last_lidar_data = lidar_data
+        if not self._lidar_timer.isActive():
+            self._lidar_timer.start()
+
+    def _set_status(self, message):
+        """
+        Programa un missatge a la barra d'estat.
+
+        Els missatges que arriben dins del mateix interval de 16 ms es
+        substitueixen entre ells i només es mostra l'últim.
+
+        Args:
+            message (str): Missatge a mostrar
+        """
+        self._pending_status = message
+        if not self._status_flush_timer.isActive():
+            self._status_flush_timer.start()
+
+    def _flush_status(self):
+        """Mostra el missatge pendent de la barra d'estat."""
+        if self._pending_status is not None:
+            self.statusBar.showMessage(self._pending_status)
+            self._pending_status = None
+
+    def _render_last_lidar(self):
+        """Renderitza l'última lectura del LiDAR rebuda."""
+        lidar_data = self.last_lidar_data
+        if lidar_data is None:
+            return
         
-        # Comprovar que tenim matplotlib disponible
-        if not HAS_MATPLOTLIB:
+        # No renderitzar si la vista està amagada (es reprodueix en tornar-hi)
+        if not self.lidar_view_stack.isVisibleTo(self.window()):
             return
         
         # Obtenir les dades
         current_view = self.lidar_view_stack.currentIndex()
         
+        # Res a fer si aquest escaneig ja s'ha dibuixat en aquesta vista
+        drawn_key = (lidar_data.scan_id, current_view)
+        if drawn_key == self._last_drawn_lidar:
+            return
+        self._last_drawn_lidar = drawn_key
+        
         try:
+            # Angles i distàncies de l'escaneig (LidarScan immutable)
+            angles, distances = lidar_data.angles, lidar_data.distances
+            min_angle, min_distance = min_dir(angles, distances)
+            nearest = (min_angle, min_distance)
+            max_range = lidar_data.max_range
+            
             if current_view == 0:  # Vista cartesiana
-                self._update_cartesian_view(lidar_data)
+                canvases = (self.cartesian_canvas,)
             elif current_view == 1:  # Vista polar
-                self._update_polar_view(lidar_data)
+                canvases = (self.polar_canvas,)
             else:  # Vista combinada
-                self._update_combined_view(lidar_data)
+                canvases = (self.combined_cartesian_canvas, self.combined_polar_canvas)
+            for canvas in canvases:
+                canvas.set_scan(angles, distances, nearest, max_range)
             
             # Actualitzar informació de distància mínima
-            min_angle, min_distance = lidar_data.get_nearest_obstacle()
             if min_angle is not None and min_distance is not None:
-                self.min_distance_label.setText(f"{min_distance/1000:.2f} m")
-                self.direction_label.setText(f"{min_angle*180/3.14159:.1f}°")
+                self.min_distance_label.setText(f"{min_distance * _MM2M:.2f} m")
+                self.direction_label.setText(f"{min_angle * _RAD2DEG:.1f}°")
         
         except Exception as e:
             logger.error(f"Error actualitzant visualització del LiDAR: {e}")
@@ -2264,42 +2383,26 @@ class MainWindow(QMainWindow):
         Actualitza la visualització de la càmera amb un nou fotograma.
         
         Args:
-            frame (QImage): Imatge rebuda de la càmera
+            frame (QImage | np.ndarray): Imatge rebuda de la càmera (RGB)
         """
         if frame is None:
             return
             
         try:
-            # Convertir a QPixmap
-            pixmap = QPixmap.fromImage(frame)
-            
-            # Ajustar al tamany del label mantenint la proporció
-            if hasattr(self, 'camera_label'):
-                pixmap = pixmap.scaled(
-                    self.camera_label.size(),
-                    Qt.KeepAspectRatio,
-                    Qt.SmoothTransformation
-                )
-                
-                # Mostrar el frame
-                self.camera_label.setPixmap(pixmap)
-                
-            # Actualitzar FPS i estat si correspon
-            if hasattr(self.camera_manager, 'get_fps'):
-                fps = self.camera_manager.get_fps()
-                if hasattr(self, 'fps_label'):
-                    self.fps_label.setText(str(fps))
-                    
-            # Actualitzar estat de streaming
-            if hasattr(self, 'camera_status_label'):
+            # Mostrar el frame (l'escalat es fa en pintar, sense QPixmap intermedi)
+            self.camera_label.set_frame(frame)
+
+            # Actualitzar FPS si correspon
+            if self._cam_get_fps is not None:
+                self.fps_label.setText(str(self._cam_get_fps()))
+
+            # Estat de streaming i botons: només cal fixar-los amb la primera
+            # trama després de qualsevol canvi d'estat
+            if not self._camera_streaming_ui:
+                self._camera_streaming_ui = True
                 self.camera_status_label.setText("Streaming actiu")
-                
-            # Activar/desactivar botons
-            if hasattr(self, 'start_stream_btn'):
                 self.start_stream_btn.setEnabled(False)
-            if hasattr(self, 'stop_stream_btn'):
                 self.stop_stream_btn.setEnabled(True)
-            if hasattr(self, 'snapshot_btn'):
                 self.snapshot_btn.setEnabled(True)
                 
         except Exception as e:
@@ -2315,6 +2418,7 @@ class MainWindow(QMainWindow):
         """
         try:
             # Actualitzar etiqueta d'estat
+            self._camera_streaming_ui = False
             if hasattr(self, 'camera_status_label'):
                 self.camera_status_label.setText(message)
             
@@ -2326,7 +2430,7 @@ class MainWindow(QMainWindow):
                 self.stop_stream_btn.setEnabled(is_active)
             
             # Actualitzar barra d'estat amb informació de la càmera
-            self.statusBar.showMessage(f"Càmera: {message}")
+            self._set_status(f"Càmera: {message}")
             
             # Registrar l'estat
             if is_active:
@@ -2377,7 +2481,7 @@ class MainWindow(QMainWindow):
             moving_status = "en moviment" if state_info.get('is_moving', False) else "aturat"
             direction = state_info.get('direction', 'stop')
             
-            self.statusBar.showMessage(f"Navegació: Mode {mode}, {moving_status}, direcció {direction}")
+            self._set_status(f"Navegació: Mode {mode}, {moving_status}, direcció {direction}")
             
             # Registrar canvi d'estat
             logger.info(f"Estat navegació actualitzat: mode={mode}, {state_info}")
@@ -2397,10 +2501,10 @@ class MainWindow(QMainWindow):
         """
         try:
             # Convertir distància a metres per mostrar-la
-            distance_meters = round(distance / 1000, 2)
+            distance_meters = round(distance * _MM2M, 2)
             
             # Convertir angle a graus
-            angle_degrees = round(angle * 180 / 3.14159, 1)
+            angle_degrees = round(angle * _RAD2DEG, 1)
             
             # Missatge d'alerta
             alert_message = f"ALERTA DE NAVEGACIÓ: Obstacle a {direction} ({distance_meters}m, {angle_degrees}°)"
@@ -2411,7 +2515,7 @@ class MainWindow(QMainWindow):
                 self.alerts_label.setStyleSheet("color: red; font-weight: bold;")
             
             # Actualitzar barra d'estat
-            self.statusBar.showMessage(alert_message)
+            self._set_status(alert_message)
             
             # Registrar alerta
             logger.warning(f"Alerta navegació: {alert_message}")
@@ -2426,6 +2530,11 @@ class MainWindow(QMainWindow):
         Args:
             config (dict): La configuració actualitzada
         """
+        # Pestanya encara no construïda: aplicar-ho quan es construeixi
+        if not hasattr(self, 'config_host_input'):
+            self._pending_config_view = config
+            return
+
         try:
             # Actualitzar visualització de config de connexió
             connection_config = config.get('connection', {})
@@ -2474,7 +2583,7 @@ class MainWindow(QMainWindow):
         self._update_ui_state()
 
         # Actualitzar barra d'estat
-        self.statusBar.showMessage(f"Connexió: {message}")
+        self._set_status(f"Connexió: {message}")
       
 
     @pyqtSlot(str, float)
@@ -2486,15 +2595,18 @@ class MainWindow(QMainWindow):
                 f"{value:.1f} {properties.get('unit', '')}"
             )
 
-    @pyqtSlot(dict)
+    @pyqtSlot(object)
     def update_all_sensors_data(self, sensor_data):
         """Actualitza les dades de tots els sensors."""
-        for sensor_type, value in sensor_data.items():
-            if sensor_type in self.sensor_data_labels:
-                properties = self.sensor_manager.SENSOR_TYPES.get(sensor_type, {})
-                self.sensor_data_labels[sensor_type].setText(
-                    f"{value:.1f} {properties.get('unit', '')}"
-                )
+        self._last_sensor_data = sensor_data
+        get_value = sensor_data.get
+        for sensor_type, data_label, unit in self._sensor_iter:
+            value = get_value(sensor_type)
+            if value is not None:
+                data_label.setText(f"{value:.1f} {unit}")
+
+        if self._hist_buf is not None:
+            self._push_sensor_history(sensor_data)
 
     @pyqtSlot(str, str)
     def show_sensor_alert(self, sensor_type, message):
@@ -2513,30 +2625,15 @@ class MainWindow(QMainWindow):
     @pyqtSlot(str, float)
     def update_detection_list(self, object_type, confidence):
         """Actualitza la llista d'objectes detectats."""
-        row_count = self.detections_list.rowCount()
-        self.detections_list.insertRow(row_count)
-    
-        # Afegir tipus d'objecte
-        self.detections_list.setItem(row_count, 0, QTableWidgetItem(object_type))
-    
-        # Afegir confiança
-        self.detections_list.setItem(row_count, 1, 
-                                QTableWidgetItem(f"{confidence:.2f}"))
-    
-        # Posició (simulada per ara)
-        self.detections_list.setItem(row_count, 2, 
-                                QTableWidgetItem("Centre"))
-    
-        # Limitar a 10 files màxim
-        if self.detections_list.rowCount() > 10:
-            self.detections_list.removeRow(0)
+        # Posició simulada per ara; el model limita la llista a 10 files
+        self.detections_model.add_detection(object_type, confidence, "Centre")
 
     @pyqtSlot(bool, str)
     def update_ai_status(self, is_active, message):
         """Actualitza l'estat de la IA."""
         # Implementació bàsica
         self.ai_enabled_checkbox.setChecked(is_active)
-        self.statusBar.showMessage(f"IA: {message}")
+        self._set_status(f"IA: {message}")
 
     def closeEvent(self, event):
         """S'executa quan es tanca la finestra principal."""
@@ -2546,6 +2643,13 @@ class MainWindow(QMainWindow):
                     self,
                     'update_timer') and self.update_timer.isActive():
                 self.update_timer.stop()
+            self._camera_timer.stop()
+            self._lidar_timer.stop()
+            self._status_flush_timer.stop()
+            self._speed_timer.stop()
+
+            # Esperar que acabin de desar-se les captures pendents
+            QThreadPool.globalInstance().waitForDone(1000)
 
             # Netejar recursos de la connexió
             if hasattr(self, 'connection_manager'):